@@ -0,0 +1,4 @@
+"""Benchmarks for the resume render pipeline; run the modules from the repository root, e.g.
+
+    python -m benchmarks.bench_render
+"""
@@ -0,0 +1,74 @@
+"""Helpers shared by the benchmark scripts: scenario data, builders, timing and the command line.
+
+The scripts put the repository root on sys.path before importing this module,
+so they run both as `python -m benchmarks.<name>` and as `python benchmarks/<name>.py`.
+"""
+import argparse
+import json
+import time
+import timeit
+
+from resume_builder import create_sample_resume
+
+
+def scaled_resume_data(scale):
+    """Sample resume data with experiences and projects repeated scale times"""
+    base = create_sample_resume().resume_data.to_dict()
+    data = json.loads(json.dumps(base))
+    data['experience'] = []
+    data['projects'] = []
+    for i in range(scale):
+        for exp in base['experience']:
+            exp = dict(exp, company=f"{exp['company']} #{i + 1}")
+            exp['responsibilities'] = [f"{text} [{i + 1}]" for text in exp['responsibilities']]
+            data['experience'].append(exp)
+        for project in base['projects']:
+            project = dict(project, subtitle=f"{project['subtitle']} #{i + 1}")
+            project['description'] = [f"{text} [{i + 1}]" for text in project['description']]
+            data['projects'].append(project)
+    return data
+
+
+def quiet_builder(cls, data=None, **options):
+    """A builder of cls that prints nothing, loaded with data when given"""
+    builder = cls(**options)
+    builder.verbose = False
+    if data is not None:
+        builder.resume_data = data
+    return builder
+
+
+def timed(func, *args):
+    """(func(*args), seconds the call took)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def best_of(run, repeat):
+    """The fastest of repeat calls to run(), which returns seconds or a tuple of seconds (compared by sum)"""
+    best = None
+    for _ in range(repeat):
+        seconds = run()
+        if best is None or _total(seconds) < _total(best):
+            best = seconds
+    return best
+
+
+def _total(seconds):
+    return sum(seconds) if isinstance(seconds, tuple) else seconds
+
+
+def seconds_per_call(func, number, repeat=5):
+    """Best seconds per call of func() over repeat rounds of number calls"""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def bench_parser(description, repeat=None, scales=None):
+    """ArgumentParser with the --repeat and --scales options a benchmark asks for by giving their defaults"""
+    parser = argparse.ArgumentParser(description=description)
+    if scales is not None:
+        parser.add_argument('--scales', type=int, nargs='+', default=list(scales), help="Content multipliers")
+    if repeat is not None:
+        parser.add_argument('--repeat', type=int, default=repeat, help="Runs per case; the fastest is reported")
+    return parser
@@ -0,0 +1,55 @@
+"""Benchmark: platypus (doc.build) vs the direct-canvas render engine.
+
+Both engines lay out the same story into the same pages (see resume_canvas).
+Each case renders a batch of resumes end to end (story plus layout, no PDF
+cache) the way a batch worker does, with one builder per engine, so the second
+pass over the batch reuses cached flowables and string widths as a long-running
+worker would.
+
+Run from the repository root:
+    python -m benchmarks.bench_engines [--count 50] [--repeat 3] [--seed 7]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks._common import bench_parser, best_of, quiet_builder, scaled_resume_data, timed
+from resume_builder import ResumeBuilder, CompactResumeBuilder
+from resume_synth import generate_resumes
+
+
+def time_batch(cls, engine, resumes, repeat):
+    """Best seconds per resume for rendering the whole batch with one builder"""
+    builder = quiet_builder(cls, engine=engine)
+
+    def render_batch():
+        for data in resumes:
+            builder.resume_data = data
+            builder.render_to_bytes()
+
+    return best_of(lambda: timed(render_batch)[1] / len(resumes), repeat)
+
+
+def main(argv=None):
+    parser = bench_parser("Benchmark the platypus and canvas render engines", repeat=3)
+    parser.add_argument('--count', type=int, default=50, help="Synthetic resumes per batch")
+    parser.add_argument('--seed', type=int, default=7, help="Seed for the synthetic resumes")
+    args = parser.parse_args(argv)
+
+    cases = (
+        ('sample', [scaled_resume_data(1)] * args.count),
+        ('synthetic', list(generate_resumes(args.count, seed=args.seed))),
+        ('sample x10', [scaled_resume_data(10)] * max(1, args.count // 10)),
+    )
+    print(f"{'builder':<10} {'batch':<11} {'platypus ms':>12} {'canvas ms':>10} {'speedup':>8}")
+    for label, cls in (('standard', ResumeBuilder), ('compact', CompactResumeBuilder)):
+        for name, resumes in cases:
+            platypus = time_batch(cls, 'platypus', resumes, args.repeat)
+            direct = time_batch(cls, 'canvas', resumes, args.repeat)
+            print(f"{label:<10} {name:<11} {platypus * 1e3:>12.2f} {direct * 1e3:>10.2f} "
+                  f"{platypus / direct:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark: section rules and job header rows as Tables vs lightweight flowables.
+
+The Table* builders reproduce the old code, which laid out a Table for every
+section rule and every job header row. Both variants produce the same pages;
+the benchmark times story construction plus doc.build on resumes scaled from
+the sample (see _common.scaled_resume_data), where the number of job
+entries grows with the scale.
+
+Run from the repository root:
+    python -m benchmarks.bench_flowables [--scales 1 10 50] [--repeat 5]
+"""
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.platypus import Spacer, Table, TableStyle
+
+from benchmarks._common import bench_parser, best_of, quiet_builder, scaled_resume_data, timed
+from resume_builder import ResumeBuilder, CompactResumeBuilder
+from resume_markup import escape, paragraph
+
+
+class TableResumeBuilder(ResumeBuilder):
+    """The old behaviour: the rule and job header rows are Tables"""
+
+    def _section_title_flowables(self, title):
+        section_para = paragraph(f"<b>{escape(title)}</b>", self.styles['SectionHeader'])
+        line_table = Table([[''], ['']], colWidths=[7.5*inch], rowHeights=[1, 1])
+        line_table.setStyle(TableStyle([
+            ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        return [section_para, line_table, Spacer(1, 2)]
+
+    def _experience_flowables(self, exp):
+        entry = super()._experience_flowables(exp)
+        entry[0] = _job_table(self, exp, self._font('Helvetica-Bold'))
+        return entry
+
+
+class TableCompactResumeBuilder(CompactResumeBuilder):
+    """The old behaviour of the compact builder"""
+
+    def _section_title_flowables(self, title):
+        title_size = self.styles['SectionHeader'].fontSize
+        section_table = Table([[title], ['']], colWidths=[7.5*inch], rowHeights=[title_size * 1.2, 1])
+        section_table.setStyle(TableStyle([
+            ('FONTNAME', (0, 0), (0, 0), self._font('Times-Bold')),
+            ('FONTSIZE', (0, 0), (0, 0), title_size),
+            ('VALIGN', (0, 0), (0, 0), 'BOTTOM'),
+            ('LINEBELOW', (0, 1), (-1, 1), 1, colors.black),
+            ('VALIGN', (0, 1), (0, 1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+        ]))
+        return [section_table, Spacer(1, 3)]
+
+    def _experience_flowables(self, exp):
+        entry = super()._experience_flowables(exp)
+        entry[0] = _job_table(self, exp, self._font('Times-Bold'))
+        return entry
+
+
+def _job_table(builder, exp, title_font):
+    job_table = Table([[
+        f"{exp['job_title']} | {exp['company']} | {exp['location']}",
+        f"({exp['start_date']} - {exp['end_date']})"
+    ]], colWidths=[5.5*inch, 2*inch])
+    job_table.setStyle(TableStyle([
+        ('FONTSIZE', (0, 0), (-1, -1), builder.styles['JobTitle'].fontSize),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+        ('FONTNAME', (0, 0), (0, 0), title_font),
+        ('FONTNAME', (1, 0), (1, 0), builder._font('Helvetica')),
+    ]))
+    return job_table
+
+
+def time_render(cls, data, repeat):
+    """Best (story, doc.build) seconds for an uncached render of data"""
+    builder = quiet_builder(cls, data)
+
+    def render():
+        builder._flowable_cache.clear()
+        story, story_seconds = timed(builder._build_story)
+        doc = builder._make_doc(io.BytesIO())
+        return story_seconds, timed(doc.build, story)[1]
+
+    return best_of(render, repeat)
+
+
+def main(argv=None):
+    parser = bench_parser("Benchmark Table vs flowable section rules and job rows", repeat=5, scales=(1, 10, 50))
+    args = parser.parse_args(argv)
+
+    print(f"{'builder':<10} {'scale':>5} {'jobs':>5} {'tables ms':>10} {'flowables ms':>13} {'saved':>7}")
+    for label, old, new in (('standard', TableResumeBuilder, ResumeBuilder),
+                            ('compact', TableCompactResumeBuilder, CompactResumeBuilder)):
+        for scale in args.scales:
+            data = scaled_resume_data(scale)
+            before = sum(time_render(old, data, args.repeat))
+            after = sum(time_render(new, data, args.repeat))
+            print(f"{label:<10} {scale:>5} {len(data['experience']):>5} {before * 1e3:>10.2f} "
+                  f"{after * 1e3:>13.2f} {1 - after / before:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Memory benchmark: resume data held as nested dicts vs resume_model records.
+
+Builds a synthetic corpus by varying the sample resume, then measures the memory
+retained by the parsed corpus with tracemalloc. Each resume is parsed from its
+own JSON text, so strings are not shared between resumes in either layout.
+
+Run from the repository root:
+    python benchmarks/bench_model.py [count]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks._common import bench_parser, timed
+from resume_builder import create_sample_resume
+from resume_model import Resume
+
+
+def synthetic_corpus(count):
+    """Yield JSON texts of count distinct resumes derived from the sample"""
+    base = create_sample_resume().resume_data.to_dict()
+    for i in range(count):
+        data = json.loads(json.dumps(base))
+        data['personal_info']['name'] = f"{data['personal_info']['name']} {i}"
+        for exp in data['experience']:
+            exp['responsibilities'] = [f"{text} ({i})" for text in exp['responsibilities']]
+        yield json.dumps(data, ensure_ascii=False)
+
+
+def retained_bytes(texts, load):
+    """Memory still allocated after loading every text with load()"""
+    gc.collect()
+    tracemalloc.start()
+    corpus, seconds = timed(lambda: [load(text) for text in texts])
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del corpus
+    return size, seconds
+
+
+def main(argv=None):
+    parser = bench_parser("Compare the memory held by nested dicts and resume_model records")
+    parser.add_argument('count', type=int, nargs='?', default=20000, help="Synthetic resumes in the corpus")
+    count = parser.parse_args(argv).count
+    texts = list(synthetic_corpus(count))
+    print(f"{count} synthetic resumes")
+    dict_bytes, dict_seconds = retained_bytes(texts, json.loads)
+    record_bytes, record_seconds = retained_bytes(texts, lambda text: Resume.from_dict(json.loads(text)))
+    for label, size, seconds in (("nested dicts", dict_bytes, dict_seconds),
+                                 ("slotted records", record_bytes, record_seconds)):
+        print(f"{label:<20} {size / 2**20:8.1f} MiB  {size / count:8.0f} B/resume  {seconds:6.2f}s to load")
+    print(f"records use {100 * (1 - record_bytes / dict_bytes):.1f}% less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Render pipeline benchmark on synthetic resumes scaled from the sample resume.
+
+Each scale multiplies the sample's experiences and projects (and with them the
+bullet points). Entries are made distinct so nothing is shared between them.
+For every scale the benchmark times ResumeBuilder() construction, story
+construction per _create_* section (cold, then warm from the flowable cache),
+doc.build, and save/load of the JSON data. Results are printed as JSON; the
+per_entry figures show whether cost grows linearly with content.
+
+Run from the repository root:
+    python -m benchmarks.bench_render [--scales 1 10 100] [--repeat 3] [-o results.json]
+"""
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks._common import bench_parser, quiet_builder, scaled_resume_data, seconds_per_call, timed
+from resume_builder import ResumeBuilder, RENDERER_VERSION
+
+
+def count_entries(data):
+    """Bullet points plus section entries; the unit the per_entry figures divide by"""
+    bullets = sum(len(exp['responsibilities']) for exp in data['experience'])
+    bullets += sum(len(project['description']) for project in data['projects'])
+    entries = len(data['experience']) + len(data['education']) + len(data['projects']) + len(data['certifications'])
+    return bullets, entries
+
+
+def time_story(builder):
+    """Build the story with ResumeBuilder._build_story; return (story, seconds per section)"""
+    timings = {}
+    story = builder._build_story(timings)
+    return story, timings
+
+
+def bench_scale(scale, repeat):
+    data = scaled_resume_data(scale)
+    bullets, entries = count_entries(data)
+    builder = quiet_builder(ResumeBuilder, data)
+
+    cold = []
+    warm = []
+    build = []
+    pages = size = flowables = 0
+    for _ in range(repeat):
+        builder._flowable_cache.clear()
+        story, sections = time_story(builder)
+        cold.append(sections)
+        # Second pass reuses the flowables cached by the first
+        story, sections = time_story(builder)
+        warm.append(sections)
+
+        buffer = io.BytesIO()
+        doc = builder._make_doc(buffer)
+        flowables = len(story)
+        build.append(timed(doc.build, story)[1])
+        pages = doc.page
+        size = len(buffer.getvalue())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'resume_data.json')
+        save = seconds_per_call(lambda: builder.save_data_to_json(path), 1, repeat)
+        load = seconds_per_call(lambda: builder.load_data_from_json(path), 1, repeat)
+        json_bytes = os.path.getsize(path)
+
+    best_cold = min(cold, key=lambda s: sum(s.values()))
+    best_warm = min(warm, key=lambda s: sum(s.values()))
+    story_cold = sum(best_cold.values())
+    doc_build = min(build)
+    units = bullets + entries
+    return {
+        'scale': scale,
+        'experiences': len(data['experience']),
+        'projects': len(data['projects']),
+        'bullets': bullets,
+        'entries': entries,
+        'flowables': flowables,
+        'pages': pages,
+        'pdf_bytes': size,
+        'json_bytes': json_bytes,
+        'seconds': {
+            'story_cold': round(story_cold, 6),
+            'story_warm': round(sum(best_warm.values()), 6),
+            'doc_build': round(doc_build, 6),
+            'save_json': round(save, 6),
+            'load_json': round(load, 6),
+        },
+        'sections_cold': {name: round(seconds, 6) for name, seconds in best_cold.items()},
+        'per_entry_us': {
+            'story_cold': round(story_cold / units * 1e6, 2),
+            'doc_build': round(doc_build / units * 1e6, 2),
+        },
+    }
+
+
+def bench_construction(number=2000):
+    return round(seconds_per_call(ResumeBuilder, number) * 1e6, 2)
+
+
+def run(scales=(1, 10, 100), repeat=3):
+    """Run every scale and return the results as a JSON-serialisable dict"""
+    results = [bench_scale(scale, repeat) for scale in scales]
+    base = results[0]
+    for result in results:
+        # Cost relative to the smallest scale, divided by the content ratio: 1.0 means linear,
+        # below 1.0 means fixed costs (header, skills, document setup) are being amortised
+        content_ratio = (result['bullets'] + result['entries']) / (base['bullets'] + base['entries'])
+        result['linearity'] = {
+            phase: round(result['seconds'][phase] / base['seconds'][phase] / content_ratio, 3)
+            for phase in ('story_cold', 'doc_build', 'save_json', 'load_json')
+        }
+    return {
+        'benchmark': 'render_pipeline',
+        'renderer_version': RENDERER_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'builder_construction_us': bench_construction(),
+        'scales': results,
+    }
+
+
+def main(argv=None):
+    parser = bench_parser("Benchmark the resume render pipeline", repeat=3, scales=(1, 10, 100))
+    parser.add_argument('-o', '--output', default=None, help="Also write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.scales, args.repeat)
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text + '\n', encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Micro-benchmark: ResumeBuilder construction with per-instance vs shared stylesheets.
+
+Run from the repository root:
+    python benchmarks/bench_styles.py [--number 2000]
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks._common import bench_parser, seconds_per_call
+from resume_builder import ResumeBuilder, CompactResumeBuilder
+from resume_styles import build_stylesheet
+
+
+class PerInstanceResumeBuilder(ResumeBuilder):
+    """The old behaviour: every builder builds its own stylesheet"""
+    def __init__(self, theme=None):
+        super().__init__(theme)
+        self.styles = build_stylesheet(self.theme)
+
+
+def bench(label, factory, number):
+    seconds = seconds_per_call(factory, number)
+    print(f"{label:<40} {seconds * 1e6:10.1f} us/builder")
+    return seconds
+
+
+def main(argv=None):
+    parser = bench_parser("Benchmark builder construction with shared vs per-instance stylesheets")
+    parser.add_argument('--number', type=int, default=2000, help="Builders constructed per round")
+    number = parser.parse_args(argv).number
+    print(f"ResumeBuilder() construction, best of 5 x {number}")
+    before = bench("per-instance stylesheet (standard)", PerInstanceResumeBuilder, number)
+    after = bench("shared registry (standard)", ResumeBuilder, number)
+    bench("per-instance stylesheet (compact)", lambda: PerInstanceResumeBuilder('compact'), number)
+    bench("shared registry (compact)", CompactResumeBuilder, number)
+    print(f"speedup (standard): {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Background autosave of resume data.
+
+AutosaveWriter owns one writer thread. submit() hands it a snapshot of the
+resume (a save_data_to_json dict) and returns at once. The thread serializes the
+latest snapshot, hashes it and writes it only when the hash differs from the
+last content written (or marked with baseline()). Snapshots submitted while a
+write is in progress replace each other, so a burst of submits costs at most
+one more write. Files are written to a temporary file and renamed into place,
+so a crash leaves either the old or the new content, never a torn file.
+
+The GUI decides when to submit (after edits pause, see resume_gui) and reads
+progress from the events queue on its own thread.
+"""
+import hashlib
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+
+
+def serialize(data):
+    """The bytes save_data_to_json writes for data"""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_atomic(path, content):
+    """Write bytes to path through a temporary file and a rename"""
+    path = Path(path)
+    temp = path.with_name(path.name + '.tmp')
+    with open(temp, 'wb') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp, path)
+
+
+class AutosaveWriter:
+    """Writes submitted resume snapshots to path on a background thread, skipping unchanged content"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.saved_hash = None  # digest of the content known to be on disk
+        self.writes = 0
+        self.skipped = 0
+        # ('saved', path) or ('error', exception) per processed snapshot, for the GUI thread
+        self.events = queue.Queue()
+        self._pending = None  # data waiting to be written
+        self._baseline = None  # data waiting to be hashed as already saved; handled before _pending
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='autosave', daemon=True)
+        self._thread.start()
+
+    def submit(self, data):
+        """Save data soon; data must not be modified afterwards"""
+        with self._condition:
+            self._check_open()
+            self._pending = data
+            self._condition.notify_all()
+
+    def baseline(self, data):
+        """Record data as already saved (e.g. just loaded from path) without writing it"""
+        with self._condition:
+            self._check_open()
+            self._baseline = data
+            self._condition.notify_all()
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError("AutosaveWriter is closed")
+
+    def _idle(self):
+        return self._pending is None and self._baseline is None and not self._busy
+
+    @property
+    def idle(self):
+        with self._condition:
+            return self._idle()
+
+    def flush(self, timeout=None):
+        """Wait until every submitted snapshot is processed; returns False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(self._idle, timeout)
+
+    def close(self, timeout=None):
+        """Process what is pending, then stop the thread; returns False on timeout"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: not self._idle() or self._closed)
+                if self._baseline is not None:
+                    data, write, self._baseline = self._baseline, False, None
+                elif self._pending is not None:
+                    data, write, self._pending = self._pending, True, None
+                else:
+                    return
+                self._busy = True
+            try:
+                content = serialize(data)
+                digest = hashlib.blake2b(content, digest_size=16).digest()
+                if not write:
+                    self.saved_hash = digest
+                elif digest == self.saved_hash:
+                    self.skipped += 1
+                else:
+                    write_atomic(self.path, content)
+                    self.saved_hash = digest
+                    self.writes += 1
+                    self.events.put(('saved', self.path))
+            except Exception as e:
+                self.events.put(('error', e))
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
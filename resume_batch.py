@@ -0,0 +1,176 @@
+import itertools
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from resume_builder import builder_for_theme, check_theme
+from resume_cache import PDFCache, DEFAULT_MAX_BYTES
+from resume_corpus import iter_corpus_text
+from resume_fonts import register_family
+
+# Chunks of jobs in flight per worker; bounds how much of a corpus is held in memory at once
+IN_FLIGHT_PER_WORKER = 4
+
+# Warm builder owned by each worker process
+_worker_builder = None
+
+# Instrumentation report of the worker's most recent render (when instrumented)
+_last_report = None
+
+
+def _keep_report(report):
+    global _last_report
+    _last_report = report
+
+
+def init_worker(theme, cache_dir=None, cache_max_bytes=None, instrument=False, font_family=None, font_dir=None,
+                engine=None, locale=None):
+    """Create the per-process builder once so every job reuses its styles (and parsed fonts)"""
+    global _worker_builder
+    if font_family:
+        register_family(font_family, font_dir)
+    cache = None
+    if cache_dir:
+        cache = PDFCache(cache_dir, max_bytes=cache_max_bytes or DEFAULT_MAX_BYTES)
+    _worker_builder = builder_for_theme(theme, cache=cache, instrumentation=_keep_report if instrument else None,
+                                        font_family=font_family, engine=engine, locale=locale)
+    _worker_builder.verbose = False
+
+
+def render_job(job):
+    """Render one job and report its outcome instead of raising"""
+    source, output, text = job
+    start = time.perf_counter()
+    _worker_builder.last_cache_hit = False
+    try:
+        if text is None:
+            with open(source, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        else:
+            data = json.loads(text)
+        _worker_builder.resume_data = data
+        _worker_builder.generate_pdf(output)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {
+        'source': source,
+        'output': output,
+        'ok': error is None,
+        'cached': _worker_builder.last_cache_hit,
+        'seconds': round(time.perf_counter() - start, 6),
+        'error': error
+    }
+
+
+def render_jobs(jobs):
+    """Render a chunk of jobs; one round trip to the worker per chunk"""
+    return [render_job(job) for job in jobs]
+
+
+def render_bytes_job(resume_data):
+    """Render one resume dict on the warm worker builder; returns (pdf_bytes, report or None)"""
+    global _last_report
+    _last_report = None
+    _worker_builder.resume_data = resume_data
+    pdf = _worker_builder.render_to_bytes()
+    return pdf, _last_report
+
+
+def iter_jobs(input_path, output_dir, start=0, limit=None, on_error=None):
+    """Yield (source, output, text) for a directory of *.json files or one JSONL/concatenated-JSON file.
+
+    text is the record's JSON, decoded by the worker; it is None for directory
+    jobs (the worker reads the file itself).
+    """
+    input_path = Path(input_path)
+    output_dir = Path(output_dir)
+    if input_path.is_dir():
+        paths = sorted(input_path.glob('*.json'))
+        stop = None if limit is None else start + limit
+        for path in itertools.islice(paths, start, stop):
+            yield str(path), str(output_dir / f"{path.stem}.pdf"), None
+    else:
+        for line_no, text in iter_corpus_text(input_path, start, limit, on_error):
+            yield (f"{input_path}:{line_no}",
+                   str(output_dir / f"{input_path.stem}-{line_no:06d}.pdf"),
+                   text)
+
+
+def _skipped_result(error):
+    """Batch result entry for a corpus record that could not be decoded"""
+    return {
+        'source': f"{error.path}:{error.line}",
+        'output': None,
+        'ok': False,
+        'cached': False,
+        'seconds': 0.0,
+        'error': f"CorpusError: {error.message} (column {error.column})"
+    }
+
+
+def _map_bounded(pool, jobs, chunksize, window):
+    """Yield render results in job order, with at most window chunks submitted but not collected"""
+    pending = deque()
+    jobs = iter(jobs)
+    while True:
+        chunk = list(itertools.islice(jobs, chunksize))
+        if chunk:
+            pending.append(pool.submit(render_jobs, chunk))
+        if not pending:
+            return
+        if len(pending) >= window or not chunk:
+            yield from pending.popleft().result()
+
+
+def run_batch(input_path, output_dir, workers=None, chunksize=8, theme='standard', summary_path=None,
+              cache_dir=None, cache_max_bytes=None, start=0, limit=None, font_family=None, font_dir=None,
+              engine=None, locale=None):
+    """Render every resume under input_path into output_dir and write a JSON summary"""
+    check_theme(theme)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    corpus_errors = []
+    # Jobs are read lazily as the pool drains, so memory does not grow with the corpus
+    jobs = iter_jobs(input_path, output_dir, start, limit, corpus_errors.append)
+
+    started = time.perf_counter()
+    if workers == 1:
+        init_worker(theme, cache_dir, cache_max_bytes, False, font_family, font_dir, engine, locale)
+        results = [render_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(theme, cache_dir, cache_max_bytes, False, font_family, font_dir, engine, locale)) as pool:
+            results = list(_map_bounded(pool, jobs, max(1, chunksize), workers * IN_FLIGHT_PER_WORKER))
+    wall = time.perf_counter() - started
+    results.extend(_skipped_result(error) for error in corpus_errors)
+
+    succeeded = sum(1 for r in results if r['ok'])
+    summary = {
+        'input': str(input_path),
+        'output_dir': str(output_dir),
+        'workers': workers,
+        'chunksize': chunksize,
+        'total': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'cache_hits': sum(1 for r in results if r['cached']),
+        'wall_seconds': round(wall, 3),
+        'render_seconds': round(sum(r['seconds'] for r in results), 3),
+        'resumes_per_second': round(len(results) / wall, 2) if wall else 0.0,
+        'jobs': results
+    }
+    summary_path = Path(summary_path) if summary_path else output_dir / 'batch_summary.json'
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    for r in results:
+        if not r['ok']:
+            print(f"FAILED {r['source']}: {r['error']}")
+    print(f"Rendered {succeeded}/{len(results)} resumes in {wall:.2f}s "
+          f"with {workers} workers ({summary['resumes_per_second']} resumes/s)")
+    print(f"Summary written to: {summary_path}")
+    return summary
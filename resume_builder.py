@@ -1,16 +1,103 @@
+import hashlib
+import io
 import json
-from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, KeepTogether
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+import os
+import time
+from collections import OrderedDict
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Spacer
 from reportlab.lib.units import inch, cm
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY, TA_RIGHT
-from reportlab.pdfgen import canvas
-from pathlib import Path
+from resume_styles import get_stylesheet
+from resume_fonts import register_family, map_font
+from resume_cache import cache_key
+from resume_markup import escape, escape_attr, paragraph
+from resume_flowables import HorizontalRule, SectionTitleRule, DateRow
+from resume_canvas import CanvasRenderer, Unsupported
+from resume_locales import DEFAULT_LOCALE, LOCALES, get_labels
+from resume_history import RevisionStore, history_path
+from resume_model import Resume, PersonalInfo, Experience, Education, Project, Certification
+
+# Bump whenever a change alters the generated PDF, so cached output is not reused
+RENDERER_VERSION = '3'
+
+# Chunk size used when streaming a rendered PDF to a file-like target
+WRITE_CHUNK_SIZE = 64 * 1024
+
+# Section entries whose flowables are kept for reuse by later renders
+FLOWABLE_CACHE_SIZE = 512
+
+# Layout engines: platypus runs doc.build, canvas draws the story directly (see resume_canvas)
+ENGINES = ('platypus', 'canvas')
+
+# Section entries whose flowables contain locale labels; the others are shared between locales
+LOCALIZED_KINDS = frozenset(('experience', 'education', 'skills', 'certification'))
+
+class RenderCancelled(Exception):
+    """Raised inside a render when its cancel event is set"""
+
+
+class _ResumeDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate that can be cancelled and reports layout progress"""
+    cancel_event = None
+    progress = None
+    _story = None
+    _story_length = 0
+    
+    def build(self, flowables, **kwargs):
+        self._story = flowables
+        self._story_length = len(flowables)
+        return super().build(flowables, **kwargs)
+    
+    def handle_flowable(self, flowables):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise RenderCancelled()
+        super().handle_flowable(flowables)
+        if self.progress is not None and flowables is self._story and self._story_length:
+            # Split flowables are pushed back onto the list, so clamp the estimate
+            self.progress(max(0.0, min(1.0, 1 - len(flowables) / self._story_length)))
+
 
 class ResumeBuilder:
-    def __init__(self):
+    # Name of the page layout this class draws; part of the cache key, since themes only set styles
+    layout = 'standard'
+    theme = 'standard'
+    font_family = None
+    engine = 'platypus'
+    locale = DEFAULT_LOCALE
+    verbose = True
+    
+    def __init__(self, theme=None, cache=None, instrumentation=None, font_family=None, engine=None, locale=None):
+        self.clear_data()
+        self.theme = theme or self.theme
+        self.engine = engine or self.engine
+        # Section titles and labels (see resume_locales)
+        self.set_locale(locale or self.locale)
+        if self.engine not in ENGINES:
+            raise ValueError(f"Unknown render engine '{self.engine}'. Available engines: {', '.join(ENGINES)}")
+        # Optional TTF family (see resume_fonts) replacing the theme's base-14 fonts
+        self.font_family = font_family or self.font_family
+        self._faces = register_family(self.font_family) if self.font_family else None
+        self.scale = 1.0
+        self.styles = get_stylesheet(self.theme, font_family=self.font_family)
+        self.cache = cache  # Optional resume_cache.PDFCache
+        self.instrumentation = instrumentation  # Optional callable receiving a report per render (see resume_metrics)
+        self.last_cache_hit = False
+        self._flowable_cache = OrderedDict()
+        self.render_stats = {'reused': 0, 'built': 0}
+        self._story_keys = set()
+    
+    @property
+    def resume_data(self):
+        """The resume as a resume_model.Resume; it also supports the old dict-style access"""
+        return self._resume
+    
+    @resume_data.setter
+    def resume_data(self, data):
+        # Accepts a Resume or a dict in the save_data_to_json format
+        self._resume = data if isinstance(data, Resume) else Resume.from_dict(data)
+    
+    def clear_data(self):
+        """Reset resume data to an empty resume (styles and render caches are kept)"""
         self.resume_data = {
             'personal_info': {
                 'name': '',
@@ -31,278 +118,256 @@ class ResumeBuilder:
             'projects': [],
             'certifications': []
         }
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom styles matching the LaTeX resume format"""
-        # Name header style
-        self.styles.add(ParagraphStyle(
-            name='NameHeader',
-            parent=self.styles['Heading1'],
-            fontSize=16,
-            spaceAfter=2,
-            alignment=TA_CENTER,
-            textColor=colors.black,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Contact info style
-        self.styles.add(ParagraphStyle(
-            name='ContactInfo',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            alignment=TA_CENTER,
-            spaceAfter=8,
-            fontName='Helvetica'
-        ))
-        
-        # Section header style (like "Berufsprofil", "Berufliche Erfahrung")
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=11,
-            spaceAfter=3,
-            spaceBefore=8,
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Job title and company style
-        self.styles.add(ParagraphStyle(
-            name='JobTitle',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=2,
-            spaceBefore=4,
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Bullet point style
-        self.styles.add(ParagraphStyle(
-            name='BulletPoint',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            spaceAfter=1,
-            leftIndent=15,
-            bulletIndent=8,
-            alignment=TA_JUSTIFY,
-            fontName='Helvetica'
-        ))
-        
-        # Skills category style
-        self.styles.add(ParagraphStyle(
-            name='SkillCategory',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            spaceAfter=1,
-            alignment=TA_LEFT,
-            fontName='Helvetica'
-        ))
-        
-        # Education/Project title style
-        self.styles.add(ParagraphStyle(
-            name='SubsectionTitle',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            spaceAfter=2,
-            spaceBefore=3,
-            alignment=TA_LEFT,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Date/location style
-        self.styles.add(ParagraphStyle(
-            name='DateLocation',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            alignment=TA_RIGHT,
-            fontName='Helvetica'
-        ))
-
+    
     def add_personal_info(self, name, location, email, phone, linkedin=None, github=None):
         """Add personal information"""
-        self.resume_data['personal_info'] = {
-            'name': name,
-            'location': location,
-            'email': email,
-            'phone': phone,
-            'linkedin': linkedin or '',
-            'github': github or ''
-        }
+        self.resume_data.personal_info = PersonalInfo(
+            name=name,
+            location=location,
+            email=email,
+            phone=phone,
+            linkedin=linkedin or '',
+            github=github or ''
+        )
     
     def add_profile_summary(self, summary):
         """Add profile summary (Berufsprofil)"""
-        self.resume_data['profile_summary'] = summary
+        self.resume_data.profile_summary = summary
     
     def add_experience(self, job_title, company, location, start_date, end_date, responsibilities, technologies=None):
         """Add work experience"""
-        experience = {
-            'job_title': job_title,
-            'company': company,
-            'location': location,
-            'start_date': start_date,
-            'end_date': end_date,
-            'responsibilities': responsibilities,  # List of bullet points
-            'technologies': technologies or ''
-        }
-        self.resume_data['experience'].append(experience)
+        experience = Experience(
+            job_title=job_title,
+            company=company,
+            location=location,
+            start_date=start_date,
+            end_date=end_date,
+            responsibilities=responsibilities,  # List of bullet points
+            technologies=technologies or ''
+        )
+        self.resume_data.experience.append(experience)
     
     def add_education(self, institution, location, degree, field, start_date, end_date, focus_areas=None):
         """Add education"""
-        education = {
-            'institution': institution,
-            'location': location,
-            'degree': degree,
-            'field': field,
-            'start_date': start_date,
-            'end_date': end_date,
-            'focus_areas': focus_areas or []
-        }
-        self.resume_data['education'].append(education)
+        education = Education(
+            institution=institution,
+            location=location,
+            degree=degree,
+            field=field,
+            start_date=start_date,
+            end_date=end_date,
+            focus_areas=focus_areas or []
+        )
+        self.resume_data.education.append(education)
     
     def add_skills(self, programming=None, technical=None, software=None):
         """Add technical skills"""
+        skills = self.resume_data.skills
         if programming:
-            self.resume_data['skills']['programming'].extend(programming)
+            skills.programming.extend(programming)
         if technical:
-            self.resume_data['skills']['technical'].extend(technical)
+            skills.technical.extend(technical)
         if software:
-            self.resume_data['skills']['software'].extend(software)
+            skills.software.extend(software)
     
     def add_project(self, title, subtitle, location, date_range, description):
         """Add project"""
-        project = {
-            'title': title,
-            'subtitle': subtitle,
-            'location': location,
-            'date_range': date_range,
-            'description': description
-        }
-        self.resume_data['projects'].append(project)
+        project = Project(
+            title=title,
+            subtitle=subtitle,
+            location=location,
+            date_range=date_range,
+            description=description
+        )
+        self.resume_data.projects.append(project)
     
     def add_certification(self, name, issuer):
         """Add certification"""
-        cert = {
-            'name': name,
-            'issuer': issuer
-        }
-        self.resume_data['certifications'].append(cert)
+        cert = Certification(
+            name=name,
+            issuer=issuer
+        )
+        self.resume_data.certifications.append(cert)
     
-    def _create_header(self, story):
-        """Create the header section with name and contact info"""
+    def set_locale(self, locale):
+        """Switch the section titles and labels to another locale's catalog"""
+        self.labels = get_labels(locale)
+        self.locale = locale
+    
+    def _font(self, name):
+        """Font name to use in table styles for a base-14 font"""
+        return name if self._faces is None else map_font(name, self._faces)
+    
+    def _cached_flowables(self, kind, data, build):
+        """Return the flowables for one section entry, reusing them while the entry and styles are unchanged"""
+        plain = data.to_dict() if hasattr(data, 'to_dict') else data
+        canonical = json.dumps(plain, sort_keys=True, ensure_ascii=False)
+        digest = hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+        locale = self.locale if kind in LOCALIZED_KINDS else None
+        key = (kind, self.theme, self.scale, self.font_family, locale, digest)
+        if key in self._story_keys:
+            # Identical entries within one story must not share flowable objects
+            self.render_stats['built'] += 1
+            return build(data)
+        self._story_keys.add(key)
+        flowables = self._flowable_cache.get(key)
+        if flowables is None:
+            flowables = build(data)
+            self._flowable_cache[key] = flowables
+            if len(self._flowable_cache) > FLOWABLE_CACHE_SIZE:
+                self._flowable_cache.popitem(last=False)
+            self.render_stats['built'] += 1
+        else:
+            self._flowable_cache.move_to_end(key)
+            for flowable in flowables:
+                # Drop layout state left over from the previous build; a stale _postponed
+                # flag would make platypus treat the flowable as too large for any frame
+                for attr in ('_postponed', '_frame', 'canv'):
+                    flowable.__dict__.pop(attr, None)
+            self.render_stats['reused'] += 1
+        return flowables
+    
+    def _header_flowables(self, info):
+        """Flowables for the name and contact line"""
         # Name
-        name_para = Paragraph(self.resume_data['personal_info']['name'], self.styles['NameHeader'])
-        story.append(name_para)
+        name_para = paragraph(escape(info['name']), self.styles['NameHeader'])
         
         # Contact information
         contact_parts = []
-        info = self.resume_data['personal_info']
         
         if info['location']:
-            contact_parts.append(info['location'])
+            contact_parts.append(escape(info['location']))
         if info['email']:
-            contact_parts.append(info['email'])
+            contact_parts.append(escape(info['email']))
         if info['phone']:
-            contact_parts.append(info['phone'])
+            contact_parts.append(escape(info['phone']))
         if info['linkedin']:
-            contact_parts.append(f"LinkedIn: {info['linkedin']}")
+            contact_parts.append(f"LinkedIn: {escape(info['linkedin'])}")
         if info['github']:
-            contact_parts.append(info['github'])
+            contact_parts.append(escape(info['github']))
         
         contact_text = ' | '.join(contact_parts)
-        contact_para = Paragraph(contact_text, self.styles['ContactInfo'])
-        story.append(contact_para)
+        contact_para = paragraph(contact_text, self.styles['ContactInfo'])
+        return [name_para, contact_para]
     
-    def _create_section_with_line(self, story, title):
-        """Create a section header with underline (like in LaTeX version)"""
-        # Create a table with the title and a line
-        section_para = Paragraph(f"<b>{title}</b>", self.styles['SectionHeader'])
-        story.append(section_para)
+    def _create_header(self, story):
+        """Create the header section with name and contact info"""
+        story.extend(self._cached_flowables('header', self.resume_data['personal_info'], self._header_flowables))
+    
+    def _section_title_flowables(self, title):
+        """Flowables for a section title and its rule"""
+        section_para = paragraph(f"<b>{escape(title)}</b>", self.styles['SectionHeader'])
         
         # Add a horizontal line
-        line_table = Table([[''], ['']], colWidths=[7.5*inch], rowHeights=[1, 1])
-        line_table.setStyle(TableStyle([
-            ('LINEBELOW', (0, 0), (-1, 0), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
-        story.append(line_table)
-        story.append(Spacer(1, 2))
+        return [section_para, HorizontalRule(7.5*inch), Spacer(1, 2)]
+    
+    def _create_section_with_line(self, story, title):
+        """Create a section header with underline (like in LaTeX version)"""
+        story.extend(self._cached_flowables('section', title, self._section_title_flowables))
+    
+    def _profile_flowables(self, summary):
+        """Flowables for the profile summary"""
+        return [paragraph(escape(summary), self.styles['Normal']), Spacer(1, 6)]
     
     def _create_profile_section(self, story):
         """Create profile summary section"""
         if not self.resume_data['profile_summary']:
             return
             
-        self._create_section_with_line(story, 'Berufsprofil')
+        self._create_section_with_line(story, self.labels['profile'])
+        story.extend(self._cached_flowables('profile', self.resume_data['profile_summary'], self._profile_flowables))
+    
+    def _experience_flowables(self, exp):
+        """Flowables for one work experience entry"""
+        entry = []
         
-        profile_para = Paragraph(self.resume_data['profile_summary'], self.styles['Normal'])
-        story.append(profile_para)
-        story.append(Spacer(1, 6))
+        # Job title with right-aligned date range
+        entry.append(DateRow(
+            f"{exp['job_title']} | {exp['company']} | {exp['location']}",
+            f"({exp['start_date']} - {exp['end_date']})",
+            5.5*inch, 2*inch,
+            self._font('Helvetica-Bold'),  # Make job title bold
+            self._font('Helvetica'),
+            self.styles['JobTitle'].fontSize,
+        ))
+        entry.append(Spacer(1, 2))
+        
+        # Responsibilities as bullet points
+        for resp in exp['responsibilities']:
+            bullet_para = paragraph(f"• {escape(resp)}", self.styles['BulletPoint'])
+            entry.append(bullet_para)
+        
+        # Technologies if provided
+        if exp['technologies']:
+            tech_para = paragraph(f"<b>{escape(self.labels['technologies'])}</b> {escape(exp['technologies'])}", self.styles['Normal'])
+            entry.append(tech_para)
+        
+        entry.append(Spacer(1, 4))
+        return entry
     
     def _create_experience_section(self, story):
         """Create work experience section"""
         if not self.resume_data['experience']:
             return
             
-        self._create_section_with_line(story, 'Berufliche Erfahrung')
+        self._create_section_with_line(story, self.labels['experience'])
         
         for exp in self.resume_data['experience']:
-            # Job title with date range in a table
-            job_data = [[
-                f"{exp['job_title']} | {exp['company']} | {exp['location']}",
-                f"({exp['start_date']} - {exp['end_date']})"
-            ]]
-            
-            job_table = Table(job_data, colWidths=[5.5*inch, 2*inch])
-            job_table.setStyle(TableStyle([
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),  # Make job title bold
-            ]))
-            story.append(job_table)
-            story.append(Spacer(1, 2))
-            
-            # Responsibilities as bullet points
-            for resp in exp['responsibilities']:
-                bullet_para = Paragraph(f"• {resp}", self.styles['BulletPoint'])
-                story.append(bullet_para)
-            
-            # Technologies if provided
-            if exp['technologies']:
-                tech_para = Paragraph(f"<b>Technologien:</b> {exp['technologies']}", self.styles['Normal'])
-                story.append(tech_para)
-            
-            story.append(Spacer(1, 4))
+            story.extend(self._cached_flowables('experience', exp, self._experience_flowables))
+    
+    def _education_flowables(self, edu):
+        """Flowables for one education entry"""
+        entry = []
+        
+        # Institution and degree
+        edu_title = escape(f"{edu['institution']}, {edu['location']}, {edu['degree']} {self.labels['degree_in']} {edu['field']}")
+        edu_para = paragraph(edu_title, self.styles['JobTitle'])  # Use JobTitle style which is bold
+        entry.append(edu_para)
+        
+        # Focus areas
+        if edu['focus_areas']:
+            focus_text = f"{escape(self.labels['focus_areas'])} {escape(', '.join(edu['focus_areas']))}"
+            focus_para = paragraph(focus_text, self.styles['Normal'])
+            entry.append(focus_para)
+        
+        # Date range
+        date_text = escape(f"({edu['start_date']} – {edu['end_date']})")
+        date_para = paragraph(date_text, self.styles['Normal'])
+        entry.append(date_para)
+        entry.append(Spacer(1, 4))
+        return entry
     
     def _create_education_section(self, story):
         """Create education section"""
         if not self.resume_data['education']:
             return
             
-        self._create_section_with_line(story, 'AUSBILDUNG')
+        self._create_section_with_line(story, self.labels['education'])
         
         for edu in self.resume_data['education']:
-            # Institution and degree
-            edu_title = f"{edu['institution']}, {edu['location']}, {edu['degree']} in {edu['field']}"
-            edu_para = Paragraph(edu_title, self.styles['JobTitle'])  # Use JobTitle style which is bold
-            story.append(edu_para)
-            
-            # Focus areas
-            if edu['focus_areas']:
-                focus_text = f"Schwerpunkt: {', '.join(edu['focus_areas'])}"
-                focus_para = Paragraph(focus_text, self.styles['Normal'])
-                story.append(focus_para)
-            
-            # Date range
-            date_text = f"({edu['start_date']} – {edu['end_date']})"
-            date_para = Paragraph(date_text, self.styles['Normal'])
-            story.append(date_para)
-            story.append(Spacer(1, 4))
+            story.extend(self._cached_flowables('education', edu, self._education_flowables))
+    
+    def _skills_flowables(self, skills):
+        """Flowables for the skill categories"""
+        entry = []
+        
+        if skills['programming']:
+            prog_text = f"• <b>{escape(self.labels['programming'])}</b> {escape(', '.join(skills['programming']))}"
+            prog_para = paragraph(prog_text, self.styles['SkillCategory'])
+            entry.append(prog_para)
+        
+        if skills['technical']:
+            tech_text = f"• <b>{escape(self.labels['technical'])}</b> {escape(', '.join(skills['technical']))}"
+            tech_para = paragraph(tech_text, self.styles['SkillCategory'])
+            entry.append(tech_para)
+        
+        if skills['software']:
+            soft_text = f"• <b>{escape(self.labels['software'])}</b> {escape(', '.join(skills['software']))}"
+            soft_para = paragraph(soft_text, self.styles['SkillCategory'])
+            entry.append(soft_para)
+        
+        entry.append(Spacer(1, 6))
+        return entry
     
     def _create_skills_section(self, story):
         """Create technical skills section"""
@@ -310,104 +375,512 @@ class ResumeBuilder:
         if not any([skills['programming'], skills['technical'], skills['software']]):
             return
             
-        self._create_section_with_line(story, 'Technische Fähigkeiten')
+        self._create_section_with_line(story, self.labels['skills'])
+        story.extend(self._cached_flowables('skills', skills, self._skills_flowables))
+    
+    def _project_flowables(self, project):
+        """Flowables for one project entry"""
+        entry = []
         
-        if skills['programming']:
-            prog_text = f"• <b>Programmiersprachen:</b> {', '.join(skills['programming'])}"
-            prog_para = Paragraph(prog_text, self.styles['SkillCategory'])
-            story.append(prog_para)
+        # Project title
+        title_para = paragraph(escape(f"{project['title'].upper()} | {project['subtitle']}, {project['location']}"), 
+                             self.styles['JobTitle'])  # Use JobTitle style which is bold
+        entry.append(title_para)
         
-        if skills['technical']:
-            tech_text = f"• <b>Technische Fähigkeiten:</b> {', '.join(skills['technical'])}"
-            tech_para = Paragraph(tech_text, self.styles['SkillCategory'])
-            story.append(tech_para)
+        # Date range
+        date_para = paragraph(escape(f"({project['date_range']})"), self.styles['Normal'])
+        entry.append(date_para)
+        entry.append(Spacer(1, 2))
         
-        if skills['software']:
-            soft_text = f"• <b>Software-Entwicklung:</b> {', '.join(skills['software'])}"
-            soft_para = Paragraph(soft_text, self.styles['SkillCategory'])
-            story.append(soft_para)
+        # Description as bullet points
+        for desc in project['description']:
+            bullet_para = paragraph(f"• {escape(desc)}", self.styles['BulletPoint'])
+            entry.append(bullet_para)
         
-        story.append(Spacer(1, 6))
+        entry.append(Spacer(1, 4))
+        return entry
     
     def _create_projects_section(self, story):
         """Create projects section"""
         if not self.resume_data['projects']:
             return
             
-        self._create_section_with_line(story, 'PROJEKT ARBEITEN')
+        self._create_section_with_line(story, self.labels['projects'])
         
         for project in self.resume_data['projects']:
-            # Project title
-            title_para = Paragraph(f"{project['title'].upper()} | {project['subtitle']}, {project['location']}", 
-                                 self.styles['JobTitle'])  # Use JobTitle style which is bold
-            story.append(title_para)
-            
-            # Date range
-            date_para = Paragraph(f"({project['date_range']})", self.styles['Normal'])
-            story.append(date_para)
-            story.append(Spacer(1, 2))
-            
-            # Description as bullet points
-            for desc in project['description']:
-                bullet_para = Paragraph(f"• {desc}", self.styles['BulletPoint'])
-                story.append(bullet_para)
-            
-            story.append(Spacer(1, 4))
+            story.extend(self._cached_flowables('project', project, self._project_flowables))
+    
+    def _certification_flowables(self, cert):
+        """Flowables for one certification"""
+        cert_text = f"• <b>{escape(cert['name'])}</b> - {escape(self.labels['issued_by'])} {escape(cert['issuer'])}"
+        return [paragraph(cert_text, self.styles['SkillCategory'])]
     
     def _create_certifications_section(self, story):
         """Create certifications section"""
         if not self.resume_data['certifications']:
             return
             
-        self._create_section_with_line(story, 'Zertifikate')
+        self._create_section_with_line(story, self.labels['certifications'])
         
         for cert in self.resume_data['certifications']:
-            cert_text = f"• <b>{cert['name']}</b> - Herausgegeben von {cert['issuer']}"
-            cert_para = Paragraph(cert_text, self.styles['SkillCategory'])
-            story.append(cert_para)
+            story.extend(self._cached_flowables('certification', cert, self._certification_flowables))
         
         story.append(Spacer(1, 6))
     
-    def generate_pdf(self, filename="resume.pdf"):
-        """Generate the PDF resume"""
-        doc = SimpleDocTemplate(
-            filename,
+    def cache_key(self):
+        """Key identifying the PDF this builder would produce"""
+        style_id = self.theme if self.scale == 1.0 else f"{self.theme}@{self.scale:g}"
+        # The same theme drawn by another layout is a different PDF
+        if self.layout != self.theme:
+            style_id = f"{self.layout}|{style_id}"
+        if self.font_family:
+            style_id += f"+{self.font_family}"
+        if self.engine != 'platypus':
+            style_id += f"/{self.engine}"
+        if self.locale != DEFAULT_LOCALE:
+            style_id += f":{self.locale}"
+        return cache_key(self.resume_data.to_dict(), style_id, RENDERER_VERSION)
+    
+    def set_scale(self, scale):
+        """Switch to the shared stylesheet with fonts, leading and spacing multiplied by scale"""
+        self.scale = round(scale, 3)
+        self.styles = get_stylesheet(self.theme, self.scale, self.font_family)
+    
+    def measure_pages(self, story=None):
+        """Count the pages the story would fill, using wrap()/split() only (no doc.build)"""
+        doc = self._make_doc(io.BytesIO())
+        # SimpleDocTemplate's frame keeps 6pt padding on every side
+        avail_width = doc.width - 12
+        avail_height = doc.height - 12
+        flowables = list(self._build_story() if story is None else story)
+        
+        pages = 1
+        y = avail_height
+        at_top = True
+        prev_space_after = 0
+        while flowables:
+            flowable = flowables.pop(0)
+            # Frames overlap a flowable's spaceBefore with the previous spaceAfter
+            space = 0 if at_top else max(flowable.getSpaceBefore() - prev_space_after, 0)
+            width, height = flowable.wrap(avail_width, max(y - space, 0))
+            if height + space <= y + 1e-8:
+                prev_space_after = flowable.getSpaceAfter()
+                y -= height + space + prev_space_after
+                at_top = False
+                continue
+            parts = flowable.split(avail_width, y - space) if y - space > 0 else []
+            if len(parts) > 1:
+                flowables[0:0] = parts
+                continue
+            if at_top:
+                # Too tall for an empty page; platypus would raise, count it as a page of its own
+                pages += 1
+                continue
+            flowables.insert(0, flowable)
+            pages += 1
+            y = avail_height
+            at_top = True
+            prev_space_after = 0
+        return pages
+    
+    def fit_to_pages(self, pages=1, min_scale=0.6, max_scale=1.0, tolerance=0.005):
+        """Shrink fonts, leading and spacing just enough for the resume to fit on `pages` pages.
+        
+        Bisects the style scale using measure_pages(), so no full document builds are run.
+        Returns the chosen scale; if even min_scale overflows, min_scale is kept.
+        """
+        self.set_scale(max_scale)
+        if self.measure_pages() <= pages:
+            return self.scale
+        low, high = min_scale, max_scale
+        self.set_scale(low)
+        if self.measure_pages() > pages:
+            return self.scale
+        while high - low > tolerance:
+            mid = (low + high) / 2
+            self.set_scale(mid)
+            if self.measure_pages() <= pages:
+                low = mid
+            else:
+                high = mid
+        self.set_scale(low)
+        return self.scale
+    
+    def _make_doc(self, target, cancel_event=None, progress=None):
+        """Create the document template; target is a path or a writable binary file-like.
+        
+        cancel_event (a threading.Event) aborts the layout with RenderCancelled once set;
+        progress is called with the fraction of the story laid out so far.
+        """
+        doc = _ResumeDocTemplate(
+            target,
             pagesize=A4,
             rightMargin=1*cm,
             leftMargin=1*cm,
             topMargin=1*cm,
             bottomMargin=1*cm
         )
-        
+        doc.cancel_event = cancel_event
+        doc.progress = progress
+        return doc
+    
+    def _build_story(self, timings=None):
+        """Build the list of flowables for every resume section; optionally record seconds per section"""
         story = []
+        self.render_stats = {'reused': 0, 'built': 0}
+        self._story_keys = set()
         
         # Build the resume sections
-        self._create_header(story)
-        self._create_profile_section(story)
-        self._create_experience_section(story)
-        self._create_education_section(story)
-        self._create_skills_section(story)
-        self._create_projects_section(story)
-        self._create_certifications_section(story)
+        steps = (
+            self._create_header,
+            self._create_profile_section,
+            self._create_experience_section,
+            self._create_education_section,
+            self._create_skills_section,
+            self._create_projects_section,
+            self._create_certifications_section,
+        )
+        if timings is None:
+            for step in steps:
+                step(story)
+            return story
+        for step in steps:
+            start = time.perf_counter()
+            step(story)
+            timings[step.__name__[len('_create_'):]] = time.perf_counter() - start
+        return story
+    
+    def _layout(self, story, target, cancel_event=None, progress=None):
+        """Lay the story out into target with the selected engine; returns the page count"""
+        doc = self._make_doc(target, cancel_event, progress)
+        if self.engine == 'canvas':
+            try:
+                return CanvasRenderer.for_doc(doc).render(story, target, cancel_event, progress)
+            except Unsupported:
+                # Raised before anything is written; platypus lays out what the canvas engine cannot
+                pass
+        doc.build(story)
+        return doc.page
+    
+    def _render(self, target, cancel_event=None, progress=None):
+        """Build the story and lay it out into target (a filename or binary buffer)"""
+        if self.instrumentation is None:
+            self._layout(self._build_story(), target, cancel_event, progress)
+            return
+        
+        start = time.perf_counter()
+        sections = {}
+        story = self._build_story(sections)
+        flowables = len(story)
+        build_start = time.perf_counter()
+        pages = self._layout(story, target, cancel_event, progress)
+        end = time.perf_counter()
+        size = target.getbuffer().nbytes if isinstance(target, io.BytesIO) else os.path.getsize(target)
+        self.instrumentation({
+            'cached': False,
+            'sections': sections,
+            'story_seconds': sum(sections.values()),
+            'build_seconds': end - build_start,
+            'total_seconds': end - start,
+            'bytes': size,
+            'pages': pages,
+            'flowables': flowables,
+            'reused': self.render_stats['reused'],
+            'built': self.render_stats['built'],
+        })
+    
+    def _report_cache_hit(self, start, size):
+        if self.instrumentation is not None:
+            self.instrumentation({
+                'cached': True,
+                'sections': {},
+                'story_seconds': 0.0,
+                'build_seconds': 0.0,
+                'total_seconds': time.perf_counter() - start,
+                'bytes': size,
+                'pages': None,
+                'flowables': None,
+                'reused': 0,
+                'built': 0,
+            })
+    
+    def generate_pdf(self, filename="resume.pdf", cancel_event=None, progress=None):
+        """Generate the PDF resume; nothing is written if the render is cancelled"""
+        start = time.perf_counter()
+        key = None
+        self.last_cache_hit = False
+        if self.cache is not None:
+            key = self.cache_key()
+            if self.cache.fetch(key, filename):
+                self.last_cache_hit = True
+                self._report_cache_hit(start, os.path.getsize(filename))
+                if self.verbose:
+                    print(f"Resume generated successfully (cached): {filename}")
+                return True
+            if self.cache.hardlink and os.path.exists(filename):
+                # Never write through a hardlink that may share its inode with a cache entry
+                os.remove(filename)
         
         # Build PDF
-        doc.build(story)
-        print(f"Resume generated successfully: {filename}")
+        self._render(filename, cancel_event, progress)
+        if key is not None:
+            self.cache.store(key, filename)
+        if self.verbose:
+            print(f"Resume generated successfully: {filename} "
+                  f"({self.render_stats['reused']} entries reused, {self.render_stats['built']} built)")
+        return True
+    
+    def render_to_bytes(self, cancel_event=None, progress=None):
+        """Render the PDF in memory and return it as bytes (never prints)"""
+        start = time.perf_counter()
+        self.last_cache_hit = False
+        key = None
+        if self.cache is not None:
+            key = self.cache_key()
+            path = self.cache.path_for(key)
+            if path is not None:
+                try:
+                    data = path.read_bytes()
+                    self.last_cache_hit = True
+                    self._report_cache_hit(start, len(data))
+                    return data
+                except FileNotFoundError:
+                    pass
+        
+        buffer = io.BytesIO()
+        self._render(buffer, cancel_event, progress)
+        data = buffer.getvalue()
+        if key is not None:
+            self.cache.store_bytes(key, data)
+        return data
     
-    def save_data_to_json(self, filename="resume_data.json"):
-        """Save resume data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.resume_data, f, indent=2, ensure_ascii=False)
-        print(f"Resume data saved to: {filename}")
+    def render_to(self, fileobj, chunk_size=WRITE_CHUNK_SIZE, cancel_event=None, progress=None):
+        """Render the PDF into any writable binary file-like in chunks; returns bytes written (never prints)"""
+        data = memoryview(self.render_to_bytes(cancel_event, progress))
+        offset = 0
+        while offset < len(data):
+            written = fileobj.write(data[offset:offset + chunk_size])
+            # Raw (unbuffered) streams may accept fewer bytes than offered
+            offset += min(chunk_size, len(data) - offset) if written is None else written
+        flush = getattr(fileobj, 'flush', None)
+        if flush is not None:
+            flush()
+        return len(data)
+    
+    def render_locales(self, locales, filename="resume_{locale}.pdf"):
+        """Generate one PDF per locale from the same data; returns {locale: filename}.
+        
+        The data, styles and fonts are set up once, and entries without labels (header,
+        profile, projects) are built once and shared by every locale's PDF.
+        """
+        for locale in locales:
+            get_labels(locale)  # Fail before writing anything
+        previous = self.locale
+        outputs = {}
+        try:
+            for locale in locales:
+                self.set_locale(locale)
+                outputs[locale] = filename.format(locale=locale)
+                self.generate_pdf(outputs[locale])
+        finally:
+            self.set_locale(previous)
+        return outputs
+    
+    def save_data_to_json(self, filename="resume_data.json", keep_history=False):
+        """Save resume data to JSON file, recording a revision in its history file when keep_history is set"""
+        data = self.resume_data.to_dict()
+        # Written beside the target and renamed over it, so an interrupted save leaves the old file intact
+        temp = f"{filename}.tmp"
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp, filename)
+        if self.verbose:
+            print(f"Resume data saved to: {filename}")
+        if keep_history:
+            rev = RevisionStore(history_path(filename)).commit(data)
+            if self.verbose and rev:
+                print(f"Recorded revision {rev} in {history_path(filename)}")
     
     def load_data_from_json(self, filename="resume_data.json"):
         """Load resume data from JSON file"""
         try:
             with open(filename, 'r', encoding='utf-8') as f:
                 self.resume_data = json.load(f)
-            print(f"Resume data loaded from: {filename}")
+            if self.verbose:
+                print(f"Resume data loaded from: {filename}")
+            return True
         except FileNotFoundError:
-            print(f"File {filename} not found. Using empty resume data.")
+            if self.verbose:
+                print(f"File {filename} not found. Using empty resume data.")
+            return False
+
+    def save_to_store(self, store, resume_id=None):
+        """Save resume data to a resume_store store under resume_id (a new id when None); returns the id"""
+        resume_id = store.save(self.resume_data.to_dict(), resume_id)
+        if self.verbose:
+            print(f"Resume data saved as id {resume_id}")
+        return resume_id
+
+    def load_from_store(self, store, resume_id):
+        """Load resume data from a resume_store store by id"""
+        try:
+            self.resume_data = store.load(resume_id)
+            if self.verbose:
+                print(f"Resume data loaded from id {resume_id}")
+            return True
+        except KeyError:
+            if self.verbose:
+                print(f"No resume with id {resume_id}. Using empty resume data.")
+            return False
+
+
+class CompactResumeBuilder(ResumeBuilder):
+    """Times-based one-page layout used by the GUI, with clickable contact links"""
+    layout = 'compact'
+    theme = 'compact'
+    verbose = False
+    
+    def _header_flowables(self, info):
+        # Name
+        name_para = paragraph(escape(info['name']), self.styles['NameHeader'])
+        
+        # Contact with manual hyperlinks
+        contact_parts = []
+        
+        if info.get('location'):
+            contact_parts.append(escape(info['location']))
+        if info.get('email'):
+            contact_parts.append(f'<a href="mailto:{escape_attr(info["email"])}" color="black">{escape(info["email"])}</a>')
+        if info.get('phone'):
+            contact_parts.append(f'<a href="tel:{escape_attr(info["phone"])}" color="black">{escape(info["phone"])}</a>')
+        if info.get('linkedin_display') and info.get('linkedin_url'):
+            contact_parts.append(f'<a href="{escape_attr(info["linkedin_url"])}" color="black">{escape(info["linkedin_display"])}</a>')
+        if info.get('github_display') and info.get('github_url'):
+            contact_parts.append(f'<a href="{escape_attr(info["github_url"])}" color="black">{escape(info["github_display"])}</a>')
+        
+        contact_text = ' | '.join(contact_parts)
+        contact_para = paragraph(contact_text, self.styles['ContactInfo'])
+        return [name_para, contact_para]
+
+    
+    # Updated section methods with minimal spacing
+    def _section_title_flowables(self, title):
+        """Section header with underline - NO spacing between title and line"""
+        title_size = self.styles['SectionHeader'].fontSize
+        section_title = SectionTitleRule(title, self._font('Times-Bold'), title_size,
+                                         7.5*inch, title_size * 1.2)
+        return [section_title, Spacer(1, 3)]  # Small space after the section header
+    
+    def _profile_flowables(self, summary):
+        """Profile summary - MINIMAL spacing"""
+        return [paragraph(escape(summary), self.styles['CompactNormal']), Spacer(1, 2)]     # Reduced from 6
+    
+    def _experience_flowables(self, exp):
+        """Work experience entry - MINIMAL spacing"""
+        entry = []
+        
+        # Job title with right-aligned date range - MINIMAL spacing
+        entry.append(DateRow(
+            f"{exp['job_title']} | {exp['company']} | {exp['location']}",
+            f"({exp['start_date']} - {exp['end_date']})",
+            5.5*inch, 2*inch,
+            self._font('Times-Bold'),
+            self._font('Helvetica'),
+            self.styles['JobTitle'].fontSize,
+        ))
+        # NO SPACER - removed
+        
+        # Responsibilities as bullet points - MINIMAL spacing
+        for resp in exp['responsibilities']:
+            bullet_para = paragraph(f"• {escape(resp)}", self.styles['BulletPoint'])
+            entry.append(bullet_para)
+        
+        # Technologies if provided - MINIMAL spacing
+        if exp['technologies']:
+            tech_para = paragraph(f"<b>{escape(self.labels['technologies'])}</b> {escape(exp['technologies'])}", self.styles['CompactNormal'])
+            entry.append(tech_para)
+        
+        entry.append(Spacer(1, 2))                 # Reduced from 4
+        return entry
+    
+    def _education_flowables(self, edu):
+        """Education entry - MINIMAL spacing"""
+        entry = []
+        
+        # Institution and degree - MINIMAL spacing
+        edu_title = escape(f"{edu['institution']}, {edu['location']}, {edu['degree']} {self.labels['degree_in']} {edu['field']}")
+        edu_para = paragraph(edu_title, self.styles['JobTitle'])
+        entry.append(edu_para)
+        
+        # Focus areas - MINIMAL spacing
+        if edu['focus_areas']:
+            focus_text = f"{escape(self.labels['focus_areas'])} {escape(', '.join(edu['focus_areas']))}"
+            focus_para = paragraph(focus_text, self.styles['CompactNormal'])
+            entry.append(focus_para)
+        
+        # Date range - MINIMAL spacing
+        date_text = escape(f"({edu['start_date']} – {edu['end_date']})")
+        date_para = paragraph(date_text, self.styles['CompactNormal'])
+        entry.append(date_para)
+        entry.append(Spacer(1, 2))             # Reduced from 4
+        return entry
+    
+    def _skills_flowables(self, skills):
+        """Skill categories - MINIMAL spacing"""
+        entry = super()._skills_flowables(skills)
+        entry[-1] = Spacer(1, 2)                 # Reduced from 6
+        return entry
+    
+    def _project_flowables(self, project):
+        """Project entry - MINIMAL spacing"""
+        entry = []
+        
+        # Project title - MINIMAL spacing
+        title_para = paragraph(escape(f"{project['title'].upper()} | {project['subtitle']}, {project['location']}"), 
+                            self.styles['JobTitle'])
+        entry.append(title_para)
+        
+        # Date range - MINIMAL spacing
+        date_para = paragraph(escape(f"({project['date_range']})"), self.styles['CompactNormal'])
+        entry.append(date_para)
+        # NO SPACER - removed
+        
+        # Description as bullet points - MINIMAL spacing
+        for desc in project['description']:
+            bullet_para = paragraph(f"• {escape(desc)}", self.styles['BulletPoint'])
+            entry.append(bullet_para)
+        
+        entry.append(Spacer(1, 2))             # Reduced from 4
+        return entry
+    
+    def _create_certifications_section(self, story):
+        """Create certifications section - MINIMAL spacing"""
+        if not self.resume_data['certifications']:
+            return
+            
+        self._create_section_with_line(story, self.labels['certifications'])
+        
+        for cert in self.resume_data['certifications']:
+            story.extend(self._cached_flowables('certification', cert, self._certification_flowables))
+
+
+# Builder class used for each theme by the batch command and the render service
+THEME_BUILDERS = {
+    'standard': ResumeBuilder,
+    'compact': CompactResumeBuilder,
+}
+
+
+def check_theme(theme):
+    """Raise ValueError unless theme has a builder in THEME_BUILDERS"""
+    if theme not in THEME_BUILDERS:
+        raise ValueError(f"Unknown theme '{theme}'. Available themes: {', '.join(THEME_BUILDERS)}")
+
+
+def builder_for_theme(theme='standard', **options):
+    """A builder drawing theme's own layout, e.g. CompactResumeBuilder for 'compact'"""
+    check_theme(theme)
+    return THEME_BUILDERS[theme](theme, **options)
 
 
 # Example usage and demo
@@ -568,7 +1041,39 @@ def interactive_resume_builder():
     return resume
 
 
-if __name__ == "__main__":
+def main(argv=None):
+    """Command line entry point: sample demo by default, or `batch` rendering"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Python Resume Builder")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    batch_parser = subparsers.add_parser('batch', help="Render a directory of *.json files or a JSONL/concatenated-JSON file")
+    batch_parser.add_argument('input', help="Directory of save_data_to_json files, or one JSONL or concatenated-JSON file")
+    batch_parser.add_argument('-o', '--output-dir', default='batch_output', help="Where PDFs are written")
+    batch_parser.add_argument('-w', '--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    batch_parser.add_argument('-c', '--chunksize', type=int, default=8, help="Jobs handed to a worker at a time")
+    batch_parser.add_argument('--theme', choices=THEME_BUILDERS, default='standard', help="Layout and style theme")
+    batch_parser.add_argument('--summary', default=None, help="Summary JSON path (default: <output-dir>/batch_summary.json)")
+    batch_parser.add_argument('--cache-dir', default=None, help="Reuse PDFs of unchanged resumes from this cache directory")
+    batch_parser.add_argument('--cache-max-mb', type=int, default=None, help="Cache size limit in MiB (default: 256)")
+    batch_parser.add_argument('--start', type=int, default=0, help="Skip this many resumes first")
+    batch_parser.add_argument('--limit', type=int, default=None, help="Render at most this many resumes")
+    batch_parser.add_argument('--font-family', default=None, help="TTF family replacing the base-14 fonts (e.g. DejaVuSans)")
+    batch_parser.add_argument('--font-dir', default=None, help="Directory with the family's .ttf files (default: $RESUME_FONT_DIR or ./fonts)")
+    batch_parser.add_argument('--engine', choices=ENGINES, default=None, help="Render engine: platypus (default) or canvas (faster; see resume_canvas)")
+    batch_parser.add_argument('--locale', choices=LOCALES, default=None, help="Section title language (default: de)")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'batch':
+        from resume_batch import run_batch
+        summary = run_batch(args.input, args.output_dir, workers=args.workers, chunksize=args.chunksize,
+                            theme=args.theme, summary_path=args.summary, cache_dir=args.cache_dir,
+                            cache_max_bytes=args.cache_max_mb * 1024 * 1024 if args.cache_max_mb else None,
+                            start=args.start, limit=args.limit, font_family=args.font_family, font_dir=args.font_dir,
+                            engine=args.engine, locale=args.locale)
+        return 1 if summary['failed'] else 0
+    
     # Demo: Create sample resume
     print("Creating sample resume...")
     sample_resume = create_sample_resume()
@@ -582,4 +1087,9 @@ if __name__ == "__main__":
     
     # Uncomment the line below to use interactive builder
     # interactive_resume = interactive_resume_builder()
-    # interactive_resume.generate_pdf("my_resume.pdf")
\ No newline at end of file
+    # interactive_resume.generate_pdf("my_resume.pdf")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(resume_data, theme, renderer_version):
+    """Hash the canonical JSON of resume_data together with the theme and renderer version"""
+    canonical = json.dumps(resume_data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    digest = hashlib.sha256(f"{renderer_version}\0{theme}\0".encode('utf-8'))
+    digest.update(canonical.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class PDFCache:
+    """Content-addressed on-disk cache of rendered PDFs with size-bounded LRU eviction.
+
+    Entries are stored as <directory>/<key[:2]>/<key>.pdf. Their modification time
+    is bumped on every hit and the least recently used entries are evicted first.
+    The directory may be shared by several processes; each instance keeps its own
+    hit/miss counters.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES, hardlink=False):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hardlink = hardlink
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._size = sum(size for _, size, _ in self._entries())
+
+    def _path(self, key):
+        return self.directory / key[:2] / f"{key}.pdf"
+
+    def _entries(self):
+        """Yield (path, size, mtime) for every cached PDF"""
+        for path in self.directory.glob('*/*.pdf'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            yield path, stat.st_size, stat.st_mtime
+
+    def _place(self, src, dest, link):
+        """Copy or hardlink src to dest through a temp name so dest is never half-written"""
+        dest = Path(dest)
+        tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+        if link:
+            try:
+                os.link(src, tmp)
+            except OSError:
+                shutil.copyfile(src, tmp)
+        else:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+
+    def path_for(self, key):
+        """Return the cached file for key (counting a hit) or None (counting a miss)"""
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def fetch(self, key, dest):
+        """Copy (or hardlink) the cached PDF for key to dest; return False on a miss"""
+        path = self.path_for(key)
+        if path is None:
+            return False
+        try:
+            self._place(path, dest, self.hardlink)
+        except FileNotFoundError:
+            # Evicted by another process between lookup and copy
+            with self._lock:
+                self.hits -= 1
+                self.misses += 1
+            return False
+        return True
+
+    def store(self, key, src):
+        """Add the rendered PDF at src to the cache under key"""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        self._place(src, path, link=False)
+        self._account(path.stat().st_size)
+
+    def store_bytes(self, key, data):
+        """Add an in-memory rendered PDF to the cache under key"""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self._account(len(data))
+
+    def _account(self, size):
+        with self._lock:
+            self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._size = total
+
+    def clear(self):
+        """Remove every cached PDF"""
+        with self._lock:
+            for path, _, _ in list(self._entries()):
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current cache size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'size_bytes': self._size,
+            'max_bytes': self.max_bytes
+        }
@@ -0,0 +1,533 @@
+"""Direct-canvas render engine: lays a resume story out without platypus.
+
+ResumeBuilder(engine='canvas') builds the same story as the default engine, but
+instead of running it through SimpleDocTemplate it places the flowables on a
+Canvas itself. Only what the builders produce is handled: Paragraph, Spacer
+and the rules and date rows from resume_flowables.
+
+Lines are broken the way Paragraph breaks them (greedy, with ReportLab's space
+shrinkage, over-long words split by character), using a process-wide cache of
+string widths. Pages are filled the way Frame fills them: space before and
+after overlap, and paragraphs split between lines but never leave a single
+line behind. Both engines therefore produce the same pages. The canvas engine
+skips the document template, frames, flowable wrap/split objects and the
+graphics state every flowable saves, and writes each page's text as one text
+object.
+
+A story with anything else (tables, images, underlines, bullets, ...) raises
+Unsupported before anything is drawn, and the builder falls back to platypus.
+"""
+import re
+from functools import lru_cache
+
+from reportlab.lib.colors import Color, CMYKColor
+from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+from reportlab.lib.rl_accel import escapePDF, fp_str, unicode2T1
+from reportlab.pdfbase.pdfmetrics import getFont, stringWidth
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Paragraph, Spacer
+from reportlab.platypus.doctemplate import LayoutError
+from reportlab.rl_config import _FUZZ
+
+from resume_flowables import HorizontalRule, SectionTitleRule, DateRow
+
+# Distinct (text, font, size) widths kept; words repeat heavily across a batch
+WIDTH_CACHE_SIZE = 65536
+
+# Padding SimpleDocTemplate's frame keeps on every side
+FRAME_PADDING = 6
+
+# Flowables that are drawn as they are, at their wrapped size, and never split
+FIXED_FLOWABLES = (Spacer, HorizontalRule, SectionTitleRule, DateRow)
+
+# Paragraph style settings the engine does not implement, with the value that is safe to ignore
+_PLAIN_STYLE = {
+    'wordWrap': None, 'endDots': None, 'autoLeading': '', 'justifyLastLine': 0, 'backColor': None,
+    'hyphenationLang': '', 'embeddedHyphenation': 0, 'uriWasteReduce': 0, 'shaping': 0,
+}
+
+_ALIGNMENTS = (TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY)
+
+# Whitespace that separates words; like Paragraph, a no-break space does not
+_WHITESPACE = re.compile(r'([^\S\xa0]+)')
+
+string_width = lru_cache(maxsize=WIDTH_CACHE_SIZE)(stringWidth)
+
+
+class Unsupported(Exception):
+    """The story contains something only the platypus engine lays out"""
+
+
+def _check_paragraph(para):
+    """Raise Unsupported unless the paragraph only uses plain text, fonts, colours and links"""
+    if type(para) is not Paragraph or para.bulletText:
+        raise Unsupported(f"{type(para).__name__} with bullet text")
+    style = para.style
+    if style.alignment not in _ALIGNMENTS or (style.borderWidth and style.borderColor):
+        raise Unsupported(f"paragraph style {style.name}")
+    for name, plain in _PLAIN_STYLE.items():
+        if (getattr(style, name, plain) or plain) != plain:
+            raise Unsupported(f"paragraph style {style.name} sets {name}")
+    for frag in para.frags:
+        if (not hasattr(frag, 'text') or hasattr(frag, 'cbDefn') or hasattr(frag, 'lineBreak')
+                or frag.us_lines or frag.rise or getattr(frag, 'backColor', None)):
+            raise Unsupported("paragraph markup beyond fonts, colours and links")
+        color = frag.textColor
+        if not isinstance(color, Color) or isinstance(color, CMYKColor) or _cid_font(frag.fontName):
+            raise Unsupported("paragraph colour or font")
+        for _, link in frag.link:
+            if link.startswith('#') or link.lower().startswith(('document:', 'pdf:')):
+                raise Unsupported(f"internal link {link}")
+
+
+def _cid_font(font_name):
+    font = getFont(font_name)
+    return font._multiByte and not font._dynamicFont
+
+
+def _same_style(a, b):
+    return a is b or (a.fontName == b.fontName and a.fontSize == b.fontSize
+                      and a.textColor == b.textColor and a.link == b.link)
+
+
+def _words(frags):
+    """Split paragraph fragments into words.
+
+    Each word is (pieces, width, space, space_frag, whole): pieces are (frag, text)
+    pairs, space is the width of the whitespace after the word (measured in the
+    fragment that holds it) and whole is False for the parts of a split word.
+    """
+    words = []
+    pieces = []
+    width = 0.0
+    for frag in frags:
+        font, size = frag.fontName, frag.fontSize
+        for i, part in enumerate(_WHITESPACE.split(frag.text)):
+            if i % 2:
+                if pieces:
+                    words.append((pieces, width, string_width(' ', font, size), frag, True))
+                    pieces = []
+                    width = 0.0
+            elif part:
+                pieces.append((frag, part))
+                width += string_width(part, font, size)
+    if pieces:
+        words.append((pieces, width, 0.0, None, True))
+    return words
+
+
+def _split_word(word, line_width, widths, lineno):
+    """Split an over-long word into parts filling the rest of this line and the next lines"""
+    pieces, _, space, space_frag, _ = word
+    last = len(widths) - 1
+    max_width = widths[min(last, lineno)]
+    next_width = widths[min(last, lineno + 1)]
+    parts = []
+    part = []
+    for frag, text in pieces:
+        font, size = frag.fontName, frag.fontSize
+        for c in text:
+            cw = string_width(c, font, size)
+            new_line_width = line_width + cw
+            if new_line_width > max_width and (part or cw <= next_width):
+                parts.append(part)
+                part = []
+                lineno += 1
+                max_width = widths[min(last, lineno)]
+                new_line_width = cw
+            if part and part[-1][0] is frag:
+                part[-1] = (frag, part[-1][1] + c)
+            else:
+                part.append((frag, c))
+            line_width = new_line_width
+    parts.append(part)
+    words = [(p, sum(string_width(t, f.fontName, f.fontSize) for f, t in p), 0.0, None, False) for p in parts]
+    last_part = words[-1]
+    words[-1] = last_part[:2] + (space, space_frag, False)
+    return words
+
+
+def _break_lines(words, widths, style, simple):
+    """Greedy line breaking as Paragraph.breakLines does it; returns [(words, extra space)]"""
+    shrinkage = style.spaceShrinkage
+    split_long = style.splitLongWords
+    last = len(widths) - 1
+    lines = []
+    line = []
+    width = gaps = pending = 0.0
+    lineno = 0
+    max_width = widths[0]
+    stack = words[::-1]
+    forced = False
+    while stack:
+        word = stack.pop()
+        word_width = word[1]
+        if line:
+            # Like Paragraph, a multi-style line does not count the space before an empty word
+            new_width = width + pending + word_width if word_width > 0 or simple else width
+            limit = max_width + shrinkage * (gaps + pending)
+        else:
+            new_width = word_width
+            limit = max_width
+        if new_width > limit and word[4] and not forced:
+            if split_long and word_width > max_width:
+                line_width = width + pending if line else 0.0
+                stack.extend(reversed(_split_word(word, line_width, widths, lineno)))
+                forced = True
+                continue
+        if new_width <= limit or not line or forced:
+            if word[0]:
+                if line:
+                    gaps += pending
+                line.append(word)
+            if forced:
+                # The first part of a split word ends its line
+                forced = False
+                lines.append((line, max_width - new_width))
+                line = []
+                width = gaps = pending = 0.0
+                lineno += 1
+                max_width = widths[min(last, lineno)]
+            else:
+                width = new_width
+                pending = word[2]
+        else:
+            lines.append((line, max_width - width))
+            line = [word]
+            width = word_width
+            gaps = 0.0
+            pending = word[2]
+            lineno += 1
+            max_width = widths[min(last, lineno)]
+    if line:
+        lines.append((line, max_width - width))
+    return lines
+
+
+def _line_runs(words):
+    """Join a line's words into (frag, text) runs, each drawn in one style"""
+    runs = []
+    for j, (pieces, _, _, _, _) in enumerate(words):
+        if j:
+            # The space is drawn in the style of the fragment it came from
+            space_frag = words[j - 1][3] or runs[-1][0]
+            if _same_style(runs[-1][0], space_frag):
+                runs[-1][1] += ' '
+            else:
+                runs.append([space_frag, ' '])
+        for frag, piece in pieces:
+            if runs and _same_style(runs[-1][0], frag):
+                runs[-1][1] += piece
+            else:
+                runs.append([frag, piece])
+    return tuple(tuple(run) for run in runs)
+
+
+class _Lines:
+    """A paragraph (or the part of one on a page) broken into lines of (runs, extra space, spaces, size)"""
+    __slots__ = ('para', 'lines', 'justify_last', 'height')
+
+    def __init__(self, para, lines, justify_last=False):
+        self.para = para
+        self.lines = lines
+        self.justify_last = justify_last
+        self.height = len(lines) * para.style.leading
+
+
+def _paragraph_lines(para, avail_width):
+    """Break a paragraph for avail_width, reusing the result while the paragraph is cached"""
+    cached = para.__dict__.get('_canvas_lines')
+    if cached is not None and cached[0] == avail_width:
+        return cached[1]
+    _check_paragraph(para)
+    style = para.style
+    first = avail_width - style.leftIndent - style.firstLineIndent - style.rightIndent
+    later = avail_width - style.leftIndent - style.rightIndent
+    lines = []
+    for words, extra in _break_lines(_words(para.frags), [first, later], style, len(para.frags) == 1):
+        runs = _line_runs(words)
+        spaces = len(words) - 1 + sum(text.count('\xa0') for _, text in runs)
+        size = max(frag.fontSize for word in words for frag, _ in word[0])
+        lines.append((runs, extra, spaces, size))
+    para._canvas_lines = (avail_width, lines)
+    return lines
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def _encode(text, font_name):
+    """PDF string operands for text in a single-byte font, as ((substitute font or None, operand), ...)"""
+    font = getFont(font_name)
+    return tuple((None if part_font is font else part_font.fontName, f'({escapePDF(data)}) Tj')
+                 for part_font, data in unicode2T1(text, [font] + font.substitutionFonts))
+
+
+@lru_cache(maxsize=1024)
+def _font_operator(internal_name, size, leading):
+    return f'{internal_name} {fp_str(size)} Tf {fp_str(leading)} TL'
+
+
+class _PageText:
+    """The text of one page, written as a single text object.
+
+    Emits the operators a TextObject would, but keeps only the state the
+    engine needs, steps to the next line with T* and reuses encoded strings.
+    """
+
+    def __init__(self, canv):
+        self.canv = canv
+        self.doc = canv._doc
+        self.code = ['BT']
+        self.font = None
+        self.size = self.leading = None
+        self.dynamic = False
+        self.subset = -1
+        self.text_leading = None
+        self.color = None
+        self.word_space = 0
+        self.line = None
+
+    def move(self, x, y):
+        """Start a line at (x, y)"""
+        line = self.line
+        if line is not None and line[0] == x and line[1] - self.text_leading == y:
+            self.code.append('T*')
+        else:
+            self.code.append(f'1 0 0 1 {fp_str(x, y)} Tm')
+        self.line = (x, y)
+
+    def set_font(self, name, size, leading):
+        if name == self.font and size == self.size and leading == self.leading:
+            return
+        self.font, self.size, self.leading = name, size, leading
+        self.dynamic = getFont(name)._dynamicFont
+        if self.dynamic:
+            # TrueType subsets are selected as the text needs them
+            self.subset = -1
+        else:
+            self.code.append(_font_operator(self.doc.getInternalFontName(name), size, leading))
+            self.text_leading = leading
+
+    def set_color(self, color):
+        if color != self.color:
+            self.code.append(f'{fp_str(color.red, color.green, color.blue)} rg')
+            self.color = color
+
+    def set_word_space(self, word_space):
+        if word_space != self.word_space:
+            self.code.append(f'{fp_str(word_space)} Tw')
+            self.word_space = word_space
+
+    def show(self, text):
+        code = self.code
+        if self.dynamic:
+            font = getFont(self.font)
+            for subset, data in font.splitString(text, self.doc):
+                if subset != self.subset:
+                    code.append(_font_operator(font.getSubsetInternalName(subset, self.doc),
+                                               self.size, self.leading))
+                    self.subset = subset
+                    self.text_leading = self.leading
+                code.append(f'({escapePDF(data)}) Tj')
+            return
+        substituted = False
+        for font_name, operand in _encode(text, self.font):
+            if (font_name is not None) != substituted or font_name is not None:
+                code.append(_font_operator(self.doc.getInternalFontName(font_name or self.font),
+                                           self.size, self.leading))
+                substituted = font_name is not None
+            code.append(operand)
+        if substituted:
+            code.append(_font_operator(self.doc.getInternalFontName(self.font), self.size, self.leading))
+
+    def draw(self):
+        if len(self.code) > 1:
+            self.code.append('ET')
+            self.canv.addLiteral(' '.join(self.code))
+
+
+def _check_cancelled(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        # Imported late: resume_builder imports this module
+        from resume_builder import RenderCancelled
+        raise RenderCancelled()
+
+
+def _link(canv, url, rect):
+    canv.linkURL(url, rect, relative=1, kind='URI')
+
+
+class CanvasRenderer:
+    """Lays a story out in a single-frame page layout and draws it on a Canvas"""
+
+    def __init__(self, pagesize, left, bottom, width, height):
+        self.pagesize = pagesize
+        self.x = left + FRAME_PADDING
+        self.top = bottom + height - FRAME_PADDING
+        self.bottom = bottom + FRAME_PADDING
+        self.width = width - 2 * FRAME_PADDING
+
+    @classmethod
+    def for_doc(cls, doc):
+        """Renderer matching a SimpleDocTemplate's page size and margins"""
+        return cls(doc.pagesize, doc.leftMargin, doc.bottomMargin, doc.width, doc.height)
+
+    def layout(self, story, cancel_event=None):
+        """Place the story on pages; returns a list of pages, each a list of (item, y)
+
+        Items are _Lines for paragraphs and the flowables themselves otherwise.
+        """
+        avail_width = self.width
+        bottom = self.bottom
+        pages = [[]]
+        page = pages[0]
+        y = self.top
+        at_top = True
+        prev_after = 0
+        queue = []
+        for flowable in story:
+            if isinstance(flowable, Paragraph):
+                queue.append(_Lines(flowable, _paragraph_lines(flowable, avail_width)))
+            elif isinstance(flowable, FIXED_FLOWABLES):
+                queue.append(flowable)
+            else:
+                raise Unsupported(type(flowable).__name__)
+        queue.reverse()
+        while queue:
+            _check_cancelled(cancel_event)
+            item = queue.pop()
+            para = item.para if isinstance(item, _Lines) else item
+            space = 0 if at_top else max(para.getSpaceBefore() - prev_after, 0)
+            avail = y - bottom - space
+            if avail > 0:
+                height = item.height if isinstance(item, _Lines) else item.wrap(avail_width, avail)[1]
+                if y - space - height >= bottom - _FUZZ:
+                    y -= space + height
+                    page.append((item, y))
+                    prev_after = para.getSpaceAfter()
+                    if height or space or prev_after:
+                        at_top = False
+                    y -= prev_after
+                    continue
+                parts = self._split(item, avail) if isinstance(item, _Lines) else None
+                if parts:
+                    first, rest = parts
+                    y -= space + first.height
+                    page.append((first, y))
+                    prev_after = para.getSpaceAfter()
+                    at_top = False
+                    y -= prev_after
+                    queue.append(rest)
+                    continue
+            if at_top:
+                raise LayoutError(f"Flowable {type(para).__name__} too large on page {len(pages)}")
+            page = []
+            pages.append(page)
+            queue.append(item)
+            y = self.top
+            at_top = True
+            prev_after = 0
+        return pages
+
+    def _split(self, item, avail):
+        """Split a paragraph between lines the way Paragraph.split does, or return None"""
+        style = item.para.style
+        lines = item.lines
+        fit = int(avail / style.leading)
+        if (not style.allowOrphans and fit <= 1) or fit == 0 or len(lines) <= fit:
+            return None
+        if not style.allowWidows and len(lines) == fit + 1:
+            if not ((style.allowOrphans and len(lines) == 3) or len(lines) > 3):
+                return None
+            fit -= 1
+        return (_Lines(item.para, lines[:fit], justify_last=True),
+                _Lines(item.para, lines[fit:], item.justify_last))
+
+    def render(self, story, target, cancel_event=None, progress=None):
+        """Lay out and draw the story into target (a filename or binary buffer); returns the page count"""
+        pages = self.layout(story, cancel_event)
+        total = sum(len(page) for page in pages)
+        done = 0
+        canv = canvas.Canvas(target, pagesize=self.pagesize)
+        for page in pages:
+            text = _PageText(canv)
+            for item, y in page:
+                _check_cancelled(cancel_event)
+                if isinstance(item, _Lines):
+                    self._draw_lines(canv, text, item, y)
+                else:
+                    width = item.wrap(self.width, self.top - self.bottom)[0]
+                    item.drawOn(canv, self.x, y, _sW=self.width - width)
+                done += 1
+                if progress is not None:
+                    progress(done / total)
+            text.draw()
+            canv.showPage()
+        canv.save()
+        return len(pages)
+
+    def _draw_lines(self, canv, text, item, y):
+        """Add a paragraph's lines to the page text (and its links to the canvas)"""
+        para = item.para
+        style = para.style
+        lines = item.lines
+        if not lines:
+            return
+        leading = style.leading
+        alignment = style.alignment
+        simple = len(para.frags) == 1
+        # Multi-style paragraphs link the runs of linked text, which needs their positions
+        track_links = not simple and any(frag.link for frag in para.frags)
+        x0 = self.x + style.leftIndent
+        baseline = y + item.height - lines[0][3]
+        end = len(lines) - 1
+        for i, (runs, extra, spaces, _) in enumerate(lines):
+            last = i == end and not item.justify_last
+            # Paragraph's rules: shrunk lines always squeeze their spaces; only justified
+            # lines (other than the last) stretch them
+            if alignment == TA_JUSTIFY:
+                plain = -1e-8 < extra <= 1e-8 or (last and extra > -1e-8)
+            else:
+                plain = extra > -1e-8
+            word_space = 0
+            offset = 0
+            if not plain and spaces > 0:
+                word_space = extra / spaces
+            elif alignment != TA_JUSTIFY:
+                offset = extra if alignment == TA_RIGHT else extra / 2 if alignment == TA_CENTER else 0
+            x = x0 + offset
+            if i == 0:
+                x += style.firstLineIndent
+            text.move(x, baseline)
+            text.set_word_space(word_space)
+            link_start = None
+            for k, (frag, piece) in enumerate(runs):
+                text.set_font(frag.fontName, frag.fontSize, leading)
+                text.set_color(frag.textColor)
+                text.show(piece)
+                if not track_links:
+                    continue
+                advance = string_width(piece, frag.fontName, frag.fontSize)
+                if not frag.link:
+                    x += advance + piece.count(' ') * word_space
+                    continue
+                if k == 0 or runs[k - 1][0].link != frag.link:
+                    link_start = x
+                if k == len(runs) - 1 or runs[k + 1][0].link != frag.link:
+                    trailing = len(piece) - len(piece.rstrip(' '))
+                    end_x = x + advance + (piece.count(' ') - trailing) * word_space
+                    if trailing:
+                        end_x -= string_width(' ' * trailing, frag.fontName, frag.fontSize)
+                    for _, url in frag.link:
+                        _link(canv, url, (link_start, baseline - 0.2 * frag.fontSize,
+                                          end_x, baseline + frag.fontSize))
+                x += advance + piece.count(' ') * word_space
+            if simple and para.frags[0].link:
+                # Single-style paragraphs link each whole line, as Paragraph does
+                frag = para.frags[0]
+                y_link = baseline - frag.fontSize / 8.0
+                x_link = x0 + offset
+                line_width = string_width(''.join(piece for _, piece in runs), frag.fontName, frag.fontSize)
+                for _, url in frag.link:
+                    _link(canv, url, (x_link, y_link, x_link + line_width, y_link + leading))
+            baseline -= leading
+        text.set_word_space(0)
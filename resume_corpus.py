@@ -0,0 +1,171 @@
+"""Streaming reader for resume corpora stored as JSONL or concatenated JSON.
+
+Resumes are decoded one at a time as the caller iterates, so memory stays
+proportional to the largest single record rather than the file. Both one
+resume per line (JSONL) and back-to-back, possibly pretty-printed, objects
+(the save_data_to_json format written repeatedly) are accepted. Records that do
+not decode are skipped and reported once, with their line and column; reading
+resumes at the next line that opens an object no deeper than the broken record
+started (column 0 for JSONL and json.dump output), so the objects nested inside
+a broken record are never taken for resumes.
+iter_corpus_text() yields the records' text instead, for callers that decode
+them elsewhere (such as batch rendering workers).
+"""
+import json
+import sys
+
+# A record still incomplete after this many characters is reported and dropped
+MAX_RECORD_CHARS = 16 * 1024 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+class CorpusError(ValueError):
+    """A record in a corpus file that could not be decoded"""
+
+    def __init__(self, path, line, column, message):
+        super().__init__(f"{path}:{line}:{column}: {message}")
+        self.path = path
+        self.line = line
+        self.column = column
+        self.message = message
+
+
+def _print_error(error):
+    print(f"Skipping {error}", file=sys.stderr)
+
+
+def _decode_lines(path, lines, on_error, raw=False):
+    """Yield (line_no, value, text) for every JSON value in an iterable of lines.
+
+    With raw set, a line holding one whole object ({...}) is yielded as
+    (line_no, None, text) without being decoded.
+    """
+    buffer = []  # (line_no, line) of the value being read
+    size = 0
+    source = enumerate(lines, 1)
+    # Lines after the start of a broken record are read again, since the next
+    # good record may begin inside what looked like its continuation
+    refeed = []
+    # After a broken record: the deepest indentation a line opening the next record may have
+    resync = None
+
+    while True:
+        if refeed:
+            line_no, line = refeed.pop(0)
+        else:
+            entry = next(source, None)
+            if entry is None:
+                break
+            line_no, line = entry
+        if not buffer:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if resync is not None:
+                if stripped[0] != '{' or len(line) - len(line.lstrip()) > resync:
+                    continue
+                resync = None
+            if raw and stripped[0] == '{' and stripped[-1] == '}':
+                yield line_no, None, stripped
+                continue
+        buffer.append((line_no, line))
+        size += len(line)
+        # An object can only be complete on a line ending in a closing bracket
+        if len(buffer) > 1 and not line.rstrip().endswith(('}', ']')) and size < MAX_RECORD_CHARS:
+            continue
+
+        first_line = buffer[0][0]
+        text = line if len(buffer) == 1 else ''.join(piece for _, piece in buffer)
+        end = len(text.rstrip())
+        pos = 0
+        while True:
+            # Skip whitespace between concatenated values
+            while pos < end and text[pos].isspace():
+                pos += 1
+            if pos >= end:
+                buffer, size = [], 0
+                break
+            value_line = first_line + text.count('\n', 0, pos)
+            value_start = pos
+            try:
+                value, pos = _decoder.raw_decode(text, pos)
+            except json.JSONDecodeError as e:
+                if e.pos >= end and size < MAX_RECORD_CHARS:
+                    # The value continues on the next line; keep only its own text
+                    column = pos - (text.rfind('\n', 0, pos) + 1)
+                    buffer = [(n, piece[column:] if n == value_line else piece)
+                              for n, piece in buffer if n >= value_line]
+                    size = sum(len(piece) for _, piece in buffer)
+                    break
+                error_line = first_line + text.count('\n', 0, e.pos)
+                column = e.pos - text.rfind('\n', 0, e.pos)
+                message = e.msg if e.pos < end else f"record longer than {MAX_RECORD_CHARS} characters"
+                if error_line != value_line:
+                    message += f" (in the record starting on line {value_line})"
+                on_error(CorpusError(path, error_line, column, message))
+                refeed = [(n, piece) for n, piece in buffer if n > value_line] + refeed
+                start_line = next(piece for n, piece in buffer if n == value_line)
+                resync = len(start_line) - len(start_line.lstrip())
+                buffer, size = [], 0
+                break
+            yield value_line, value, text[value_start:pos]
+
+    if buffer:
+        on_error(CorpusError(path, buffer[0][0], 1, "unexpected end of file inside a record"))
+
+
+def iter_corpus(path, start=0, limit=None, on_error=None):
+    """Yield (line_no, resume_dict) for each resume in a JSONL or concatenated-JSON file.
+
+    start skips that many valid resumes and limit stops after yielding that many.
+    Bad records are skipped; each one is passed to on_error as a CorpusError
+    (printed to stderr by default). line_no is the line the record starts on.
+    """
+    on_error = on_error or _print_error
+    index = 0
+    yielded = 0
+    if limit is not None and limit <= 0:
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, value, _ in _decode_lines(str(path), f, on_error):
+            if not isinstance(value, dict):
+                on_error(CorpusError(str(path), line_no, 1, f"expected a JSON object, got {type(value).__name__}"))
+                continue
+            index += 1
+            if index <= start:
+                continue
+            yield line_no, value
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+
+
+def iter_corpus_text(path, start=0, limit=None, on_error=None):
+    """Yield (line_no, text) for each record of a JSONL or concatenated-JSON file, leaving decoding to the caller.
+
+    One-line records are passed through as text without being parsed, so a
+    process pool can decode them in its workers. A line that is not valid JSON
+    (or holds several objects) then fails where it is decoded rather than here.
+    Multi-line records are still split by decoding them. start and limit count
+    records as in iter_corpus, except that undecoded lines count whether they
+    are valid or not.
+    """
+    on_error = on_error or _print_error
+    index = 0
+    yielded = 0
+    if limit is not None and limit <= 0:
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, value, text in _decode_lines(str(path), f, on_error, raw=True):
+            # Undecoded one-line records come back as (None, text)
+            if not isinstance(value, dict) and not (value is None and text[0] == '{'):
+                on_error(CorpusError(str(path), line_no, 1, f"expected a JSON object, got {type(value).__name__}"))
+                continue
+            index += 1
+            if index <= start:
+                continue
+            yield line_no, text
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
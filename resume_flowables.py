@@ -0,0 +1,105 @@
+"""Lightweight flowables for the section rules and job header rows.
+
+These draw exactly what the Tables they replace drew (same positions, fonts
+and line style), without Table's per-cell style resolution and layout pass.
+Like the Tables, they are wider than the frame and centred in it.
+"""
+from reportlab.lib import colors
+from reportlab.platypus.flowables import Flowable
+from reportlab.platypus.tables import CellStyle
+
+# Table cell defaults the replaced Tables relied on
+CELL_LEADING = CellStyle('default').leading
+CELL_PADDING = 6
+CELL_VPADDING = 3
+
+
+class _Rule:
+    """Mixin drawing a full-width rule the way Table's LINEBELOW does"""
+    thickness = 1
+    color = colors.black
+
+    def _draw_rule(self, y):
+        canv = self.canv
+        canv.saveState()
+        canv.setLineCap(1)
+        canv.setLineJoin(1)
+        canv.setStrokeColor(self.color)
+        canv.setLineWidth(self.thickness)
+        canv.line(0, y, self.width, y)
+        canv.restoreState()
+
+
+class HorizontalRule(_Rule, Flowable):
+    """A rule across width inside a box of the given height, offset above its bottom edge"""
+
+    def __init__(self, width, height=2, offset=1):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.offset = offset
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self._draw_rule(self.offset)
+
+
+class SectionTitleRule(_Rule, Flowable):
+    """Section title sitting directly on a rule (title row of title_height, then a 1pt rule row)"""
+
+    def __init__(self, title, font_name, font_size, width, title_height):
+        super().__init__()
+        self.title = title
+        self.font_name = font_name
+        self.font_size = font_size
+        self.width = width
+        self.height = title_height + 1
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canv = self.canv
+        canv.setFillColor(colors.black)
+        canv.setFont(self.font_name, self.font_size, CELL_LEADING)
+        # Bottom-aligned in the title row, which starts 1pt above the rule row
+        canv.drawString(0, 1 + CELL_LEADING - self.font_size, self.title)
+        self._draw_rule(0)
+
+
+class DateRow(Flowable):
+    """One line of left-aligned text with right-aligned text (a date range) in a second column"""
+
+    def __init__(self, left, right, left_width, right_width, font_name, right_font_name, font_size):
+        super().__init__()
+        self.left = str(left).split('\n')
+        self.right = str(right).split('\n')
+        self.left_width = left_width
+        self.width = left_width + right_width
+        self.font_name = font_name
+        self.right_font_name = right_font_name
+        self.font_size = font_size
+        self.height = max(len(self.left), len(self.right)) * CELL_LEADING + 2 * CELL_VPADDING
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canv = self.canv
+        top = self.height - CELL_VPADDING - self.font_size
+        canv.setFillColor(colors.black)
+        canv.setFont(self.font_name, self.font_size, CELL_LEADING)
+        y = top
+        for line in self.left:
+            canv.drawString(CELL_PADDING, y, line)
+            y -= CELL_LEADING
+        canv.setFont(self.right_font_name, self.font_size, CELL_LEADING)
+        y = top
+        for line in self.right:
+            canv.drawRightString(self.width - CELL_PADDING, y, line)
+            y -= CELL_LEADING
@@ -0,0 +1,82 @@
+"""TrueType font families for resumes the base-14 fonts cannot display.
+
+register_family() parses a family's TTF files once per process and registers
+them with ReportLab; every later builder, stylesheet and render shares the
+parsed fonts. ReportLab embeds TrueType fonts as subsets, so each PDF only
+carries the glyphs it actually uses and stays small regardless of the size of
+the font files.
+
+Fonts are looked up in the directory passed in, else $RESUME_FONT_DIR, else the
+fonts/ directory next to this module. A family is named after its regular file
+and the other faces follow the usual naming: DejaVuSans.ttf,
+DejaVuSans-Bold.ttf, DejaVuSans-Oblique.ttf (or -Italic),
+DejaVuSans-BoldOblique.ttf (or -BoldItalic). Missing faces fall back to the
+regular one.
+"""
+import os
+import threading
+from pathlib import Path
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.fonts import addMapping
+
+DEFAULT_FONT_DIR = Path(__file__).resolve().parent / 'fonts'
+
+FACE_SUFFIXES = {
+    'normal': ('',),
+    'bold': ('-Bold',),
+    'italic': ('-Italic', '-Oblique'),
+    'boldItalic': ('-BoldItalic', '-BoldOblique'),
+}
+
+# Base-14 font names the themes use, by the face they stand for
+BASE14_FACES = {
+    'Helvetica': 'normal', 'Helvetica-Bold': 'bold',
+    'Helvetica-Oblique': 'italic', 'Helvetica-BoldOblique': 'boldItalic',
+    'Times-Roman': 'normal', 'Times-Bold': 'bold',
+    'Times-Italic': 'italic', 'Times-BoldItalic': 'boldItalic',
+}
+
+_lock = threading.Lock()
+_families = {}
+
+
+def font_dir(directory=None):
+    """Resolve the directory fonts are loaded from"""
+    return Path(directory or os.environ.get('RESUME_FONT_DIR') or DEFAULT_FONT_DIR)
+
+
+def register_family(family, directory=None):
+    """Register a TTF family once per process; return its {face: font name} mapping"""
+    with _lock:
+        faces = _families.get(family)
+        if faces is not None:
+            return faces
+
+        directory = font_dir(directory)
+        regular = directory / f"{family}.ttf"
+        if not regular.is_file():
+            raise FileNotFoundError(f"Font family '{family}' not found: {regular} does not exist "
+                                    f"(set RESUME_FONT_DIR or pass a font directory)")
+        faces = {}
+        for face, suffixes in FACE_SUFFIXES.items():
+            for suffix in suffixes:
+                path = directory / f"{family}{suffix}.ttf"
+                if path.is_file():
+                    name = f"{family}{suffix}"
+                    pdfmetrics.registerFont(TTFont(name, str(path)))
+                    faces[face] = name
+                    break
+            else:
+                faces[face] = family
+        for face, name in faces.items():
+            addMapping(family, 'bold' in face.lower(), 'italic' in face.lower(), name)
+        _families[family] = faces
+        return faces
+
+
+def map_font(font_name, faces):
+    """The family's font standing in for a base-14 font name (other names are kept)"""
+    face = BASE14_FACES.get(font_name)
+    return font_name if face is None else faces[face]
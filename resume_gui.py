@@ -1,446 +1,124 @@
+import time
+
+# Reference point for the startup measurement, taken before the heavier imports
+_PROCESS_START = time.perf_counter()
+
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import ttk, scrolledtext, messagebox, filedialog, simpledialog
+import base64
 import json
+import queue
+import sys
+import threading
 from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, KeepTogether
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY, TA_RIGHT
-from reportlab.pdfgen import canvas
-from pathlib import Path
+from resume_preview import rasterize_first_page, PreviewUnavailable
+from resume_autosave import AutosaveWriter
 
-# Include the ResumeBuilder class from the previous code
-class ResumeBuilder:
-    def __init__(self):
-        self.resume_data = {
-            'personal_info': {
-                'name': '',
-                'location': '',
-                'email': '',
-                'phone': '',
-                'linkedin': '',
-                'github': ''
-            },
-            'profile_summary': '',
-            'experience': [],
-            'education': [],
-            'skills': {
-                'programming': [],
-                'technical': [],
-                'software': []
-            },
-            'projects': [],
-            'certifications': []
-        }
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom styles with minimal spacing for one-page resume"""
-        # Name header style - MINIMAL spacing
-        self.styles.add(ParagraphStyle(
-            name='NameHeader',
-            parent=self.styles['Heading1'],
-            fontSize=14,                # Reduced from 16
-            spaceAfter=1,              # Reduced from 2
-            alignment=TA_CENTER,
-            textColor=colors.black,
-            fontName='Times-Bold'
-        ))
-        
-        # Contact info style - MINIMAL spacing
-        self.styles.add(ParagraphStyle(
-            name='ContactInfo',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            alignment=TA_CENTER,
-            spaceAfter=4,              # Reduced from 8
-            fontName='Times-Roman'
-        ))
-        
-        # Section header style - MINIMAL spacing
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=10,               # Reduced from 11
-            spaceAfter=1,              # Reduced from 3
-            spaceBefore=4,             # Reduced from 8
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            fontName='Times-Bold'
-        ))
-        
-        # Job title and company style - MINIMAL spacing
-        self.styles.add(ParagraphStyle(
-            name='JobTitle',
-            parent=self.styles['Normal'],
-            fontSize=9,                # Reduced from 10
-            spaceAfter=1,              # Reduced from 2
-            spaceBefore=2,             # Reduced from 4
-            alignment=TA_LEFT,
-            textColor=colors.black,
-            fontName='Times-Bold'
-        ))
-        
-        # Bullet point style - MINIMAL spacing
-        self.styles.add(ParagraphStyle(
-            name='BulletPoint',
-            parent=self.styles['Normal'],
-            fontSize=8,                # Reduced from 9
-            spaceAfter=0,              # Reduced from 1
-            leftIndent=12,             # Reduced from 15
-            bulletIndent=6,            # Reduced from 8
-            alignment=TA_JUSTIFY,
-            fontName='Times-Roman'
-        ))
-        
-        # Skills category style - MINIMAL spacing
-        self.styles.add(ParagraphStyle(
-            name='SkillCategory',
-            parent=self.styles['Normal'],
-            fontSize=8,                # Reduced from 9
-            spaceAfter=0,              # Reduced from 1
-            alignment=TA_LEFT,
-            fontName='Times-Roman'
-        ))
-        
-        # Education/Project title style - MINIMAL spacing
-        self.styles.add(ParagraphStyle(
-            name='SubsectionTitle',
-            parent=self.styles['Normal'],
-            fontSize=9,                # Reduced from 10
-            spaceAfter=1,              # Reduced from 2
-            spaceBefore=1,             # Reduced from 3
-            alignment=TA_LEFT,
-            fontName='Times-Bold'
-        ))
-        
-        # Normal style override for general text - MINIMAL spacing
-        self.styles.add(ParagraphStyle(
-            name='CompactNormal',
-            parent=self.styles['Normal'],
-            fontSize=8,                # Reduced font size
-            spaceAfter=0,              # No space after
-            spaceBefore=0,             # No space before
-            alignment=TA_JUSTIFY,
-            fontName='Times-Roman'
-        ))
+# How often the Tk thread checks a background render for progress and results
+RENDER_POLL_MS = 50
 
-    def add_personal_info(self, name, location, email, phone, linkedin=None, github=None):
-        """Add personal information"""
-        self.resume_data['personal_info'] = {
-            'name': name,
-            'location': location,
-            'email': email,
-            'phone': phone,
-            'linkedin': linkedin or '',
-            'github': github or ''
-        }
-    
-    def add_profile_summary(self, summary):
-        """Add profile summary (Berufsprofil)"""
-        self.resume_data['profile_summary'] = summary
-    
-    def add_experience(self, job_title, company, location, start_date, end_date, responsibilities, technologies=None):
-        """Add work experience"""
-        experience = {
-            'job_title': job_title,
-            'company': company,
-            'location': location,
-            'start_date': start_date,
-            'end_date': end_date,
-            'responsibilities': responsibilities,  # List of bullet points
-            'technologies': technologies or ''
-        }
-        self.resume_data['experience'].append(experience)
-    
-    def add_education(self, institution, location, degree, field, start_date, end_date, focus_areas=None):
-        """Add education"""
-        education = {
-            'institution': institution,
-            'location': location,
-            'degree': degree,
-            'field': field,
-            'start_date': start_date,
-            'end_date': end_date,
-            'focus_areas': focus_areas or []
-        }
-        self.resume_data['education'].append(education)
-    
-    def add_skills(self, programming=None, technical=None, software=None):
-        """Add technical skills"""
-        if programming:
-            self.resume_data['skills']['programming'].extend(programming)
-        if technical:
-            self.resume_data['skills']['technical'].extend(technical)
-        if software:
-            self.resume_data['skills']['software'].extend(software)
-    
-    def add_project(self, title, subtitle, location, date_range, description):
-        """Add project"""
-        project = {
-            'title': title,
-            'subtitle': subtitle,
-            'location': location,
-            'date_range': date_range,
-            'description': description
-        }
-        self.resume_data['projects'].append(project)
-    
-    def add_certification(self, name, issuer):
-        """Add certification"""
-        cert = {
-            'name': name,
-            'issuer': issuer
-        }
-        self.resume_data['certifications'].append(cert)
-    
-    def _create_header(self, story):
-        # Name
-        name_para = Paragraph(self.resume_data['personal_info']['name'], self.styles['NameHeader'])
-        story.append(name_para)
-        
-        # Contact with manual hyperlinks
-        contact_parts = []
-        info = self.resume_data['personal_info']
-        
-        if info.get('location'):
-            contact_parts.append(info['location'])
-        if info.get('email'):
-            contact_parts.append(f'<a href="mailto:{info["email"]}" color="black">{info["email"]}</a>')
-        if info.get('phone'):
-            contact_parts.append(f'<a href="tel:{info["phone"]}" color="black">{info["phone"]}</a>')
-        if info.get('linkedin_display') and info.get('linkedin_url'):
-            contact_parts.append(f'<a href="{info["linkedin_url"]}" color="black">{info["linkedin_display"]}</a>')
-        if info.get('github_display') and info.get('github_url'):
-            contact_parts.append(f'<a href="{info["github_url"]}" color="black">{info["github_display"]}</a>')
-        
-        contact_text = ' | '.join(contact_parts)
-        contact_para = Paragraph(contact_text, self.styles['ContactInfo'])
-        story.append(contact_para)
+# Quiet period after the last edit before the live preview re-renders
+PREVIEW_DEBOUNCE_MS = 400
+PREVIEW_WIDTH = 360
 
-    
-    # Updated section methods with minimal spacing
-    def _create_section_with_line(self, story, title):
-        """Create a section header with underline - NO spacing between title and line"""
-        
-        # Method 1: Use a single table with text and line (RECOMMENDED)
-        section_data = [[title], ['']]
-        section_table = Table(section_data, colWidths=[7.5*inch], rowHeights=[12, 1])
-        section_table.setStyle(TableStyle([
-            # Title row styling
-            ('FONTNAME', (0, 0), (0, 0), 'Times-Bold'),
-            ('FONTSIZE', (0, 0), (0, 0), 10),
-            ('VALIGN', (0, 0), (0, 0), 'BOTTOM'),
-            ('LEFTPADDING', (0, 0), (0, 0), 0),
-            ('RIGHTPADDING', (0, 0), (0, 0), 0),
-            ('TOPPADDING', (0, 0), (0, 0), 0),
-            ('BOTTOMPADDING', (0, 0), (0, 0), 0),
-            
-            # Line row styling
-            ('LINEBELOW', (0, 1), (-1, 1), 1, colors.black),
-            ('VALIGN', (0, 1), (0, 1), 'TOP'),
-            ('LEFTPADDING', (0, 1), (0, 1), 0),
-            ('RIGHTPADDING', (0, 1), (0, 1), 0),
-            ('TOPPADDING', (0, 1), (0, 1), 0),
-            ('BOTTOMPADDING', (0, 1), (0, 1), 0),
-        ]))
-        story.append(section_table)
-        story.append(Spacer(1, 3))  # Small space after the section header
-    
-    def _create_profile_section(self, story):
-        """Create profile summary section - MINIMAL spacing"""
-        if not self.resume_data['profile_summary']:
-            return
-            
-        self._create_section_with_line(story, 'Berufsprofil')
-        
-        profile_para = Paragraph(self.resume_data['profile_summary'], self.styles['CompactNormal'])
-        story.append(profile_para)
-        story.append(Spacer(1, 2))     # Reduced from 6
-    
-    def _create_experience_section(self, story):
-        """Create work experience section - MINIMAL spacing"""
-        if not self.resume_data['experience']:
-            return
-            
-        self._create_section_with_line(story, 'Berufliche Erfahrung')
-        
-        for exp in self.resume_data['experience']:
-            # Job title with date range in a table - MINIMAL spacing
-            job_data = [[
-                f"{exp['job_title']} | {exp['company']} | {exp['location']}",
-                f"({exp['start_date']} - {exp['end_date']})"
-            ]]
-            
-            job_table = Table(job_data, colWidths=[5.5*inch, 2*inch])
-            job_table.setStyle(TableStyle([
-                ('FONTSIZE', (0, 0), (-1, -1), 9),     # Reduced from 10
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                ('FONTNAME', (0, 0), (0, 0), 'Times-Bold'),
-            ]))
-            story.append(job_table)
-            # NO SPACER - removed
-            
-            # Responsibilities as bullet points - MINIMAL spacing
-            for resp in exp['responsibilities']:
-                bullet_para = Paragraph(f"• {resp}", self.styles['BulletPoint'])
-                story.append(bullet_para)
-            
-            # Technologies if provided - MINIMAL spacing
-            if exp['technologies']:
-                tech_para = Paragraph(f"<b>Technologien:</b> {exp['technologies']}", self.styles['CompactNormal'])
-                story.append(tech_para)
-            
-            story.append(Spacer(1, 2))                 # Reduced from 4                 
-    
-    def _create_education_section(self, story):
-        """Create education section - MINIMAL spacing"""
-        if not self.resume_data['education']:
-            return
-            
-        self._create_section_with_line(story, 'AUSBILDUNG')
-        
-        for edu in self.resume_data['education']:
-            # Institution and degree - MINIMAL spacing
-            edu_title = f"{edu['institution']}, {edu['location']}, {edu['degree']} in {edu['field']}"
-            edu_para = Paragraph(edu_title, self.styles['JobTitle'])
-            story.append(edu_para)
-            
-            # Focus areas - MINIMAL spacing
-            if edu['focus_areas']:
-                focus_text = f"Schwerpunkt: {', '.join(edu['focus_areas'])}"
-                focus_para = Paragraph(focus_text, self.styles['CompactNormal'])
-                story.append(focus_para)
-            
-            # Date range - MINIMAL spacing
-            date_text = f"({edu['start_date']} – {edu['end_date']})"
-            date_para = Paragraph(date_text, self.styles['CompactNormal'])
-            story.append(date_para)
-            story.append(Spacer(1, 2))             # Reduced from 4
-    
-    def _create_skills_section(self, story):
-        """Create technical skills section - MINIMAL spacing"""
-        skills = self.resume_data['skills']
-        if not any([skills['programming'], skills['technical'], skills['software']]):
-            return
-            
-        self._create_section_with_line(story, 'Technische Fähigkeiten')
-        
-        if skills['programming']:
-            prog_text = f"• <b>Programmiersprachen:</b> {', '.join(skills['programming'])}"
-            prog_para = Paragraph(prog_text, self.styles['SkillCategory'])
-            story.append(prog_para)
-        
-        if skills['technical']:
-            tech_text = f"• <b>Technische Fähigkeiten:</b> {', '.join(skills['technical'])}"
-            tech_para = Paragraph(tech_text, self.styles['SkillCategory'])
-            story.append(tech_para)
-        
-        if skills['software']:
-            soft_text = f"• <b>Software-Entwicklung:</b> {', '.join(skills['software'])}"
-            soft_para = Paragraph(soft_text, self.styles['SkillCategory'])
-            story.append(soft_para)
-        
-        story.append(Spacer(1, 2))                 # Reduced from 6
+# Budget from process start until the window has painted; see --startup-report
+STARTUP_TARGET_MS = 250
 
-    
-    def _create_projects_section(self, story):
-        """Create projects section - MINIMAL spacing"""
-        if not self.resume_data['projects']:
-            return
-            
-        self._create_section_with_line(story, 'PROJEKT ARBEITEN')
-        
-        for project in self.resume_data['projects']:
-            # Project title - MINIMAL spacing
-            title_para = Paragraph(f"{project['title'].upper()} | {project['subtitle']}, {project['location']}", 
-                                self.styles['JobTitle'])
-            story.append(title_para)
-            
-            # Date range - MINIMAL spacing
-            date_para = Paragraph(f"({project['date_range']})", self.styles['CompactNormal'])
-            story.append(date_para)
-            # NO SPACER - removed
-            
-            # Description as bullet points - MINIMAL spacing
-            for desc in project['description']:
-                bullet_para = Paragraph(f"• {desc}", self.styles['BulletPoint'])
-                story.append(bullet_para)
-            
-            story.append(Spacer(1, 2))             # Reduced from 4
-    
-    def _create_certifications_section(self, story):
-        """Create certifications section - MINIMAL spacing"""
-        if not self.resume_data['certifications']:
-            return
-            
-        self._create_section_with_line(story, 'Zertifikate')
-        
-        for cert in self.resume_data['certifications']:
-            cert_text = f"• <b>{cert['name']}</b> - Herausgegeben von {cert['issuer']}"
-            cert_para = Paragraph(cert_text, self.styles['SkillCategory'])
-            story.append(cert_para)
-    
-    def generate_pdf(self, filename="resume.pdf"):
-        """Generate the PDF resume"""
-        doc = SimpleDocTemplate(
-            filename,
-            pagesize=A4,
-            rightMargin=1*cm,
-            leftMargin=1*cm,
-            topMargin=1*cm,
-            bottomMargin=1*cm
-        )
-        
-        story = []
-        
-        # Build the resume sections
-        self._create_header(story)
-        self._create_profile_section(story)
-        self._create_experience_section(story)
-        self._create_education_section(story)
-        self._create_skills_section(story)
-        self._create_projects_section(story)
-        self._create_certifications_section(story)
-        
-        # Build PDF
-        doc.build(story)
-        return True
-    
-    def save_data_to_json(self, filename="resume_data.json"):
-        """Save resume data to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.resume_data, f, indent=2, ensure_ascii=False)
-    
-    def load_data_from_json(self, filename="resume_data.json"):
-        """Load resume data from JSON file"""
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.resume_data = json.load(f)
-            return True
-        except FileNotFoundError:
-            return False
+# The form is loaded from this file at startup and autosaved back to it (see --no-autosave)
+DATA_FILE = "resume_data.json"
+
+# Quiet period after the last edit before the form is autosaved
+AUTOSAVE_DEBOUNCE_MS = 1000
+
+# Resume store used by Load/Save by ID unless --store names another (.db for SQLite, else a directory)
+DEFAULT_STORE = "resumes.db"
+
+
+def _new_builder():
+    """Create a builder, importing resume_builder (and with it reportlab) on first use"""
+    from resume_builder import CompactResumeBuilder
+    return CompactResumeBuilder()
 
 
 class ResumeBuilderGUI:
-    def __init__(self, root):
+    def __init__(self, root, store=DEFAULT_STORE, autosave=DATA_FILE):
         self.root = root
         self.root.title("Resume Builder - Professional PDF Generator")
-        self.root.geometry("1000x700")
+        self.root.geometry("1400x800")
         self.root.configure(bg='#f0f0f0')
         
-        # Initialize resume builder
-        self.resume_builder = ResumeBuilder()
-        
-        # Create the GUI
+        # Builders are created on first use so startup does not import reportlab
+        self._resume_builder = None
+        
+        # Builder owned by the background render thread; one render at a time
+        self._render_builder = None
+        self._render_thread = None
+        self._render_cancel = None
+        self._render_queue = None
+        
+        # Live preview state; the preview thread has its own builder as well
+        self._preview_builder = None
+        self._preview_after = None
+        self._preview_thread = None
+        self._preview_cancel = None
+        self._preview_queue = queue.Queue()
+        self._preview_pending = False
+        self._preview_available = True
+        self._preview_image = None
+        
+        # Resume store, opened on first Load/Save by ID; store_id is the id last loaded or saved
+        self.store_location = store
+        self._store = None
+        self.store_id = None
+        
+        # Autosave: edits are debounced on the Tk thread, serialized and written by the writer's thread
+        self._autosave = AutosaveWriter(autosave) if autosave else None
+        self._autosave_after = None
+        self._autosave_polling = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Milliseconds since process start, filled in by _finish_startup
+        self.startup_times = {}
+        
+        # Create the window shell and the first sections, then finish once it has painted
         self.setup_gui()
-        
-        # Load existing data if available
+        self.root.after_idle(self._finish_startup)
+    
+    @property
+    def resume_builder(self):
+        if self._resume_builder is None:
+            self._resume_builder = _new_builder()
+        return self._resume_builder
+    
+    @resume_builder.setter
+    def resume_builder(self, builder):
+        self._resume_builder = builder
+    
+    @property
+    def store(self):
+        if self._store is None:
+            from resume_store import open_store
+            self._store = open_store(self.store_location)
+        return self._store
+    
+    def _finish_startup(self):
+        """Build the remaining sections and load saved data after the first paint"""
+        self.startup_times['first_paint'] = (time.perf_counter() - _PROCESS_START) * 1000
+        
+        parent = self._scrollable_frame
+        self.create_experience_section(parent)
+        self.create_education_section(parent)
+        self.create_skills_section(parent)
+        self.create_projects_section(parent)
+        self.create_certifications_section(parent)
+        self.create_action_buttons(parent)
+        
+        # Load existing data if available; loading it is not an edit, so it is not autosaved
         self.load_existing_data()
+        if self._autosave is not None:
+            self._cancel_autosave()
+            self._autosave.baseline(self.form_data())
+        self.startup_times['ready'] = (time.perf_counter() - _PROCESS_START) * 1000
     
     def setup_gui(self):
         """Setup the main GUI layout"""
@@ -461,7 +139,8 @@ class ResumeBuilderGUI:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Pack canvas and scrollbar
+        # Pack preview, canvas and scrollbar
+        self.create_preview_pane(main_frame)
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
@@ -471,15 +150,183 @@ class ResumeBuilderGUI:
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
         # Create sections
+        # Only the sections visible in the first screenful are built before the first
+        # paint; _finish_startup adds the rest
+        self._scrollable_frame = scrollable_frame
         self.create_header_section(scrollable_frame)
         self.create_personal_info_section(scrollable_frame)
         self.create_profile_section(scrollable_frame)
-        self.create_experience_section(scrollable_frame)
-        self.create_education_section(scrollable_frame)
-        self.create_skills_section(scrollable_frame)
-        self.create_projects_section(scrollable_frame)
-        self.create_certifications_section(scrollable_frame)
-        self.create_action_buttons(scrollable_frame)
+    
+    def create_preview_pane(self, parent):
+        """Create the live preview panel showing the first rendered page"""
+        preview_frame = ttk.LabelFrame(parent, text="Live Preview", padding="5")
+        preview_frame.pack(side="right", fill="y", padx=(10, 0))
+        
+        self.preview_label = ttk.Label(preview_frame, anchor=tk.N)
+        self.preview_label.pack(fill=tk.BOTH, expand=True)
+        
+        self.preview_status_var = tk.StringVar(value="The preview updates when you stop typing")
+        ttk.Label(preview_frame, textvariable=self.preview_status_var, foreground='gray',
+                  wraplength=PREVIEW_WIDTH).pack(anchor=tk.W, pady=(5, 0))
+    
+    def _tracked_var(self):
+        """StringVar that reports every edit to _on_content_changed"""
+        var = tk.StringVar()
+        var.trace_add('write', self._on_content_changed)
+        return var
+    
+    def _track_text(self, text_widget):
+        """Report edits of a ScrolledText widget to _on_content_changed"""
+        text_widget.bind('<<Modified>>', self._on_text_modified)
+    
+    def _on_text_modified(self, event):
+        # <<Modified>> fires again when the flag is reset, so only react while it is set
+        if event.widget.edit_modified():
+            event.widget.edit_modified(False)
+            self._on_content_changed()
+    
+    def _on_content_changed(self, *args):
+        """Called on the Tk thread whenever any form field changes"""
+        self._schedule_preview()
+        self._schedule_autosave()
+    
+    def _schedule_autosave(self):
+        """Debounce autosaves until typing pauses"""
+        if self._autosave is None:
+            return
+        self._cancel_autosave()
+        self._autosave_after = self.root.after(AUTOSAVE_DEBOUNCE_MS, self._autosave_now)
+    
+    def _cancel_autosave(self):
+        if self._autosave_after is not None:
+            self.root.after_cancel(self._autosave_after)
+            self._autosave_after = None
+    
+    def _autosave_now(self):
+        """Hand a snapshot of the form to the autosave thread; unchanged content is not written"""
+        self._autosave_after = None
+        try:
+            data = self.form_data()
+        except Exception as e:
+            self.status_var.set(f"Autosave failed: {e}")
+            return
+        self._autosave.submit(data)
+        if not self._autosave_polling:
+            self._autosave_polling = True
+            self.root.after(RENDER_POLL_MS, self._poll_autosave)
+    
+    def _poll_autosave(self):
+        """Report autosave results on the Tk thread until the writer is idle"""
+        try:
+            while True:
+                kind, value = self._autosave.events.get_nowait()
+                if kind == 'saved':
+                    self.status_var.set(f"Autosaved to {value} at {datetime.now().strftime('%H:%M:%S')}")
+                else:
+                    self.status_var.set(f"Autosave failed: {value}")
+        except queue.Empty:
+            pass
+        if self._autosave.idle and self._autosave.events.empty():
+            self._autosave_polling = False
+        else:
+            self.root.after(RENDER_POLL_MS, self._poll_autosave)
+    
+    def _on_close(self):
+        """Save an edit still waiting for its autosave, then close the window"""
+        if self._autosave is not None:
+            if self._autosave_after is not None:
+                self._cancel_autosave()
+                try:
+                    self._autosave.submit(self.form_data())
+                except Exception:
+                    pass
+            self._autosave.close(timeout=5)
+        self.root.destroy()
+    
+    def _schedule_preview(self):
+        """Debounce preview renders until typing pauses"""
+        if not self._preview_available:
+            return
+        if self._preview_after is not None:
+            self.root.after_cancel(self._preview_after)
+        self._preview_after = self.root.after(PREVIEW_DEBOUNCE_MS, self._start_preview)
+    
+    def _start_preview(self):
+        """Collect the form and render the preview on a background thread"""
+        self._preview_after = None
+        if self._preview_thread is not None:
+            # A stale render is still running: cancel it and start over once it stops
+            self._preview_cancel.set()
+            self._preview_pending = True
+            return
+        
+        # Only the widget reads happen here; the builder (and reportlab) are created and fed on the worker
+        try:
+            resume_data = self.form_data()
+        except Exception as e:
+            self.preview_status_var.set(f"Preview failed: {e}")
+            return
+        
+        self._preview_cancel = threading.Event()
+        self._preview_thread = threading.Thread(
+            target=self._preview_worker,
+            args=(resume_data, self.fit_one_page_var.get(), self._preview_cancel, self._preview_queue),
+            daemon=True
+        )
+        self.preview_status_var.set("Rendering preview...")
+        self._preview_thread.start()
+        self.root.after(RENDER_POLL_MS, self._poll_preview)
+    
+    def _preview_worker(self, resume_data, fit_one_page, cancel_event, results):
+        """Build the resume from the form snapshot, render it and rasterize the first page off the Tk thread"""
+        try:
+            from resume_builder import RenderCancelled
+        except ImportError as e:
+            results.put(('error', str(e)))
+            return
+        try:
+            if self._preview_builder is None:
+                self._preview_builder = _new_builder()
+            builder = self._preview_builder
+            builder.resume_data = resume_data
+            if fit_one_page:
+                builder.fit_to_pages(1)
+            else:
+                builder.set_scale(1.0)
+            pdf = builder.render_to_bytes(cancel_event=cancel_event)
+            if cancel_event.is_set():
+                raise RenderCancelled()
+            results.put(('done', rasterize_first_page(pdf, PREVIEW_WIDTH)))
+        except RenderCancelled:
+            results.put(('cancelled', None))
+        except PreviewUnavailable as e:
+            results.put(('unavailable', str(e)))
+        except Exception as e:
+            results.put(('error', str(e)))
+    
+    def _poll_preview(self):
+        """Show the finished preview on the Tk thread, then start any edit that arrived meanwhile"""
+        try:
+            kind, value = self._preview_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(RENDER_POLL_MS, self._poll_preview)
+            return
+        
+        self._preview_thread = None
+        if kind == 'done':
+            self._preview_image = tk.PhotoImage(data=base64.b64encode(value))
+            self.preview_label.configure(image=self._preview_image)
+            self.preview_status_var.set(f"Preview updated {datetime.now():%H:%M:%S}")
+        elif kind == 'unavailable':
+            self._preview_available = False
+            self._preview_pending = False
+            self.preview_status_var.set(value)
+        elif kind == 'error':
+            self.preview_status_var.set(f"Preview failed: {value}")
+        
+        if self._preview_pending:
+            self._preview_pending = False
+            self._start_preview()
     
     def create_header_section(self, parent):
         """Create header with title and file operations"""
@@ -492,6 +339,8 @@ class ResumeBuilderGUI:
         
         ttk.Button(file_frame, text="Load Data", command=self.load_data).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(file_frame, text="Save Data", command=self.save_data).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(file_frame, text="Load by ID", command=self.load_from_store).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(file_frame, text="Save by ID", command=self.save_to_store).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(file_frame, text="Clear All", command=self.clear_all_data).pack(side=tk.LEFT, padx=(0, 5))
     
     def create_personal_info_section(self, parent):
@@ -501,22 +350,22 @@ class ResumeBuilderGUI:
         
         # Name
         ttk.Label(personal_frame, text="Full Name:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.name_var = tk.StringVar()
+        self.name_var = self._tracked_var()
         ttk.Entry(personal_frame, textvariable=self.name_var, width=50).grid(row=0, column=1, columnspan=2, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Location
         ttk.Label(personal_frame, text="Location:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.location_var = tk.StringVar()
+        self.location_var = self._tracked_var()
         ttk.Entry(personal_frame, textvariable=self.location_var, width=50).grid(row=1, column=1, columnspan=2, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Email
         ttk.Label(personal_frame, text="Email:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.email_var = tk.StringVar()
+        self.email_var = self._tracked_var()
         ttk.Entry(personal_frame, textvariable=self.email_var, width=50).grid(row=2, column=1, columnspan=2, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Phone
         ttk.Label(personal_frame, text="Phone:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.phone_var = tk.StringVar()
+        self.phone_var = self._tracked_var()
         ttk.Entry(personal_frame, textvariable=self.phone_var, width=50).grid(row=3, column=1, columnspan=2, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # LinkedIn - UPDATED with separate fields
@@ -524,11 +373,11 @@ class ResumeBuilderGUI:
         linkedin_frame.grid(row=4, column=0, columnspan=3, sticky=tk.W+tk.E, pady=2)
         
         ttk.Label(linkedin_frame, text="LinkedIn Display Name:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.linkedin_display_var = tk.StringVar()
+        self.linkedin_display_var = self._tracked_var()
         ttk.Entry(linkedin_frame, textvariable=self.linkedin_display_var, width=25).grid(row=0, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         ttk.Label(linkedin_frame, text="LinkedIn URL:").grid(row=0, column=2, sticky=tk.W, pady=2)
-        self.linkedin_url_var = tk.StringVar()
+        self.linkedin_url_var = self._tracked_var()
         ttk.Entry(linkedin_frame, textvariable=self.linkedin_url_var, width=40).grid(row=0, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Helper text for LinkedIn
@@ -541,11 +390,11 @@ class ResumeBuilderGUI:
         github_frame.grid(row=5, column=0, columnspan=3, sticky=tk.W+tk.E, pady=2)
         
         ttk.Label(github_frame, text="GitHub Display:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.github_display_var = tk.StringVar()
+        self.github_display_var = self._tracked_var()
         ttk.Entry(github_frame, textvariable=self.github_display_var, width=25).grid(row=0, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         ttk.Label(github_frame, text="GitHub URL:").grid(row=0, column=2, sticky=tk.W, pady=2)
-        self.github_url_var = tk.StringVar()
+        self.github_url_var = self._tracked_var()
         ttk.Entry(github_frame, textvariable=self.github_url_var, width=40).grid(row=0, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Helper text for GitHub
@@ -568,6 +417,7 @@ class ResumeBuilderGUI:
         ttk.Label(profile_frame, text="Profile Summary:").pack(anchor=tk.W)
         self.profile_text = scrolledtext.ScrolledText(profile_frame, height=4, wrap=tk.WORD)
         self.profile_text.pack(fill=tk.X, pady=(5, 0))
+        self._track_text(self.profile_text)
     
     def create_experience_section(self, parent):
         """Create work experience section"""
@@ -595,32 +445,32 @@ class ResumeBuilderGUI:
         
         # Job Title
         ttk.Label(details_frame, text="Job Title:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        job_title_var = tk.StringVar()
+        job_title_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=job_title_var, width=30).grid(row=0, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         # Company
         ttk.Label(details_frame, text="Company:").grid(row=0, column=2, sticky=tk.W, pady=2)
-        company_var = tk.StringVar()
+        company_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=company_var, width=30).grid(row=0, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Location
         ttk.Label(details_frame, text="Location:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        location_var = tk.StringVar()
+        location_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=location_var, width=30).grid(row=1, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         # Start Date
         ttk.Label(details_frame, text="Start Date:").grid(row=1, column=2, sticky=tk.W, pady=2)
-        start_date_var = tk.StringVar()
+        start_date_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=start_date_var, width=30).grid(row=1, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # End Date
         ttk.Label(details_frame, text="End Date:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        end_date_var = tk.StringVar()
+        end_date_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=end_date_var, width=30).grid(row=2, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         # Technologies
         ttk.Label(details_frame, text="Technologies:").grid(row=2, column=2, sticky=tk.W, pady=2)
-        technologies_var = tk.StringVar()
+        technologies_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=technologies_var, width=30).grid(row=2, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Configure column weights
@@ -631,6 +481,7 @@ class ResumeBuilderGUI:
         ttk.Label(exp_entry_frame, text="Responsibilities (one per line):").pack(anchor=tk.W, pady=(10, 0))
         responsibilities_text = scrolledtext.ScrolledText(exp_entry_frame, height=3, wrap=tk.WORD)
         responsibilities_text.pack(fill=tk.X, pady=(5, 0))
+        self._track_text(responsibilities_text)
         
         # Remove button
         ttk.Button(exp_entry_frame, text="Remove", 
@@ -654,6 +505,7 @@ class ResumeBuilderGUI:
         frame.destroy()
         self.experience_list = [exp for exp in self.experience_list if exp['frame'] != frame]
         self.update_experience_labels()
+        self._on_content_changed()
     
     def update_experience_labels(self):
         """Update experience entry labels"""
@@ -682,32 +534,32 @@ class ResumeBuilderGUI:
         
         # Institution
         ttk.Label(details_frame, text="Institution:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        institution_var = tk.StringVar()
+        institution_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=institution_var, width=40).grid(row=0, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         # Location
         ttk.Label(details_frame, text="Location:").grid(row=0, column=2, sticky=tk.W, pady=2)
-        location_var = tk.StringVar()
+        location_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=location_var, width=30).grid(row=0, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Degree
         ttk.Label(details_frame, text="Degree:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        degree_var = tk.StringVar()
+        degree_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=degree_var, width=40).grid(row=1, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         # Field
         ttk.Label(details_frame, text="Field:").grid(row=1, column=2, sticky=tk.W, pady=2)
-        field_var = tk.StringVar()
+        field_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=field_var, width=30).grid(row=1, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Start Date
         ttk.Label(details_frame, text="Start Date:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        start_date_var = tk.StringVar()
+        start_date_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=start_date_var, width=40).grid(row=2, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         # End Date
         ttk.Label(details_frame, text="End Date:").grid(row=2, column=2, sticky=tk.W, pady=2)
-        end_date_var = tk.StringVar()
+        end_date_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=end_date_var, width=30).grid(row=2, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Configure column weights
@@ -716,7 +568,7 @@ class ResumeBuilderGUI:
         
         # Focus Areas
         ttk.Label(edu_entry_frame, text="Focus Areas (comma separated):").pack(anchor=tk.W, pady=(10, 0))
-        focus_areas_var = tk.StringVar()
+        focus_areas_var = self._tracked_var()
         ttk.Entry(edu_entry_frame, textvariable=focus_areas_var).pack(fill=tk.X, pady=(5, 0))
         
         # Remove button
@@ -741,6 +593,7 @@ class ResumeBuilderGUI:
         frame.destroy()
         self.education_list = [edu for edu in self.education_list if edu['frame'] != frame]
         self.update_education_labels()
+        self._on_content_changed()
     
     def update_education_labels(self):
         """Update education entry labels"""
@@ -754,17 +607,17 @@ class ResumeBuilderGUI:
         
         # Programming Languages
         ttk.Label(skills_frame, text="Programming Languages (comma separated):").pack(anchor=tk.W)
-        self.programming_var = tk.StringVar()
+        self.programming_var = self._tracked_var()
         ttk.Entry(skills_frame, textvariable=self.programming_var).pack(fill=tk.X, pady=(5, 10))
         
         # Technical Skills
         ttk.Label(skills_frame, text="Technical Skills (comma separated):").pack(anchor=tk.W)
-        self.technical_var = tk.StringVar()
+        self.technical_var = self._tracked_var()
         ttk.Entry(skills_frame, textvariable=self.technical_var).pack(fill=tk.X, pady=(5, 10))
         
         # Software Development
         ttk.Label(skills_frame, text="Software Development (comma separated):").pack(anchor=tk.W)
-        self.software_var = tk.StringVar()
+        self.software_var = self._tracked_var()
         ttk.Entry(skills_frame, textvariable=self.software_var).pack(fill=tk.X, pady=(5, 0))
     
     def create_projects_section(self, parent):
@@ -789,22 +642,22 @@ class ResumeBuilderGUI:
         
         # Title
         ttk.Label(details_frame, text="Title:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        title_var = tk.StringVar()
+        title_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=title_var, width=50).grid(row=0, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Subtitle
         ttk.Label(details_frame, text="Subtitle:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        subtitle_var = tk.StringVar()
+        subtitle_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=subtitle_var, width=50).grid(row=1, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Location
         ttk.Label(details_frame, text="Location:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        location_var = tk.StringVar()
+        location_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=location_var, width=50).grid(row=2, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Date Range
         ttk.Label(details_frame, text="Date Range:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        date_range_var = tk.StringVar()
+        date_range_var = self._tracked_var()
         ttk.Entry(details_frame, textvariable=date_range_var, width=50).grid(row=3, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 0))
         
         # Configure column weights
@@ -814,6 +667,7 @@ class ResumeBuilderGUI:
         ttk.Label(proj_entry_frame, text="Description (one bullet point per line):").pack(anchor=tk.W, pady=(10, 0))
         description_text = scrolledtext.ScrolledText(proj_entry_frame, height=3, wrap=tk.WORD)
         description_text.pack(fill=tk.X, pady=(5, 0))
+        self._track_text(description_text)
         
         # Remove button
         ttk.Button(proj_entry_frame, text="Remove", 
@@ -835,6 +689,7 @@ class ResumeBuilderGUI:
         frame.destroy()
         self.projects_list = [proj for proj in self.projects_list if proj['frame'] != frame]
         self.update_project_labels()
+        self._on_content_changed()
     
     def update_project_labels(self):
         """Update project entry labels"""
@@ -859,12 +714,12 @@ class ResumeBuilderGUI:
         
         # Name
         ttk.Label(cert_entry_frame, text="Certification Name:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        name_var = tk.StringVar()
+        name_var = self._tracked_var()
         ttk.Entry(cert_entry_frame, textvariable=name_var, width=40).grid(row=0, column=1, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         # Issuer
         ttk.Label(cert_entry_frame, text="Issuer:").grid(row=0, column=2, sticky=tk.W, pady=2)
-        issuer_var = tk.StringVar()
+        issuer_var = self._tracked_var()
         ttk.Entry(cert_entry_frame, textvariable=issuer_var, width=30).grid(row=0, column=3, sticky=tk.W+tk.E, pady=2, padx=(5, 10))
         
         # Remove button
@@ -887,6 +742,7 @@ class ResumeBuilderGUI:
         """Remove a certification entry"""
         frame.destroy()
         self.certifications_list = [cert for cert in self.certifications_list if cert['frame'] != frame]
+        self._on_content_changed()
     
     def create_action_buttons(self, parent):
         """Create action buttons"""
@@ -896,48 +752,66 @@ class ResumeBuilderGUI:
         button_frame = ttk.Frame(action_frame)
         button_frame.pack()
         
-        ttk.Button(button_frame, text="Generate PDF", command=self.generate_pdf, 
-                  style='Accent.TButton').pack(side=tk.LEFT, padx=(0, 10))
+        self.generate_button = ttk.Button(button_frame, text="Generate PDF", command=self.generate_pdf, 
+                  style='Accent.TButton')
+        self.generate_button.pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Preview Data", command=self.preview_data).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(button_frame, text="Load Sample", command=self.load_sample_data).pack(side=tk.LEFT)
-    
-    def collect_data(self):
-        """Collect all data from the GUI"""
-        # Reset resume builder
-        self.resume_builder = ResumeBuilder()
+        ttk.Button(button_frame, text="Load Sample", command=self.load_sample_data).pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Opt-in: shrink fonts and spacing when the content overflows one page
+        self.fit_one_page_var = tk.BooleanVar(value=False)
+        self.fit_one_page_var.trace_add('write', self._on_content_changed)
+        ttk.Checkbutton(button_frame, text="Fit to one page", variable=self.fit_one_page_var).pack(side=tk.LEFT)
+        
+        # Render progress, status and cancel
+        progress_frame = ttk.Frame(action_frame)
+        progress_frame.pack(fill=tk.X, pady=(10, 0))
         
+        self.render_progress = ttk.Progressbar(progress_frame, mode='determinate', maximum=100)
+        self.render_progress.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.cancel_button = ttk.Button(progress_frame, text="Cancel", command=self.cancel_render, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(10, 0))
+        
+        self.status_var = tk.StringVar(value="Ready")
+        ttk.Label(action_frame, textvariable=self.status_var, foreground='gray').pack(anchor=tk.W, pady=(5, 0))
+    
+    def form_data(self):
+        """The form as a save_data_to_json dict, read on the Tk thread without touching the builder"""
         # Personal info with manual hyperlinks
-        self.resume_builder.resume_data['personal_info'] = {
-            'name': self.name_var.get(),
-            'location': self.location_var.get(),
-            'email': self.email_var.get(),
-            'phone': self.phone_var.get(),
-            'linkedin_display': self.linkedin_display_var.get(),
-            'linkedin_url': self.linkedin_url_var.get(),
-            'github_display': self.github_display_var.get(),
-            'github_url': self.github_url_var.get()
+        data = {
+            'personal_info': {
+                'name': self.name_var.get(),
+                'location': self.location_var.get(),
+                'email': self.email_var.get(),
+                'phone': self.phone_var.get(),
+                'linkedin_display': self.linkedin_display_var.get(),
+                'linkedin_url': self.linkedin_url_var.get(),
+                'github_display': self.github_display_var.get(),
+                'github_url': self.github_url_var.get()
+            },
+            'profile_summary': self.profile_text.get("1.0", tk.END).strip(),
+            'experience': [],
+            'education': [],
+            'skills': {},
+            'projects': [],
+            'certifications': []
         }
         
-        # Profile summary
-        profile_text = self.profile_text.get("1.0", tk.END).strip()
-        if profile_text:
-            self.resume_builder.add_profile_summary(profile_text)
-        
         # Experience
         for exp in self.experience_list:
             responsibilities_text = exp['responsibilities'].get("1.0", tk.END).strip()
             responsibilities = [line.strip() for line in responsibilities_text.split('\n') if line.strip()]
             
             if exp['job_title'].get() and exp['company'].get():
-                self.resume_builder.add_experience(
-                    job_title=exp['job_title'].get(),
-                    company=exp['company'].get(),
-                    location=exp['location'].get(),
-                    start_date=exp['start_date'].get(),
-                    end_date=exp['end_date'].get(),
-                    responsibilities=responsibilities,
-                    technologies=exp['technologies'].get()
-                )
+                data['experience'].append({
+                    'job_title': exp['job_title'].get(),
+                    'company': exp['company'].get(),
+                    'location': exp['location'].get(),
+                    'start_date': exp['start_date'].get(),
+                    'end_date': exp['end_date'].get(),
+                    'responsibilities': responsibilities,
+                    'technologies': exp['technologies'].get()
+                })
         
         # Education
         for edu in self.education_list:
@@ -945,26 +819,20 @@ class ResumeBuilderGUI:
             focus_areas = [area.strip() for area in focus_areas_text.split(',') if area.strip()]
             
             if edu['institution'].get() and edu['degree'].get():
-                self.resume_builder.add_education(
-                    institution=edu['institution'].get(),
-                    location=edu['location'].get(),
-                    degree=edu['degree'].get(),
-                    field=edu['field'].get(),
-                    start_date=edu['start_date'].get(),
-                    end_date=edu['end_date'].get(),
-                    focus_areas=focus_areas
-                )
+                data['education'].append({
+                    'institution': edu['institution'].get(),
+                    'location': edu['location'].get(),
+                    'degree': edu['degree'].get(),
+                    'field': edu['field'].get(),
+                    'start_date': edu['start_date'].get(),
+                    'end_date': edu['end_date'].get(),
+                    'focus_areas': focus_areas
+                })
         
         # Skills
-        programming_skills = [skill.strip() for skill in self.programming_var.get().split(',') if skill.strip()]
-        technical_skills = [skill.strip() for skill in self.technical_var.get().split(',') if skill.strip()]
-        software_skills = [skill.strip() for skill in self.software_var.get().split(',') if skill.strip()]
-        
-        self.resume_builder.add_skills(
-            programming=programming_skills,
-            technical=technical_skills,
-            software=software_skills
-        )
+        for category, var in (('programming', self.programming_var), ('technical', self.technical_var),
+                              ('software', self.software_var)):
+            data['skills'][category] = [skill.strip() for skill in var.get().split(',') if skill.strip()]
         
         # Projects
         for proj in self.projects_list:
@@ -972,40 +840,134 @@ class ResumeBuilderGUI:
             description = [line.strip() for line in description_text.split('\n') if line.strip()]
             
             if proj['title'].get():
-                self.resume_builder.add_project(
-                    title=proj['title'].get(),
-                    subtitle=proj['subtitle'].get(),
-                    location=proj['location'].get(),
-                    date_range=proj['date_range'].get(),
-                    description=description
-                )
+                data['projects'].append({
+                    'title': proj['title'].get(),
+                    'subtitle': proj['subtitle'].get(),
+                    'location': proj['location'].get(),
+                    'date_range': proj['date_range'].get(),
+                    'description': description
+                })
         
         # Certifications
         for cert in self.certifications_list:
             if cert['name'].get() and cert['issuer'].get():
-                self.resume_builder.add_certification(
-                    name=cert['name'].get(),
-                    issuer=cert['issuer'].get()
-                )
+                data['certifications'].append({
+                    'name': cert['name'].get(),
+                    'issuer': cert['issuer'].get()
+                })
+        return data
+    
+    def collect_data(self):
+        """Collect all data from the GUI into the builder"""
+        # The builder is kept, so unchanged entries reuse their flowables
+        self.resume_builder.resume_data = self.form_data()
     
     def generate_pdf(self):
-        """Generate PDF resume"""
+        """Generate PDF resume on a background thread"""
+        if self._render_thread is not None:
+            return
+        
         try:
-            self.collect_data()
-            
             # Ask for filename
             filename = filedialog.asksaveasfilename(
                 defaultextension=".pdf",
                 filetypes=[("PDF files", "*.pdf")],
                 title="Save Resume As"
             )
+            if not filename:
+                return
             
-            if filename:
-                self.resume_builder.generate_pdf(filename)
-                messagebox.showinfo("Success", f"Resume generated successfully!\nSaved as: {filename}")
-            
+            # Only the widget reads happen here; the worker builds the resume (and imports reportlab).
+            # form_data() returns a fresh dict, so later edits cannot race with the render
+            resume_data = self.form_data()
+            fit_one_page = self.fit_one_page_var.get()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate PDF:\n{str(e)}")
+            return
+        
+        self._render_cancel = threading.Event()
+        self._render_queue = queue.Queue()
+        self._render_thread = threading.Thread(
+            target=self._render_worker,
+            args=(resume_data, filename, fit_one_page, self._render_cancel, self._render_queue),
+            daemon=True
+        )
+        self._set_rendering(True)
+        self.status_var.set("Generating PDF...")
+        self._render_thread.start()
+        self.root.after(RENDER_POLL_MS, self._poll_render)
+    
+    def _render_worker(self, resume_data, filename, fit_one_page, cancel_event, results):
+        """Build the resume from the form snapshot and render it off the Tk thread; talks to the UI only through the results queue"""
+        try:
+            from resume_builder import RenderCancelled
+        except ImportError as e:
+            results.put(('error', str(e)))
+            return
+        try:
+            if self._render_builder is None:
+                self._render_builder = _new_builder()
+            builder = self._render_builder
+            builder.resume_data = resume_data
+            if fit_one_page:
+                builder.fit_to_pages(1)
+            else:
+                builder.set_scale(1.0)
+            builder.generate_pdf(filename, cancel_event=cancel_event,
+                                 progress=lambda fraction: results.put(('progress', fraction)))
+            results.put(('done', filename))
+        except RenderCancelled:
+            results.put(('cancelled', filename))
+        except Exception as e:
+            results.put(('error', str(e)))
+    
+    def _poll_render(self):
+        """Apply progress and the final result of the background render on the Tk thread"""
+        progress = None
+        result = None
+        try:
+            while True:
+                kind, value = self._render_queue.get_nowait()
+                if kind == 'progress':
+                    progress = value
+                else:
+                    result = (kind, value)
+        except queue.Empty:
+            pass
+        
+        if progress is not None:
+            self.render_progress['value'] = progress * 100
+        if result is None:
+            self.root.after(RENDER_POLL_MS, self._poll_render)
+            return
+        
+        self._render_thread = None
+        self._set_rendering(False)
+        kind, value = result
+        if kind == 'done':
+            self.render_progress['value'] = 100
+            self.status_var.set(f"Saved: {value}")
+            messagebox.showinfo("Success", f"Resume generated successfully!\nSaved as: {value}")
+        elif kind == 'cancelled':
+            self.render_progress['value'] = 0
+            self.status_var.set("Generation cancelled")
+        else:
+            self.render_progress['value'] = 0
+            self.status_var.set("Generation failed")
+            messagebox.showerror("Error", f"Failed to generate PDF:\n{value}")
+    
+    def cancel_render(self):
+        """Ask the running render to stop at the next flowable"""
+        if self._render_cancel is not None:
+            self._render_cancel.set()
+            self.status_var.set("Cancelling...")
+    
+    def _set_rendering(self, rendering):
+        """Toggle the Generate/Cancel buttons so renders never overlap"""
+        self.generate_button.configure(state=tk.DISABLED if rendering else tk.NORMAL)
+        self.cancel_button.configure(state=tk.NORMAL if rendering else tk.DISABLED)
+        if rendering:
+            self.render_progress['value'] = 0
     
     def preview_data(self):
         """Preview collected data"""
@@ -1025,7 +987,7 @@ class ResumeBuilderGUI:
             preview_text.pack(fill=tk.BOTH, expand=True)
             
             # Display data
-            data_str = json.dumps(self.resume_builder.resume_data, indent=2, ensure_ascii=False)
+            data_str = json.dumps(self.resume_builder.resume_data.to_dict(), indent=2, ensure_ascii=False)
             preview_text.insert("1.0", data_str)
             preview_text.config(state=tk.DISABLED)
             
@@ -1044,7 +1006,7 @@ class ResumeBuilderGUI:
             )
             
             if filename:
-                self.resume_builder.save_data_to_json(filename)
+                self.resume_builder.save_data_to_json(filename, keep_history=True)
                 messagebox.showinfo("Success", f"Data saved successfully!\nSaved as: {filename}")
             
         except Exception as e:
@@ -1068,14 +1030,60 @@ class ResumeBuilderGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data:\n{str(e)}")
     
+    def save_to_store(self):
+        """Save data to the resume store under an id (a new id when left empty)"""
+        try:
+            self.collect_data()
+            
+            resume_id = simpledialog.askstring(
+                "Save by ID", f"Resume id in {self.store_location} (leave empty for a new id):",
+                initialvalue=self.store_id or '', parent=self.root)
+            if resume_id is None:
+                return
+            
+            self.store_id = self.resume_builder.save_to_store(self.store, resume_id.strip() or None)
+            messagebox.showinfo("Success", f"Data saved successfully!\nSaved as id: {self.store_id}")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save data:\n{str(e)}")
+    
+    def load_from_store(self):
+        """Load data from the resume store by id"""
+        try:
+            resume_id = simpledialog.askstring(
+                "Load by ID", f"Resume id in {self.store_location}:",
+                initialvalue=self.store_id or '', parent=self.root)
+            if not resume_id:
+                return
+            
+            resume_id = resume_id.strip()
+            if self.resume_builder.load_from_store(self.store, resume_id):
+                self.store_id = resume_id
+                self.populate_gui_from_data()
+                messagebox.showinfo("Success", "Data loaded successfully!")
+            else:
+                messagebox.showerror("Error", f"No resume with id {resume_id} in {self.store_location}")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load data:\n{str(e)}")
+    
     def load_existing_data(self):
         """Load existing sample data if available"""
-        if self.resume_builder.load_data_from_json("resume_data.json"):
-            self.populate_gui_from_data()
+        # Parsed here rather than through the builder so startup does not import reportlab
+        try:
+            with open(DATA_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.status_var.set(f"Could not load {DATA_FILE}: {e}")
+            return
+        self.populate_gui_from_data(data)
     
-    def populate_gui_from_data(self):
-        """Populate GUI fields from loaded data"""
-        data = self.resume_builder.resume_data
+    def populate_gui_from_data(self, data=None):
+        """Populate GUI fields from loaded data (the builder's data by default)"""
+        if data is None:
+            data = self.resume_builder.resume_data
         
         # Personal info
         self.name_var.set(data['personal_info'].get('name', ''))
@@ -1236,7 +1244,7 @@ class ResumeBuilderGUI:
 
 def create_sample_resume():
     """Create a sample resume similar to the provided example"""
-    resume = ResumeBuilder()
+    resume = _new_builder()
     
     # Personal information
     resume.add_personal_info(
@@ -1343,7 +1351,25 @@ def create_sample_resume():
     return resume
 
 
+def report_startup(app):
+    """Print the startup timings as JSON and close the window once loading has finished"""
+    if 'ready' not in app.startup_times:
+        app.root.after(10, report_startup, app)
+        return
+    report = {name: round(ms, 1) for name, ms in app.startup_times.items()}
+    report['target_ms'] = STARTUP_TARGET_MS
+    report['reportlab_imported'] = 'reportlab' in sys.modules
+    report['within_target'] = app.startup_times['first_paint'] <= STARTUP_TARGET_MS
+    print(json.dumps(report))
+    app.root.destroy()
+
+
 if __name__ == "__main__":
+    store = DEFAULT_STORE
+    if '--store' in sys.argv[:-1]:
+        store = sys.argv[sys.argv.index('--store') + 1]
     root = tk.Tk()
-    app = ResumeBuilderGUI(root)
+    app = ResumeBuilderGUI(root, store=store, autosave=None if '--no-autosave' in sys.argv else DATA_FILE)
+    if '--startup-report' in sys.argv:
+        report_startup(app)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,301 @@
+"""Revision history for saved resume data, stored as structural JSON deltas.
+
+RevisionStore keeps the history of one resume in an append-only JSONL file next
+to it (resume_data.json -> resume_data.history.jsonl). Each commit() appends
+one line. Usually that line is a delta against the previous revision: the list
+of changes needed to turn one resume into the next. So the file grows with the
+size of the edits, not with the size of the resume. Every SNAPSHOT_EVERY
+revisions (and whenever a delta would be larger) the whole resume is stored
+instead. Materializing a revision therefore reads one snapshot and at most
+SNAPSHOT_EVERY - 1 deltas.
+
+A delta is a list of operations on paths of dict keys and list indexes:
+
+    ["set", path, value]                     add or replace a value
+    ["del", path]                            remove a dict key
+    ["splice", path, start, count, items]    replace count list items at start
+
+Lists are matched item by item, so editing one bullet stores that bullet, and
+inserting a job stores only the new job.
+
+Run from the repository root:
+    python resume_history.py log resume_data.json
+    python resume_history.py diff resume_data.json 3 5
+    python resume_history.py show resume_data.json 3
+    python resume_history.py restore resume_data.json 3
+"""
+import argparse
+import difflib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# A full snapshot is stored at least this often, bounding the deltas applied per checkout
+SNAPSHOT_EVERY = 20
+
+
+def history_path(filename):
+    """The history file kept for a resume JSON file"""
+    return Path(filename).with_suffix('.history.jsonl')
+
+
+def _canonical(data):
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def diff(old, new, path=()):
+    """The delta (a list of operations) that turns old into new"""
+    ops = []
+    _diff(old, new, list(path), ops)
+    return ops
+
+
+def _diff(old, new, path, ops):
+    if type(old) is not type(new):
+        ops.append(['set', path, new])
+    elif isinstance(old, dict):
+        for key in old:
+            if key not in new:
+                ops.append(['del', path + [key]])
+        for key, value in new.items():
+            if key not in old:
+                ops.append(['set', path + [key], value])
+            elif old[key] != value:
+                _diff(old[key], value, path + [key], ops)
+    elif isinstance(old, list):
+        _diff_list(old, new, path, ops)
+    elif old != new:
+        ops.append(['set', path, new])
+
+
+def _diff_list(old, new, path, ops):
+    # Blocks are emitted last to first, so the indexes of earlier blocks still hold when applied in order
+    matcher = difflib.SequenceMatcher(None, [_canonical(item) for item in old],
+                                      [_canonical(item) for item in new], autojunk=False)
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        if tag == 'equal':
+            continue
+        paired = min(i2 - i1, j2 - j1)
+        if i2 - i1 != j2 - j1:
+            ops.append(['splice', path, i1 + paired, i2 - i1 - paired, new[j1 + paired:j2]])
+        # Changed items at the same place are diffed, so one edited bullet is one small operation
+        for k in reversed(range(paired)):
+            _diff(old[i1 + k], new[j1 + k], path + [i1 + k], ops)
+
+
+def apply(data, delta):
+    """Apply a delta to data in place; returns the result (a new object when the root is replaced)"""
+    for op in delta:
+        kind, path = op[0], op[1]
+        if not path:
+            if kind != 'set':
+                raise ValueError(f"Cannot {kind} the root of a resume")
+            data = op[2]
+            continue
+        parent = data
+        for key in path[:-1]:
+            parent = parent[key]
+        key = path[-1]
+        if kind == 'set':
+            parent[key] = op[2]
+        elif kind == 'del':
+            del parent[key]
+        elif kind == 'splice':
+            target = parent[key]
+            start, count, items = op[2], op[3], op[4]
+            target[start:start + count] = items
+        else:
+            raise ValueError(f"Unknown delta operation '{kind}'")
+    return data
+
+
+def describe(delta):
+    """One readable line per operation of a delta"""
+    lines = []
+    for op in delta:
+        kind, path = op[0], op[1]
+        where = ''.join(f'[{key}]' if isinstance(key, int) else f'.{key}' for key in path).lstrip('.') or '(root)'
+        if kind == 'set':
+            lines.append(f"{where} = {json.dumps(op[2], ensure_ascii=False)}")
+        elif kind == 'del':
+            lines.append(f"{where} removed")
+        else:
+            start, count, items = op[2], op[3], op[4]
+            if count:
+                lines.append(f"{where}[{start}:{start + count}] removed")
+            for offset, item in enumerate(items):
+                lines.append(f"{where}[{start + offset}] inserted {json.dumps(item, ensure_ascii=False)}")
+    return lines
+
+
+class RevisionStore:
+    """Append-only revision history of one resume; revisions are numbered from 1"""
+
+    def __init__(self, path, snapshot_every=SNAPSHOT_EVERY):
+        self.path = Path(path)
+        self.snapshot_every = snapshot_every
+        self._records = []  # (rev, time, message, is_snapshot, raw line), in order
+        self._head = None   # canonical JSON of the latest revision
+        self._torn_at = None  # byte size of the intact part when the last line is unfinished
+        self.load()
+
+    def load(self):
+        """Read the history file; an unfinished last line (an interrupted commit) is ignored"""
+        self._records = []
+        self._head = None
+        self._torn_at = None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        for line_no, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if line_no == len(lines):
+                    self._torn_at = sum(len(intact.encode('utf-8')) for intact in lines[:-1])
+                    break
+                raise ValueError(f"{self.path}:{line_no}: corrupt revision record") from None
+            self._records.append((record['rev'], record['time'], record.get('message', ''),
+                                  'snapshot' in record, line))
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def head(self):
+        """Number of the latest revision (0 when there is none)"""
+        return self._records[-1][0] if self._records else 0
+
+    def revisions(self):
+        """[{rev, time, message, snapshot}] oldest first"""
+        return [{'rev': rev, 'time': when, 'message': message, 'snapshot': is_snapshot}
+                for rev, when, message, is_snapshot, _ in self._records]
+
+    def _position(self, rev):
+        if not self._records:
+            raise KeyError(rev)
+        position = rev - self._records[0][0]
+        if rev < 1 or not 0 <= position < len(self._records) or self._records[position][0] != rev:
+            raise KeyError(rev)
+        return position
+
+    def checkout(self, rev=None):
+        """The resume data as of rev (the latest revision by default); KeyError for an unknown rev"""
+        position = self._position(self.head if rev is None else rev)
+        start = position
+        while not self._records[start][3]:
+            start -= 1
+        data = json.loads(self._records[start][4])['snapshot']
+        for _, _, _, _, line in self._records[start + 1:position + 1]:
+            data = apply(data, json.loads(line)['delta'])
+        return data
+
+    def diff(self, rev_a, rev_b=None):
+        """The delta from revision rev_a to rev_b (the latest revision by default)"""
+        return diff(self.checkout(rev_a), self.checkout(rev_b))
+
+    def commit(self, data, message=''):
+        """Record data as a new revision; returns its number, or None when nothing changed"""
+        data = data.to_dict() if hasattr(data, 'to_dict') else data
+        canonical = _canonical(data)
+        if self._records and self._head is None:
+            self._head = _canonical(self.checkout())
+        if canonical == self._head:
+            return None
+
+        rev = self.head + 1
+        record = {'rev': rev, 'time': time.time(), 'message': message}
+        since_snapshot = 0
+        for _, _, _, is_snapshot, _ in reversed(self._records):
+            if is_snapshot:
+                break
+            since_snapshot += 1
+        if self._records and since_snapshot + 1 < self.snapshot_every:
+            delta = diff(json.loads(self._head), data)
+            # A rewrite of most of the resume is cheaper to store whole
+            if len(_canonical(delta)) < len(canonical):
+                record['delta'] = delta
+        if 'delta' not in record:
+            record['snapshot'] = data
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+        if self._torn_at is not None:
+            os.truncate(self.path, self._torn_at)
+            self._torn_at = None
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._records.append((rev, record['time'], message, 'snapshot' in record, line))
+        self._head = canonical
+        return rev
+
+    def restore(self, rev, message=None):
+        """Commit the data of rev again as the newest revision; returns (new revision, data)"""
+        data = self.checkout(rev)
+        new_rev = self.commit(data, message if message is not None else f"Restore revision {rev}")
+        return new_rev, data
+
+
+def _write_json(filename, data):
+    temp = Path(str(filename) + '.tmp')
+    with open(temp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(temp, filename)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Revision history of a saved resume")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    log_parser = subparsers.add_parser('log', help="List revisions")
+    log_parser.add_argument('resume', help="Resume JSON file (its history is <name>.history.jsonl)")
+    commit_parser = subparsers.add_parser('commit', help="Record the file's current content as a revision")
+    commit_parser.add_argument('resume', help="Resume JSON file")
+    commit_parser.add_argument('-m', '--message', default='', help="Revision message")
+    diff_parser = subparsers.add_parser('diff', help="Show the changes between two revisions")
+    diff_parser.add_argument('resume', help="Resume JSON file")
+    diff_parser.add_argument('rev_a', type=int)
+    diff_parser.add_argument('rev_b', type=int, nargs='?', default=None, help="Default: the latest revision")
+    show_parser = subparsers.add_parser('show', help="Print a revision as JSON")
+    show_parser.add_argument('resume', help="Resume JSON file")
+    show_parser.add_argument('rev', type=int)
+    restore_parser = subparsers.add_parser('restore', help="Write a revision back to the file as a new revision")
+    restore_parser.add_argument('resume', help="Resume JSON file")
+    restore_parser.add_argument('rev', type=int)
+    args = parser.parse_args(argv)
+
+    history = RevisionStore(history_path(args.resume))
+    try:
+        if args.command == 'log':
+            for revision in history.revisions():
+                stamp = datetime.fromtimestamp(revision['time']).strftime('%Y-%m-%d %H:%M:%S')
+                kind = 'snapshot' if revision['snapshot'] else 'delta'
+                print(f"{revision['rev']}\t{stamp}\t{kind}\t{revision['message']}")
+        elif args.command == 'commit':
+            with open(args.resume, 'r', encoding='utf-8') as f:
+                rev = history.commit(json.load(f), args.message)
+            print(f"Recorded revision {rev}" if rev else "No changes since the last revision")
+        elif args.command == 'diff':
+            for line in describe(history.diff(args.rev_a, args.rev_b)):
+                print(line)
+        elif args.command == 'show':
+            print(json.dumps(history.checkout(args.rev), indent=2, ensure_ascii=False))
+        else:
+            rev, data = history.restore(args.rev)
+            _write_json(args.resume, data)
+            print(f"Restored revision {args.rev} to {args.resume}" + (f" as revision {rev}" if rev else ""))
+    except KeyError as e:
+        print(f"No revision {e.args[0]} in {history.path}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""Keyword extraction shared by resume tailoring and the resume search index.
+
+Text is case-folded and split into keywords that keep technology names whole
+(node.js, scikit-learn, CI/CD, C++, C#). Compound keywords also yield their
+parts, so "Python/Django" matches both "python" and "django". Common English
+and German function words are dropped.
+"""
+import re
+
+# Keywords: words with their inner dots, dashes, slashes, pluses and hashes
+_TOKEN = re.compile(r"[^\W_][\w+#]*(?:[./-][\w+#]+)*")
+_COMPOUND = re.compile(r"[./-]")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or our the their to was were will with
+you your we us this that these those who what which all any can must should not but also more other such
+der die das den dem des ein eine einer eines einem einen und oder mit von zu zur zum im in ist sind für auf
+aus bei bis durch als auch wir sie ihr ihre unser unsere nicht nach über unter sowie
+""".split())
+
+
+def tokenize(text):
+    """Lower-cased keywords of text; compound keywords also yield their parts"""
+    terms = []
+    for token in _TOKEN.findall(str(text).casefold()):
+        if token not in STOPWORDS:
+            terms.append(token)
+        if _COMPOUND.search(token):
+            terms.extend(part for part in _COMPOUND.split(token) if part and part not in STOPWORDS)
+    return terms
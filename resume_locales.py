@@ -0,0 +1,49 @@
+"""Section titles and field labels printed on the resume, per locale.
+
+The builders look every fixed piece of text up in the catalog of their locale
+(ResumeBuilder(locale='en') or set_locale('en')) instead of hard-coding it.
+German stays the default, so existing output is unchanged. Add a locale by
+adding a catalog with the same keys.
+"""
+
+DEFAULT_LOCALE = 'de'
+
+LOCALES = {
+    'de': {
+        'profile': 'Berufsprofil',
+        'experience': 'Berufliche Erfahrung',
+        'education': 'AUSBILDUNG',
+        'skills': 'Technische Fähigkeiten',
+        'projects': 'PROJEKT ARBEITEN',
+        'certifications': 'Zertifikate',
+        'technologies': 'Technologien:',
+        'focus_areas': 'Schwerpunkt:',
+        'programming': 'Programmiersprachen:',
+        'technical': 'Technische Fähigkeiten:',
+        'software': 'Software-Entwicklung:',
+        'degree_in': 'in',
+        'issued_by': 'Herausgegeben von',
+    },
+    'en': {
+        'profile': 'Professional Profile',
+        'experience': 'Professional Experience',
+        'education': 'EDUCATION',
+        'skills': 'Technical Skills',
+        'projects': 'PROJECTS',
+        'certifications': 'Certifications',
+        'technologies': 'Technologies:',
+        'focus_areas': 'Focus:',
+        'programming': 'Programming Languages:',
+        'technical': 'Technical Skills:',
+        'software': 'Software Development:',
+        'degree_in': 'in',
+        'issued_by': 'Issued by',
+    },
+}
+
+
+def get_labels(locale=DEFAULT_LOCALE):
+    """The label catalog for locale (shared; do not modify)"""
+    if locale not in LOCALES:
+        raise ValueError(f"Unknown locale '{locale}'. Available locales: {', '.join(LOCALES)}")
+    return LOCALES[locale]
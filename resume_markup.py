@@ -0,0 +1,45 @@
+"""Compile resume text into paragraph fragments once.
+
+User text is escaped before it is combined with the builder's own markup, so
+stray angle brackets or ampersands ("<50ms", "AT&T") are shown literally and
+never reach ReportLab's markup parser as tags. The parsed fragments of every
+markup string are cached per paragraph style, so repeated text (section titles,
+shared boilerplate across a batch, re-renders) is parsed only once per process.
+"""
+from functools import lru_cache
+from xml.sax.saxutils import escape as _xml_escape
+
+from reportlab.platypus import Paragraph
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaParser
+
+# Distinct (markup, style) pairs whose fragments are kept
+MARKUP_CACHE_SIZE = 8192
+
+_ATTR_ENTITIES = {'"': '&quot;'}
+
+
+def escape(text):
+    """Escape user text for use inside paragraph markup"""
+    return _xml_escape(str(text))
+
+
+def escape_attr(text):
+    """Escape user text for use inside a double-quoted markup attribute (e.g. href)"""
+    return _xml_escape(str(text), _ATTR_ENTITIES)
+
+
+@lru_cache(maxsize=MARKUP_CACHE_SIZE)
+def compile_markup(markup, style):
+    """Parse trusted markup for style into paragraph fragments (cached; do not modify the result)"""
+    parser = ParaParser()
+    _, frags, _ = parser.parse(cleanBlockQuotedText(markup), style)
+    if frags is None:
+        raise ValueError(f"Paragraph markup error ({parser.errors[0]}) in {markup[:30]!r}")
+    textTransformFrags(frags, style)
+    return tuple(frags)
+
+
+def paragraph(markup, style):
+    """Paragraph for trusted markup (user text already escaped), skipping the parse when cached"""
+    return Paragraph(markup, style, frags=list(compile_markup(markup, style)))
@@ -0,0 +1,131 @@
+"""Opt-in render instrumentation.
+
+Any callable can be passed as ResumeBuilder(instrumentation=...). After every
+render it receives one report dict:
+
+    cached         True when the PDF came from the output cache (no layout ran)
+    sections       seconds per _create_* step, e.g. {'header': 0.0004, 'experience_section': 0.003}
+    story_seconds  time to build the story (sum of sections)
+    build_seconds  time spent in doc.build (platypus layout and PDF writing)
+    total_seconds  wall time of the whole render
+    bytes          size of the PDF written
+    pages          pages in the PDF (None for cache hits)
+    flowables      top-level flowables in the story (None for cache hits)
+    reused, built  section entries taken from / added to the flowable cache
+
+RenderMetrics is such a callable. It aggregates the reports into counters and
+histograms and renders them in Prometheus text format for long-running
+processes such as resume_service.
+"""
+import threading
+
+# Histogram buckets (upper bounds) for the different observations
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PAGES_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+BYTES_BUCKETS = (8192, 16384, 32768, 65536, 131072, 262144, 524288, 1048576, 4194304)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def lines(self, name, labels=''):
+        """Exposition lines for this histogram; labels is e.g. 'section="header"'"""
+        sep = ',' if labels else ''
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels}{sep}le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels}{sep}le="+Inf"}} {self.count}')
+        suffix = f'{{{labels}}}' if labels else ''
+        lines.append(f'{name}_sum{suffix} {self.sum:.6f}')
+        lines.append(f'{name}_count{suffix} {self.count}')
+        return lines
+
+
+class RenderMetrics:
+    """Thread-safe instrumentation sink aggregating render reports for Prometheus"""
+
+    def __init__(self, prefix='resume_render'):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.renders = {'true': 0, 'false': 0}
+        self.bytes_total = 0
+        self.pages_total = 0
+        self.flowables_total = 0
+        self.entries_reused = 0
+        self.entries_built = 0
+        self.total_seconds = Histogram(SECONDS_BUCKETS)
+        self.story_seconds = Histogram(SECONDS_BUCKETS)
+        self.build_seconds = Histogram(SECONDS_BUCKETS)
+        self.section_seconds = {}
+        self.pages = Histogram(PAGES_BUCKETS)
+        self.bytes = Histogram(BYTES_BUCKETS)
+
+    def __call__(self, report):
+        with self._lock:
+            self.renders['true' if report['cached'] else 'false'] += 1
+            self.bytes_total += report['bytes']
+            self.bytes.observe(report['bytes'])
+            self.total_seconds.observe(report['total_seconds'])
+            if report['cached']:
+                return
+            self.pages_total += report['pages']
+            self.flowables_total += report['flowables']
+            self.entries_reused += report['reused']
+            self.entries_built += report['built']
+            self.pages.observe(report['pages'])
+            self.story_seconds.observe(report['story_seconds'])
+            self.build_seconds.observe(report['build_seconds'])
+            for section, seconds in report['sections'].items():
+                histogram = self.section_seconds.get(section)
+                if histogram is None:
+                    histogram = self.section_seconds[section] = Histogram(SECONDS_BUCKETS)
+                histogram.observe(seconds)
+
+    def prometheus_text(self):
+        """Render all counters and histograms in Prometheus text exposition format"""
+        p = self.prefix
+        with self._lock:
+            lines = [
+                f'# HELP {p}s_total Renders completed, by whether the output cache answered.',
+                f'# TYPE {p}s_total counter',
+            ]
+            for cached in ('false', 'true'):
+                lines.append(f'{p}s_total{{cached="{cached}"}} {self.renders[cached]}')
+            for name, value, help_text in (
+                ('bytes_written_total', self.bytes_total, 'PDF bytes produced.'),
+                ('pages_total', self.pages_total, 'Pages laid out.'),
+                ('flowables_total', self.flowables_total, 'Top-level flowables laid out.'),
+                ('entries_reused_total', self.entries_reused, 'Section entries reused from the flowable cache.'),
+                ('entries_built_total', self.entries_built, 'Section entries built from scratch.'),
+            ):
+                lines += [f'# HELP {p}_{name} {help_text}', f'# TYPE {p}_{name} counter', f'{p}_{name} {value}']
+            for name, histogram, help_text in (
+                ('seconds', self.total_seconds, 'Wall time of a whole render.'),
+                ('story_seconds', self.story_seconds, 'Time spent building the story.'),
+                ('build_seconds', self.build_seconds, 'Time spent in doc.build.'),
+                ('pages', self.pages, 'Pages per rendered PDF.'),
+                ('bytes', self.bytes, 'Size of each rendered PDF.'),
+            ):
+                lines += [f'# HELP {p}_{name} {help_text}', f'# TYPE {p}_{name} histogram']
+                lines += histogram.lines(f'{p}_{name}')
+            lines += [f'# HELP {p}_section_seconds Time spent in each _create_* step.',
+                      f'# TYPE {p}_section_seconds histogram']
+            for section in sorted(self.section_seconds):
+                lines += self.section_seconds[section].lines(f'{p}_section_seconds', f'section="{section}"')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,271 @@
+"""Slotted records holding resume data.
+
+Each record converts losslessly to and from the save_data_to_json format with
+from_dict()/to_dict(). Known fields missing from the input read as empty ('' for
+strings, [] for lists, an empty record for personal_info and skills), so the
+renderers can index any field, but they are left out of to_dict() while they
+still hold that default. Keys the record does not know (such as the GUI's
+linkedin_display/linkedin_url) are kept in an overflow dict. Records also answer the dict-style lookups the renderers
+use (record['name'], record.get('github')), so code written against the plain
+JSON dicts keeps working.
+"""
+
+
+class _Record:
+    """Base class: slots for the known fields plus an overflow dict for unknown keys"""
+    __slots__ = ('_extra', '_missing')
+    FIELDS = ()
+    LIST_FIELDS = frozenset()
+    # Fields a valid resume may leave out (or set to null, for strings); see validate()
+    OPTIONAL_FIELDS = frozenset()
+    _FIELD_SET = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, **fields):
+        for name in self.FIELDS:
+            if name in fields:
+                value = self._convert(name, fields.pop(name))
+            else:
+                value = [] if name in self.LIST_FIELDS else ''
+            setattr(self, name, value)
+        self._extra = fields or None
+        self._missing = None
+
+    @classmethod
+    def _convert(cls, name, value):
+        """Turn a JSON value into the stored value for field name"""
+        return value
+
+    @classmethod
+    def _default(cls, name):
+        """The value field name reads as when the input does not have it"""
+        return [] if name in cls.LIST_FIELDS else ''
+
+    def _omitted(self, name, value):
+        # A field absent from the input is left out of to_dict() until it holds something else
+        return self._missing is not None and name in self._missing and value == self._default(name)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a save_data_to_json style dict"""
+        record = cls.__new__(cls)
+        extra = None
+        field_set = cls._FIELD_SET
+        for key, value in data.items():
+            if key in field_set:
+                setattr(record, key, cls._convert(key, value))
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        record._extra = extra
+        missing = None
+        if len(data) - (len(extra) if extra else 0) < len(cls.FIELDS):
+            missing = frozenset(name for name in cls.FIELDS if name not in data)
+            for name in missing:
+                setattr(record, name, cls._default(name))
+        record._missing = missing
+        return record
+
+    def _plain(self, name, value):
+        """Turn a stored value back into its JSON value"""
+        return list(value) if type(value) is list else value
+
+    def to_dict(self):
+        """Return the save_data_to_json style dict for this record"""
+        data = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if not self._omitted(name, value):
+                data[name] = self._plain(name, value)
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, self._convert(key, value))
+            if self._missing is not None:
+                self._missing = self._missing - {key}
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key):
+        if key in self._FIELD_SET:
+            return not self._omitted(key, getattr(self, key))
+        return self._extra is not None and key in self._extra
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, other=(), **kwargs):
+        for key, value in dict(other, **kwargs).items():
+            self[key] = value
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+    def __eq__(self, other):
+        if isinstance(other, _Record):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class PersonalInfo(_Record):
+    __slots__ = ('name', 'location', 'email', 'phone', 'linkedin', 'github')
+    FIELDS = __slots__
+    OPTIONAL_FIELDS = frozenset(['linkedin', 'github'])
+
+
+class Experience(_Record):
+    __slots__ = ('job_title', 'company', 'location', 'start_date', 'end_date', 'responsibilities', 'technologies')
+    FIELDS = __slots__
+    LIST_FIELDS = frozenset(['responsibilities'])
+    OPTIONAL_FIELDS = frozenset(['technologies'])
+
+
+class Education(_Record):
+    __slots__ = ('institution', 'location', 'degree', 'field', 'start_date', 'end_date', 'focus_areas')
+    FIELDS = __slots__
+    LIST_FIELDS = frozenset(['focus_areas'])
+    OPTIONAL_FIELDS = LIST_FIELDS
+
+
+class Project(_Record):
+    __slots__ = ('title', 'subtitle', 'location', 'date_range', 'description')
+    FIELDS = __slots__
+    LIST_FIELDS = frozenset(['description'])
+
+
+class Certification(_Record):
+    __slots__ = ('name', 'issuer')
+    FIELDS = __slots__
+
+
+class Skills(_Record):
+    __slots__ = ('programming', 'technical', 'software')
+    FIELDS = __slots__
+    LIST_FIELDS = frozenset(FIELDS)
+    OPTIONAL_FIELDS = LIST_FIELDS
+
+
+class Resume(_Record):
+    """A whole resume; nested sections are records (or lists of records)"""
+    __slots__ = ('personal_info', 'profile_summary', 'experience', 'education', 'skills', 'projects', 'certifications')
+    FIELDS = __slots__
+    LIST_FIELDS = frozenset(['experience', 'education', 'projects', 'certifications'])
+    RECORD_TYPES = {
+        'personal_info': PersonalInfo,
+        'skills': Skills,
+        'experience': Experience,
+        'education': Education,
+        'projects': Project,
+        'certifications': Certification,
+    }
+
+    def __init__(self, **fields):
+        fields.setdefault('personal_info', PersonalInfo())
+        fields.setdefault('skills', Skills())
+        super().__init__(**fields)
+
+    @classmethod
+    def _convert(cls, name, value):
+        record_type = cls.RECORD_TYPES.get(name)
+        if record_type is None:
+            return value
+        if name in cls.LIST_FIELDS:
+            return [item if isinstance(item, record_type) else record_type.from_dict(item) for item in value]
+        return value if isinstance(value, record_type) else record_type.from_dict(value)
+
+    @classmethod
+    def _default(cls, name):
+        if name in cls.RECORD_TYPES and name not in cls.LIST_FIELDS:
+            return cls.RECORD_TYPES[name].from_dict({})
+        return super()._default(name)
+
+    def _plain(self, name, value):
+        if name in self.RECORD_TYPES:
+            if type(value) is list:
+                return [item.to_dict() if isinstance(item, _Record) else dict(item) for item in value]
+            return value.to_dict() if isinstance(value, _Record) else dict(value)
+        return value
+
+
+class ResumeValidationError(ValueError):
+    """Resume data that is missing fields or has the wrong JSON types"""
+
+
+def _check_value(record_type, name, data, where, complete):
+    path = f"{where}{name}"
+    if name not in data:
+        if name in record_type.OPTIONAL_FIELDS or not complete:
+            return
+        raise ResumeValidationError(f"{path} is required")
+    value = data[name]
+    if name in record_type.LIST_FIELDS:
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ResumeValidationError(f"{path} must be a list of strings")
+    elif not isinstance(value, str) and not (value is None and (name in record_type.OPTIONAL_FIELDS or not complete)):
+        raise ResumeValidationError(f"{path} must be a string, got {type(value).__name__}")
+
+
+def _check_record(record_type, data, where, complete):
+    if not isinstance(data, dict):
+        raise ResumeValidationError(f"{where} must be an object, got {type(data).__name__}")
+    for name in record_type.FIELDS:
+        _check_value(record_type, name, data, f"{where}.", complete)
+
+
+def validate(data, complete=True):
+    """Raise ResumeValidationError unless data is a complete resume in the save_data_to_json shape.
+
+    Every known field is required except the OPTIONAL_FIELDS of its record, and
+    must have its JSON type (strings, lists of strings, lists of objects). Only
+    optional string fields may be null. Unknown keys are not checked, except that
+    every skill category must be a list of strings. With complete=False only the
+    types of the fields present are checked and any string field may be null;
+    that is the shape the stores accept.
+    """
+    if not isinstance(data, dict):
+        raise ResumeValidationError(f"resume must be an object, got {type(data).__name__}")
+    for name in Resume.FIELDS:
+        if name not in data:
+            if not complete:
+                continue
+            raise ResumeValidationError(f"{name} is required")
+        record_type = Resume.RECORD_TYPES.get(name)
+        if record_type is None:
+            _check_value(Resume, name, data, '', complete)
+        elif name not in Resume.LIST_FIELDS:
+            _check_record(record_type, data[name], name, complete)
+        elif not isinstance(data[name], list):
+            raise ResumeValidationError(f"{name} must be a list, got {type(data[name]).__name__}")
+        else:
+            for n, item in enumerate(data[name]):
+                _check_record(record_type, item, f"{name}[{n}]", complete)
+    for category, skills in data.get('skills', {}).items():
+        if not isinstance(skills, list) or not all(isinstance(skill, str) for skill in skills):
+            raise ResumeValidationError(f"skills.{category} must be a list of strings")
@@ -0,0 +1,36 @@
+import shutil
+import subprocess
+
+
+class PreviewUnavailable(Exception):
+    """Raised when no PDF rasterizer is installed"""
+
+
+def rasterize_first_page(pdf_bytes, width=360):
+    """Render the first page of a PDF to PNG bytes scaled to the given pixel width.
+
+    Uses PyMuPDF (pip install pymupdf) when available and falls back to poppler's
+    pdftoppm. Raises PreviewUnavailable if neither is installed.
+    """
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        try:
+            import fitz
+        except ImportError:
+            fitz = None
+
+    if fitz is not None:
+        with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+            page = doc[0]
+            zoom = width / page.rect.width
+            return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False).tobytes('png')
+
+    if shutil.which('pdftoppm'):
+        result = subprocess.run(
+            ['pdftoppm', '-png', '-f', '1', '-l', '1', '-scale-to-x', str(width), '-scale-to-y', '-1', '-', '-'],
+            input=pdf_bytes, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+        )
+        return result.stdout
+
+    raise PreviewUnavailable("Install PyMuPDF (pip install pymupdf) or poppler-utils for the live preview")
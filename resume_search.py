@@ -0,0 +1,299 @@
+"""Persistent keyword search over a directory of saved resumes.
+
+SearchIndex keeps an inverted index from keyword to resume for four fields:
+skills (all three categories), the experience technologies strings, education
+focus_areas and bullets (responsibilities and project descriptions). The index
+lives in one JSON file next to the resumes (.resume_index.json), so asking "who
+lists OpenCV and PostgreSQL?" does not open any resume.
+
+update() refreshes the index incrementally. Files whose mtime and size are
+unchanged are skipped without being read. A changed file is hashed, and it is
+re-indexed only when its content differs. Deleted files are dropped. Files that
+do not parse are remembered as invalid under the same signature, so they are
+reported once and read again only after they change.
+
+Queries combine keywords with AND (also implied between terms), OR, NOT and
+parentheses. A trailing * matches a prefix, and a field: qualifier limits a
+term to one field:
+
+    opencv postgresql
+    skills:opencv AND (postgres* OR mysql) NOT focus:robotik
+
+Run from the repository root:
+    python resume_search.py index resumes/
+    python resume_search.py query resumes/ "opencv AND postgres*"
+"""
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from resume_keywords import tokenize
+
+INDEX_FILENAME = '.resume_index.json'
+
+# Bump when the stored format or the keyword extraction changes; older index files are rebuilt
+INDEX_VERSION = 1
+
+FIELDS = ('skills', 'technologies', 'focus_areas', 'bullets')
+
+# Field qualifiers accepted in queries
+FIELD_ALIASES = {
+    'skills': 'skills', 'skill': 'skills',
+    'technologies': 'technologies', 'tech': 'technologies',
+    'focus_areas': 'focus_areas', 'focus': 'focus_areas',
+    'bullets': 'bullets', 'bullet': 'bullets',
+}
+
+_QUERY_TOKEN = re.compile(r'\(|\)|[^\s()]+')
+
+
+class QueryError(ValueError):
+    """A search query that cannot be parsed"""
+
+
+def resume_terms(data):
+    """{field: sorted keywords} for one resume in the save_data_to_json format"""
+    skills = data.get('skills') or {}
+    texts = {
+        'skills': [skill for category in ('programming', 'technical', 'software')
+                   for skill in skills.get(category) or []],
+        'technologies': [exp.get('technologies') or '' for exp in data.get('experience') or []],
+        'focus_areas': [area for edu in data.get('education') or [] for area in edu.get('focus_areas') or []],
+        'bullets': ([bullet for exp in data.get('experience') or [] for bullet in exp.get('responsibilities') or []]
+                    + [desc for project in data.get('projects') or [] for desc in project.get('description') or []]),
+    }
+    return {field: sorted({term for text in values for term in tokenize(text)}) for field, values in texts.items()}
+
+
+class SearchIndex:
+    """Inverted keyword index over the *.json resumes of one directory"""
+
+    def __init__(self, directory, index_path=None):
+        self.directory = Path(directory)
+        self.index_path = Path(index_path) if index_path else self.directory / INDEX_FILENAME
+        self.docs = {}       # file name -> {mtime_ns, size, hash, name, terms}
+        self.invalid = {}    # file name -> {mtime_ns, size, hash, error} for files that did not parse
+        self.postings = {field: {} for field in FIELDS}  # field -> term -> set of file names
+        self._vocabulary = {}  # field -> sorted terms, for prefix queries
+        self.load()
+
+    def load(self):
+        """Read the index file; a missing or outdated file leaves the index empty"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False
+        if stored.get('version') != INDEX_VERSION:
+            return False
+        self.docs = stored['docs']
+        self.invalid = stored.get('invalid', {})
+        self.postings = {field: {term: set(paths) for term, paths in stored['postings'][field].items()}
+                         for field in FIELDS}
+        self._vocabulary = {}
+        return True
+
+    def save(self):
+        """Write the index file atomically"""
+        stored = {
+            'version': INDEX_VERSION,
+            'docs': self.docs,
+            'invalid': self.invalid,
+            'postings': {field: {term: sorted(paths) for term, paths in self.postings[field].items()}
+                         for field in FIELDS},
+        }
+        temp = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp, self.index_path)
+
+    def update(self, save=True):
+        """Bring the index in line with the directory; returns counts of what changed"""
+        # errors: files that failed to parse in this update; invalid: known bad files left unread
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0, 'errors': 0, 'invalid': 0}
+        seen = set()
+        dirty = False
+        for path in sorted(self.directory.glob('*.json')):
+            if path.name.startswith('.'):
+                continue
+            name = path.name
+            seen.add(name)
+            stat = path.stat()
+            doc = self.docs.get(name)
+            known = doc if doc is not None else self.invalid.get(name)
+            if known is not None and known['mtime_ns'] == stat.st_mtime_ns and known['size'] == stat.st_size:
+                stats['unchanged' if doc is not None else 'invalid'] += 1
+                continue
+            raw = path.read_bytes()
+            digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            if known is not None and known['hash'] == digest:
+                # Touched or rewritten with the same content
+                known['mtime_ns'], known['size'] = stat.st_mtime_ns, stat.st_size
+                stats['unchanged' if doc is not None else 'invalid'] += 1
+                dirty = True
+                continue
+            try:
+                data = json.loads(raw)
+                terms = resume_terms(data)
+            except (ValueError, AttributeError, TypeError) as e:
+                error = f"{type(e).__name__}: {e}"
+                print(f"Skipping {path}: {error}", file=sys.stderr)
+                stats['errors'] += 1
+                if doc is not None:
+                    self._remove(name)
+                self.invalid[name] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'hash': digest,
+                                      'error': error}
+                dirty = True
+                continue
+            self.invalid.pop(name, None)
+            if doc is not None:
+                self._remove(name)
+            self.docs[name] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'hash': digest,
+                'name': (data.get('personal_info') or {}).get('name', ''),
+                'terms': terms,
+            }
+            for field, field_terms in terms.items():
+                postings = self.postings[field]
+                for term in field_terms:
+                    postings.setdefault(term, set()).add(name)
+            stats['updated' if doc is not None else 'added'] += 1
+            dirty = True
+        for name in set(self.docs) - seen:
+            self._remove(name)
+            stats['removed'] += 1
+            dirty = True
+        for name in set(self.invalid) - seen:
+            del self.invalid[name]
+            dirty = True
+        self._vocabulary = {}
+        if save and (dirty or not self.index_path.exists()):
+            self.save()
+        return stats
+
+    def _remove(self, name):
+        doc = self.docs.pop(name)
+        for field, field_terms in doc['terms'].items():
+            postings = self.postings[field]
+            for term in field_terms:
+                paths = postings.get(term)
+                if paths is not None:
+                    paths.discard(name)
+                    if not paths:
+                        del postings[term]
+
+    def _matches(self, field, term):
+        """Resumes containing term (a prefix when it ends in *) in field, or in any field when field is None"""
+        fields = FIELDS if field is None else (field,)
+        if term.endswith('*'):
+            prefix = term[:-1].casefold()
+            result = set()
+            for name in fields:
+                vocabulary = self._vocabulary.get(name)
+                if vocabulary is None:
+                    vocabulary = self._vocabulary[name] = sorted(self.postings[name])
+                postings = self.postings[name]
+                for i in range(bisect.bisect_left(vocabulary, prefix), len(vocabulary)):
+                    if not vocabulary[i].startswith(prefix):
+                        break
+                    result |= postings[vocabulary[i]]
+            return result
+        keywords = tokenize(term)
+        if not keywords:
+            return set()
+        # A compound keyword is indexed whole as well, so its first keyword is the full term
+        keyword = keywords[0]
+        result = set()
+        for name in fields:
+            result |= self.postings[name].get(keyword, set())
+        return result
+
+    def search(self, query):
+        """Sorted resume file names matching the query"""
+        tokens = _QUERY_TOKEN.findall(query)
+        if not tokens:
+            return []
+        position, result = self._parse_or(tokens, 0)
+        if position != len(tokens):
+            raise QueryError(f"Unexpected '{tokens[position]}' in query {query!r}")
+        return sorted(result)
+
+    def _parse_or(self, tokens, position):
+        position, result = self._parse_and(tokens, position)
+        while position < len(tokens) and tokens[position].upper() == 'OR':
+            position, right = self._parse_and(tokens, position + 1)
+            result = result | right
+        return position, result
+
+    def _parse_and(self, tokens, position):
+        position, result = self._parse_not(tokens, position)
+        while position < len(tokens) and tokens[position] != ')' and tokens[position].upper() != 'OR':
+            if tokens[position].upper() == 'AND':
+                position += 1
+            position, right = self._parse_not(tokens, position)
+            result = result & right
+        return position, result
+
+    def _parse_not(self, tokens, position):
+        if position >= len(tokens):
+            raise QueryError("Query ends where a term was expected")
+        token = tokens[position]
+        if token.upper() == 'NOT':
+            position, result = self._parse_not(tokens, position + 1)
+            return position, set(self.docs) - result
+        if token == '(':
+            position, result = self._parse_or(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ')':
+                raise QueryError("Missing ')' in query")
+            return position + 1, result
+        if token == ')' or token.upper() in ('AND', 'OR'):
+            raise QueryError(f"Unexpected '{token}' where a term was expected")
+        field, sep, term = token.partition(':')
+        if sep and field.casefold() in FIELD_ALIASES:
+            return position + 1, self._matches(FIELD_ALIASES[field.casefold()], term)
+        return position + 1, self._matches(None, token)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keyword search over a directory of saved resumes")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    index_parser = subparsers.add_parser('index', help="Build or incrementally update the index")
+    index_parser.add_argument('directory', help="Directory of save_data_to_json files")
+    index_parser.add_argument('--index', default=None, help=f"Index file (default: <directory>/{INDEX_FILENAME})")
+    query_parser = subparsers.add_parser('query', help="Search the index (updating it first)")
+    query_parser.add_argument('directory', help="Directory of save_data_to_json files")
+    query_parser.add_argument('query', help="e.g. 'opencv AND (postgres* OR mysql) NOT focus:robotik'")
+    query_parser.add_argument('--index', default=None, help=f"Index file (default: <directory>/{INDEX_FILENAME})")
+    query_parser.add_argument('--no-update', action='store_true', help="Query the index as stored")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = SearchIndex(args.directory, args.index)
+    if args.command == 'index' or not args.no_update:
+        stats = index.update()
+        print(f"Indexed {len(index.docs)} resumes in {time.perf_counter() - start:.2f}s "
+              f"({', '.join(f'{count} {name}' for name, count in stats.items())})", file=sys.stderr)
+    if args.command == 'query':
+        query_start = time.perf_counter()
+        try:
+            names = index.search(args.query)
+        except QueryError as e:
+            print(e, file=sys.stderr)
+            return 2
+        elapsed = (time.perf_counter() - query_start) * 1e3
+        for name in names:
+            print(f"{name}\t{index.docs[name]['name']}")
+        print(f"{len(names)} of {len(index.docs)} resumes match ({elapsed:.2f} ms)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""Local HTTP render service: POST resume JSON, get a PDF back.
+
+Run from the repository root:
+    python resume_service.py --port 8000 --workers 4 --queue-depth 16
+
+Endpoints:
+    POST /render    body is a resume in the save_data_to_json shape, response is application/pdf
+    GET  /metrics   Prometheus text format counters and per-phase render histograms
+    GET  /healthz   liveness check
+
+A body that is not a complete resume (a required field missing, null or of the
+wrong JSON type; see resume_model.validate) gets 400 before it reaches the pool. A 504 only stops the request from waiting: a render that
+has already started cannot be interrupted and keeps its worker and queue slot
+until it finishes, so a burst of slow renders can turn later requests into 503s.
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from resume_batch import init_worker, render_bytes_job
+from resume_builder import ENGINES, THEME_BUILDERS, check_theme
+from resume_locales import LOCALES
+from resume_metrics import RenderMetrics
+from resume_model import validate
+
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class RenderService:
+    """Bounded process pool with a queue-depth limit and per-request timeouts"""
+
+    def __init__(self, workers=None, queue_depth=16, timeout=30.0, theme='standard', cache_dir=None,
+                 font_family=None, font_dir=None, engine=None, locale=None):
+        check_theme(theme)
+        self.workers = workers or os.cpu_count() or 1
+        self.capacity = self.workers + queue_depth
+        self.timeout = timeout
+        self.theme = theme
+        self.cache_dir = cache_dir
+        self.font_family = font_family
+        self.font_dir = font_dir
+        self.engine = engine
+        self.locale = locale
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+        self.in_flight = 0
+        self.requests = {}
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.render_seconds_sum = 0.0
+        self.render_count = 0
+        # Per-phase timings reported back by the workers
+        self.render_metrics = RenderMetrics()
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker,
+                                   initargs=(self.theme, self.cache_dir, None, True, self.font_family, self.font_dir,
+                                             self.engine, self.locale))
+
+    def _release(self, future):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def _submit(self, resume_data):
+        try:
+            return self._pool.submit(render_bytes_job, resume_data)
+        except BrokenProcessPool:
+            # A worker died; replace the pool so later requests can proceed
+            with self._lock:
+                self._pool = self._new_pool()
+            return self._pool.submit(render_bytes_job, resume_data)
+
+    def submit(self, resume_data):
+        """Queue a render, or return None when the queue is full"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return None
+        try:
+            future = self._submit(resume_data)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.in_flight += 1
+        # The slot is held until the worker actually finishes, even after a timeout,
+        # so the queue limit reflects real pool occupancy
+        future.add_done_callback(self._release)
+        return future
+
+    def record(self, status, seconds=None):
+        with self._lock:
+            self.requests[status] = self.requests.get(status, 0) + 1
+            if status == 504:
+                self.timeouts += 1
+            elif status >= 500 and status != 503:
+                self.errors += 1
+            if seconds is not None:
+                self.render_seconds_sum += seconds
+                self.render_count += 1
+
+    def metrics_text(self):
+        """Render the counters in Prometheus text exposition format"""
+        with self._lock:
+            lines = [
+                '# HELP resume_requests_total Render requests by HTTP status.',
+                '# TYPE resume_requests_total counter',
+            ]
+            for status in sorted(self.requests):
+                lines.append(f'resume_requests_total{{code="{status}"}} {self.requests[status]}')
+            lines += [
+                '# HELP resume_rejected_total Requests rejected because the queue was full.',
+                '# TYPE resume_rejected_total counter',
+                f'resume_rejected_total {self.rejected}',
+                '# HELP resume_timeouts_total Requests that exceeded the render timeout.',
+                '# TYPE resume_timeouts_total counter',
+                f'resume_timeouts_total {self.timeouts}',
+                '# HELP resume_errors_total Renders that failed with an error.',
+                '# TYPE resume_errors_total counter',
+                f'resume_errors_total {self.errors}',
+                '# HELP resume_in_flight Renders queued or running.',
+                '# TYPE resume_in_flight gauge',
+                f'resume_in_flight {self.in_flight}',
+                '# HELP resume_queue_capacity Maximum renders queued or running.',
+                '# TYPE resume_queue_capacity gauge',
+                f'resume_queue_capacity {self.capacity}',
+                # resume_render_seconds is the workers' histogram below; this one includes queueing
+                '# HELP resume_request_seconds Wall time of successful render requests, queueing included.',
+                '# TYPE resume_request_seconds summary',
+                f'resume_request_seconds_sum {self.render_seconds_sum:.6f}',
+                f'resume_request_seconds_count {self.render_count}',
+            ]
+        return '\n'.join(lines) + '\n' + self.render_metrics.prometheus_text()
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    server_version = "ResumeRender/1.0"
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body, content_type='text/plain; charset=utf-8', headers=None):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message, headers=None):
+        self.service.record(status)
+        self._send(status, json.dumps({'error': message}), 'application/json', headers)
+
+    def do_GET(self):
+        if self.path == '/metrics':
+            self._send(200, self.service.metrics_text(), 'text/plain; version=0.0.4; charset=utf-8')
+        elif self.path == '/healthz':
+            self._send(200, 'ok\n')
+        else:
+            self._error(404, f"Unknown path {self.path}")
+
+    def do_POST(self):
+        if self.path not in ('/', '/render'):
+            self._error(404, f"Unknown path {self.path}")
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length <= 0:
+            self._error(411, "Content-Length required")
+            return
+        if length > MAX_BODY_BYTES:
+            self._error(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+            return
+        try:
+            resume_data = json.loads(self.rfile.read(length).decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            self._error(400, f"Invalid JSON: {e}")
+            return
+        if not isinstance(resume_data, dict):
+            self._error(400, "Resume JSON must be an object")
+            return
+        try:
+            validate(resume_data)
+        except ValueError as e:
+            self._error(400, f"Invalid resume: {e}")
+            return
+
+        start = time.perf_counter()
+        future = self.service.submit(resume_data)
+        if future is None:
+            self._error(503, "Render queue is full, retry later", {'Retry-After': '1'})
+            return
+        try:
+            pdf, report = future.result(timeout=self.service.timeout)
+        except FutureTimeout:
+            # Only drops a render still waiting in the queue; one already running finishes
+            # on its worker (holding its slot) and its result is discarded
+            future.cancel()
+            self._error(504, f"Render exceeded {self.service.timeout}s")
+            return
+        except Exception as e:
+            self._error(500, f"{type(e).__name__}: {e}")
+            return
+
+        self.service.record(200, time.perf_counter() - start)
+        if report is not None:
+            self.service.render_metrics(report)
+        self._send(200, pdf, 'application/pdf')
+
+
+def serve(host='127.0.0.1', port=8000, verbose=True, **service_options):
+    """Run the render service until interrupted"""
+    service = RenderService(**service_options)
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    print(f"Resume render service on http://{host}:{server.server_port} "
+          f"({service.workers} workers, queue capacity {service.capacity})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP resume render service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Render processes (default: CPU count)")
+    parser.add_argument('-q', '--queue-depth', type=int, default=16, help="Requests allowed to wait beyond the running ones")
+    parser.add_argument('-t', '--timeout', type=float, default=30.0, help="Per-request render timeout in seconds")
+    parser.add_argument('--theme', choices=THEME_BUILDERS, default='standard', help="Layout and style theme")
+    parser.add_argument('--cache-dir', default=None, help="Optional PDF cache directory")
+    parser.add_argument('--font-family', default=None, help="TTF family replacing the base-14 fonts (e.g. DejaVuSans)")
+    parser.add_argument('--font-dir', default=None, help="Directory with the family's .ttf files")
+    parser.add_argument('--engine', choices=ENGINES, default=None, help="Render engine (default: platypus)")
+    parser.add_argument('--locale', choices=LOCALES, default=None, help="Section title language (default: de)")
+    parser.add_argument('--quiet', action='store_true', help="Do not log requests")
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, verbose=not args.quiet, workers=args.workers, queue_depth=args.queue_depth,
+          timeout=args.timeout, theme=args.theme, cache_dir=args.cache_dir,
+          font_family=args.font_family, font_dir=args.font_dir, engine=args.engine,
+          locale=args.locale)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+"""Resume storage addressed by id rather than by file path.
+
+ResumeStore is the interface the builder and the GUI talk to: load(id),
+save(data, id=None), delete(id) and list(). Two stores implement it:
+
+- JSONDirectoryStore keeps one save_data_to_json file per resume, named <id>.json.
+  This is the old loose-file layout, so existing resume directories open as-is.
+- SQLiteStore keeps resumes in normalized tables: one row per resume and one row
+  per experience, education, project, certification and skill, ordered by a
+  position column. Name and skill are indexed, so find(skill='opencv') does
+  not read any resume. The database runs in WAL mode, so readers are not
+  blocked while a save or an import is writing.
+
+Both stores round-trip the save_data_to_json format, including keys they have
+no column for (such as the GUI's linkedin_display/linkedin_url), which are kept
+as JSON next to the row they belong to.
+
+import_path() bulk-loads a directory of JSON files or a JSONL/concatenated-JSON
+corpus, committing every IMPORT_BATCH resumes in one transaction. Files and
+records that do not decode, or whose fields have the wrong JSON types, are
+skipped and reported (to stderr by default) without stopping the import.
+export_directory() and export_jsonl() write everything back out as JSON.
+
+Run from the repository root:
+    python resume_store.py import resumes.db resumes/
+    python resume_store.py export resumes.db exported/
+    python resume_store.py list resumes.db [--skill opencv] [--name "Jane Doe"]
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from resume_corpus import CorpusError, iter_corpus
+from resume_model import Certification, Education, Experience, PersonalInfo, Project, Skills, validate
+
+# Resumes written per transaction by save_many() and import_path()
+IMPORT_BATCH = 500
+
+# File suffixes open_store() treats as SQLite databases
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+# Section -> record type; each section gets a table with one column per record field
+SECTIONS = {
+    'experience': Experience,
+    'education': Education,
+    'projects': Project,
+    'certifications': Certification,
+}
+
+_RESUME_KEYS = frozenset(['personal_info', 'profile_summary', 'skills', *SECTIONS])
+
+
+def _plain(data):
+    """A save_data_to_json dict for data, which may also be a Resume record"""
+    return data.to_dict() if hasattr(data, 'to_dict') else data
+
+
+def _print_error(error):
+    print(f"Skipping {error}", file=sys.stderr)
+
+
+class ResumeStore(ABC):
+    """Interface for resume storage; ids are strings, and an id the store cannot hold raises ValueError"""
+
+    @abstractmethod
+    def load(self, resume_id):
+        """The resume stored under resume_id (a save_data_to_json dict); KeyError if there is none"""
+
+    @abstractmethod
+    def save(self, data, resume_id=None):
+        """Store data under resume_id, or under a new id when None; returns the id"""
+
+    @abstractmethod
+    def delete(self, resume_id):
+        """Remove the resume stored under resume_id; KeyError if there is none"""
+
+    @abstractmethod
+    def list(self):
+        """[(id, name)] for every stored resume"""
+
+    def __contains__(self, resume_id):
+        try:
+            self.load(resume_id)
+        except (KeyError, ValueError):
+            return False
+        return True
+
+    def __len__(self):
+        return len(self.list())
+
+    def save_many(self, resumes):
+        """Store each resume of an iterable under a new id; returns the ids"""
+        return [self.save(data) for data in resumes]
+
+    def iter_resumes(self):
+        """Yield (id, resume) for every stored resume"""
+        for resume_id, _ in self.list():
+            yield resume_id, self.load(resume_id)
+
+    def import_path(self, path, batch_size=IMPORT_BATCH, on_error=None):
+        """Store every resume of a directory of JSON files or a corpus file; returns the count.
+
+        Malformed resumes are skipped and passed to on_error as a CorpusError
+        (printed to stderr by default), as iter_resume_files() reports them.
+        """
+        count = 0
+        batch = []
+        for data in iter_resume_files(path, on_error):
+            batch.append(data)
+            if len(batch) >= batch_size:
+                count += len(self.save_many(batch))
+                batch = []
+        if batch:
+            count += len(self.save_many(batch))
+        return count
+
+    def export_directory(self, directory):
+        """Write every resume to <directory>/<id>.json; returns the count"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        count = 0
+        for resume_id, data in self.iter_resumes():
+            with open(directory / f"{resume_id}.json", 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            count += 1
+        return count
+
+    def export_jsonl(self, path):
+        """Write every resume as one JSON line (with its id under "_id"); returns the count"""
+        count = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            for resume_id, data in self.iter_resumes():
+                f.write(json.dumps(dict(data, _id=resume_id), ensure_ascii=False))
+                f.write('\n')
+                count += 1
+        return count
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_resume_files(path, on_error=None):
+    """Yield each resume dict of a directory of JSON files or a JSONL/concatenated-JSON file.
+
+    Files and records that do not decode, are not objects, or have fields of the
+    wrong JSON types (see resume_model.validate) are skipped and passed to
+    on_error as a CorpusError (printed to stderr by default).
+    """
+    on_error = on_error or _print_error
+    path = Path(path)
+    if path.is_dir():
+        records = _iter_directory(path, on_error)
+    else:
+        records = ((str(path), line_no, data) for line_no, data in iter_corpus(path, on_error=on_error))
+    for source, line_no, data in records:
+        data.pop('_id', None)
+        try:
+            validate(data, complete=False)
+        except ValueError as e:
+            on_error(CorpusError(source, line_no, 1, str(e)))
+            continue
+        yield data
+
+
+def _iter_directory(directory, on_error):
+    """Yield (file, 1, resume dict) for the *.json files of a directory"""
+    for file in sorted(directory.glob('*.json')):
+        if file.name.startswith('.'):
+            continue
+        try:
+            with open(file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            on_error(CorpusError(str(file), e.lineno, e.colno, e.msg))
+            continue
+        except ValueError as e:
+            on_error(CorpusError(str(file), 1, 1, str(e)))
+            continue
+        if not isinstance(data, dict):
+            on_error(CorpusError(str(file), 1, 1, f"expected a JSON object, got {type(data).__name__}"))
+            continue
+        yield str(file), 1, data
+
+
+class JSONDirectoryStore(ResumeStore):
+    """One save_data_to_json file per resume in a directory; the id is the file stem"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, resume_id):
+        resume_id = str(resume_id)
+        if not resume_id or resume_id.startswith('.') or Path(resume_id).name != resume_id:
+            raise ValueError(f"Invalid resume id {resume_id!r}: ids are file names without a directory or leading dot")
+        return self.directory / f"{resume_id}.json"
+
+    def _new_id(self, data):
+        """A free id derived from the resume's name"""
+        name = ((data.get('personal_info') or {}).get('name') or '').strip()
+        stem = re.sub(r'[^\w-]+', '_', name).strip('_').lower() or 'resume'
+        resume_id, n = stem, 1
+        while (self.directory / f"{resume_id}.json").exists():
+            n += 1
+            resume_id = f"{stem}_{n}"
+        return resume_id
+
+    def load(self, resume_id):
+        try:
+            with open(self._path(resume_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise KeyError(resume_id) from None
+
+    def save(self, data, resume_id=None):
+        data = _plain(data)
+        resume_id = self._new_id(data) if resume_id is None else str(resume_id)
+        path = self._path(resume_id)
+        temp = path.with_name(path.name + '.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp, path)
+        return resume_id
+
+    def delete(self, resume_id):
+        try:
+            self._path(resume_id).unlink()
+        except FileNotFoundError:
+            raise KeyError(resume_id) from None
+
+    def list(self):
+        entries = []
+        for path in sorted(self.directory.glob('*.json')):
+            if path.name.startswith('.'):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    name = (json.load(f).get('personal_info') or {}).get('name', '')
+            except (ValueError, AttributeError):
+                continue
+            entries.append((path.stem, name))
+        return entries
+
+
+def _json_or_none(value):
+    return json.dumps(value, ensure_ascii=False) if value else None
+
+
+def _split_known(data, fields):
+    """(values for fields, JSON of the other keys or None); missing fields are None"""
+    extra = {key: value for key, value in data.items() if key not in fields}
+    return [data.get(name) for name in fields], _json_or_none(extra)
+
+
+class SQLiteStore(ResumeStore):
+    """Resumes in normalized SQLite tables; ids are the resumes table's integer keys (as strings)"""
+
+    PERSONAL_FIELDS = PersonalInfo.FIELDS
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        # Durable at every checkpoint; with WAL a crash can lose only the last commits, never corrupt
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('PRAGMA foreign_keys=ON')
+        self._create_schema()
+
+    def _create_schema(self):
+        personal = ', '.join(f'{name} TEXT' + (' COLLATE NOCASE' if name == 'name' else '')
+                             for name in self.PERSONAL_FIELDS)
+        statements = [
+            f"""CREATE TABLE IF NOT EXISTS resumes (
+                id INTEGER PRIMARY KEY,
+                {personal},
+                profile_summary TEXT,
+                personal_extra TEXT,
+                extra TEXT,
+                updated_at REAL
+            )""",
+            "CREATE INDEX IF NOT EXISTS resumes_name ON resumes(name)",
+            """CREATE TABLE IF NOT EXISTS skills (
+                resume_id INTEGER NOT NULL REFERENCES resumes(id) ON DELETE CASCADE,
+                category TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                skill TEXT COLLATE NOCASE,
+                PRIMARY KEY (resume_id, category, position)
+            ) WITHOUT ROWID""",
+            "CREATE INDEX IF NOT EXISTS skills_skill ON skills(skill)",
+        ]
+        for table, record_type in SECTIONS.items():
+            columns = ''.join(f'{name} TEXT, ' for name in record_type.FIELDS)
+            statements.append(f"""CREATE TABLE IF NOT EXISTS {table} (
+                resume_id INTEGER NOT NULL REFERENCES resumes(id) ON DELETE CASCADE,
+                position INTEGER NOT NULL,
+                {columns}extra TEXT,
+                PRIMARY KEY (resume_id, position)
+            ) WITHOUT ROWID""")
+        with self.connection:
+            for statement in statements:
+                self.connection.execute(statement)
+
+    @staticmethod
+    def _key(resume_id):
+        try:
+            return int(resume_id)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid resume id {resume_id!r}: SQLite store ids are integers") from None
+
+    def _write(self, data, key=None):
+        """Insert or replace one resume inside the caller's transaction; returns its key"""
+        data = _plain(data)
+        execute = self.connection.execute
+        personal, personal_extra = _split_known(data.get('personal_info') or {}, self.PERSONAL_FIELDS)
+        extra = _json_or_none({k: v for k, v in data.items() if k not in _RESUME_KEYS})
+        row = [*personal, data.get('profile_summary'), personal_extra, extra, time.time()]
+        columns = ', '.join(self.PERSONAL_FIELDS)
+        if key is None:
+            key = execute(f"INSERT INTO resumes ({columns}, profile_summary, personal_extra, extra, updated_at) "
+                          f"VALUES ({', '.join('?' * (len(row)))})", row).lastrowid
+        else:
+            execute(f"INSERT OR REPLACE INTO resumes (id, {columns}, profile_summary, personal_extra, extra, "
+                    f"updated_at) VALUES ({', '.join('?' * (len(row) + 1))})", [key, *row])
+            for table in ('skills', *SECTIONS):
+                execute(f"DELETE FROM {table} WHERE resume_id = ?", (key,))
+
+        for table, record_type in SECTIONS.items():
+            fields = record_type.FIELDS
+            list_fields = record_type.LIST_FIELDS
+            rows = []
+            for position, item in enumerate(data.get(table) or []):
+                values, item_extra = _split_known(item, fields)
+                for i, name in enumerate(fields):
+                    if name in list_fields and values[i] is not None:
+                        values[i] = json.dumps(values[i], ensure_ascii=False)
+                rows.append((key, position, *values, item_extra))
+            if rows:
+                self.connection.executemany(
+                    f"INSERT INTO {table} VALUES ({', '.join('?' * (len(fields) + 3))})", rows)
+        skill_rows = [(key, category, position, skill)
+                      for category, skills in (data.get('skills') or {}).items()
+                      for position, skill in enumerate(skills or [])]
+        if skill_rows:
+            self.connection.executemany("INSERT INTO skills VALUES (?, ?, ?, ?)", skill_rows)
+        return key
+
+    def save(self, data, resume_id=None):
+        key = None if resume_id is None else self._key(resume_id)
+        with self.connection:
+            key = self._write(data, key)
+        return str(key)
+
+    def save_many(self, resumes):
+        """Store each resume under a new id in one transaction; returns the ids"""
+        with self.connection:
+            return [str(self._write(data)) for data in resumes]
+
+    def delete(self, resume_id):
+        with self.connection:
+            cursor = self.connection.execute("DELETE FROM resumes WHERE id = ?", (self._key(resume_id),))
+        if not cursor.rowcount:
+            raise KeyError(resume_id)
+
+    def list(self):
+        return [(str(key), name) for key, name in
+                self.connection.execute("SELECT id, name FROM resumes ORDER BY id")]
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    def find(self, name=None, skill=None):
+        """[(id, name)] of the resumes with that name and/or listing that skill.
+
+        Matching ignores ASCII case only (SQLite's NOCASE), so "python" finds "Python".
+        """
+        query = "SELECT id, name FROM resumes WHERE 1"
+        params = []
+        if name is not None:
+            query += " AND name = ?"
+            params.append(name)
+        if skill is not None:
+            query += " AND id IN (SELECT resume_id FROM skills WHERE skill = ?)"
+            params.append(skill)
+        return [(str(key), found) for key, found in self.connection.execute(query + " ORDER BY id", params)]
+
+    def load(self, resume_id):
+        key = self._key(resume_id)
+        resumes = self._load_keys([key])
+        if key not in resumes:
+            raise KeyError(resume_id)
+        return resumes[key]
+
+    def iter_resumes(self, batch_size=IMPORT_BATCH):
+        keys = [key for key, in self.connection.execute("SELECT id FROM resumes ORDER BY id")]
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start:start + batch_size]
+            resumes = self._load_keys(chunk)
+            for key in chunk:
+                if key in resumes:
+                    yield str(key), resumes[key]
+
+    def _load_keys(self, keys):
+        """{key: resume dict} for the given keys, reading each table once"""
+        marks = ', '.join('?' * len(keys))
+        execute = self.connection.execute
+        resumes = {}
+        columns = ', '.join(self.PERSONAL_FIELDS)
+        for row in execute(f"SELECT id, {columns}, profile_summary, personal_extra, extra "
+                           f"FROM resumes WHERE id IN ({marks})", keys):
+            key = row[0]
+            personal = {name: value for name, value in zip(self.PERSONAL_FIELDS, row[1:]) if value is not None}
+            if row[-2]:
+                personal.update(json.loads(row[-2]))
+            data = {'personal_info': personal}
+            if row[-3] is not None:
+                data['profile_summary'] = row[-3]
+            for table in SECTIONS:
+                data[table] = []
+            data['skills'] = {category: [] for category in Skills.FIELDS}
+            if row[-1]:
+                data.update(json.loads(row[-1]))
+            resumes[key] = data
+
+        for table, record_type in SECTIONS.items():
+            fields = record_type.FIELDS
+            list_fields = record_type.LIST_FIELDS
+            for row in execute(f"SELECT resume_id, {', '.join(fields)}, extra FROM {table} "
+                               f"WHERE resume_id IN ({marks}) ORDER BY resume_id, position", keys):
+                item = {}
+                for name, value in zip(fields, row[1:]):
+                    if value is not None:
+                        item[name] = json.loads(value) if name in list_fields else value
+                if row[-1]:
+                    item.update(json.loads(row[-1]))
+                resumes[row[0]][table].append(item)
+        for key, category, skill in execute(f"SELECT resume_id, category, skill FROM skills "
+                                            f"WHERE resume_id IN ({marks}) ORDER BY resume_id, category, position",
+                                            keys):
+            resumes[key]['skills'].setdefault(category, []).append(skill)
+        return resumes
+
+    def close(self):
+        self.connection.close()
+
+
+def open_store(location):
+    """SQLiteStore for a .db/.sqlite/.sqlite3 path, JSONDirectoryStore for anything else"""
+    if str(location).lower().endswith(SQLITE_SUFFIXES):
+        return SQLiteStore(location)
+    return JSONDirectoryStore(location)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import, export and list stored resumes")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    store_help = "Resume store: a .db/.sqlite file (SQLite) or a directory of JSON files"
+    import_parser = subparsers.add_parser('import', help="Bulk-import resumes into the store")
+    import_parser.add_argument('store', help=store_help)
+    import_parser.add_argument('source', help="Directory of save_data_to_json files, or a JSONL corpus")
+    import_parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH, help="Resumes per transaction")
+    export_parser = subparsers.add_parser('export', help="Export every stored resume as JSON")
+    export_parser.add_argument('store', help=store_help)
+    export_parser.add_argument('output', help="Directory for <id>.json files, or a .jsonl file")
+    list_parser = subparsers.add_parser('list', help="List stored resumes")
+    list_parser.add_argument('store', help=store_help)
+    list_parser.add_argument('--name', default=None, help="Only resumes with this name (SQLite stores)")
+    list_parser.add_argument('--skill', default=None, help="Only resumes listing this skill (SQLite stores)")
+    args = parser.parse_args(argv)
+
+    skipped = []
+
+    def skip(error):
+        _print_error(error)
+        skipped.append(error)
+
+    start = time.perf_counter()
+    with open_store(args.store) as store:
+        if args.command == 'import':
+            count = store.import_path(args.source, batch_size=args.batch_size, on_error=skip)
+            print(f"Imported {count} resumes in {time.perf_counter() - start:.2f}s: {args.store}", file=sys.stderr)
+            if skipped:
+                print(f"Skipped {len(skipped)} resumes that could not be read", file=sys.stderr)
+        elif args.command == 'export':
+            if args.output.endswith('.jsonl'):
+                count = store.export_jsonl(args.output)
+            else:
+                count = store.export_directory(args.output)
+            print(f"Exported {count} resumes in {time.perf_counter() - start:.2f}s: {args.output}", file=sys.stderr)
+        else:
+            if args.name is not None or args.skill is not None:
+                if not isinstance(store, SQLiteStore):
+                    print("--name and --skill need a SQLite store", file=sys.stderr)
+                    return 2
+                entries = store.find(name=args.name, skill=args.skill)
+            else:
+                entries = store.list()
+            for resume_id, name in entries:
+                print(f"{resume_id}\t{name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
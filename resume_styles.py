@@ -0,0 +1,242 @@
+from functools import lru_cache
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY, TA_RIGHT
+from resume_fonts import register_family, map_font
+
+
+class FrozenStyleSheet(StyleSheet1):
+    """Read-only stylesheet shared by every ResumeBuilder in the process"""
+
+    def __init__(self, styles):
+        super().__init__()
+        self.byName = dict(styles.byName)
+        self.byAlias = dict(styles.byAlias)
+
+    def add(self, style, alias=None):
+        raise TypeError("Shared stylesheets are read-only; use build_stylesheet() for a private copy")
+
+
+def _add_standard_styles(styles):
+    """Helvetica styles matching the LaTeX resume format"""
+    # Name header style
+    styles.add(ParagraphStyle(
+        name='NameHeader',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=2,
+        alignment=TA_CENTER,
+        textColor=colors.black,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Contact info style
+    styles.add(ParagraphStyle(
+        name='ContactInfo',
+        parent=styles['Normal'],
+        fontSize=9,
+        alignment=TA_CENTER,
+        spaceAfter=8,
+        fontName='Helvetica'
+    ))
+
+    # Section header style (like "Berufsprofil", "Berufliche Erfahrung")
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=11,
+        spaceAfter=3,
+        spaceBefore=8,
+        alignment=TA_LEFT,
+        textColor=colors.black,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Job title and company style
+    styles.add(ParagraphStyle(
+        name='JobTitle',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=2,
+        spaceBefore=4,
+        alignment=TA_LEFT,
+        textColor=colors.black,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Bullet point style
+    styles.add(ParagraphStyle(
+        name='BulletPoint',
+        parent=styles['Normal'],
+        fontSize=9,
+        spaceAfter=1,
+        leftIndent=15,
+        bulletIndent=8,
+        alignment=TA_JUSTIFY,
+        fontName='Helvetica'
+    ))
+
+    # Skills category style
+    styles.add(ParagraphStyle(
+        name='SkillCategory',
+        parent=styles['Normal'],
+        fontSize=9,
+        spaceAfter=1,
+        alignment=TA_LEFT,
+        fontName='Helvetica'
+    ))
+
+    # Education/Project title style
+    styles.add(ParagraphStyle(
+        name='SubsectionTitle',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=2,
+        spaceBefore=3,
+        alignment=TA_LEFT,
+        fontName='Helvetica-Bold'
+    ))
+
+    # Date/location style
+    styles.add(ParagraphStyle(
+        name='DateLocation',
+        parent=styles['Normal'],
+        fontSize=9,
+        alignment=TA_RIGHT,
+        fontName='Helvetica'
+    ))
+
+
+def _add_compact_styles(styles):
+    """Times styles with minimal spacing for one-page resume"""
+    # Name header style - MINIMAL spacing
+    styles.add(ParagraphStyle(
+        name='NameHeader',
+        parent=styles['Heading1'],
+        fontSize=14,                # Reduced from 16
+        spaceAfter=1,              # Reduced from 2
+        alignment=TA_CENTER,
+        textColor=colors.black,
+        fontName='Times-Bold'
+    ))
+
+    # Contact info style - MINIMAL spacing
+    styles.add(ParagraphStyle(
+        name='ContactInfo',
+        parent=styles['Normal'],
+        fontSize=9,
+        alignment=TA_CENTER,
+        spaceAfter=4,              # Reduced from 8
+        fontName='Times-Roman'
+    ))
+
+    # Section header style - MINIMAL spacing
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=10,               # Reduced from 11
+        spaceAfter=1,              # Reduced from 3
+        spaceBefore=4,             # Reduced from 8
+        alignment=TA_LEFT,
+        textColor=colors.black,
+        fontName='Times-Bold'
+    ))
+
+    # Job title and company style - MINIMAL spacing
+    styles.add(ParagraphStyle(
+        name='JobTitle',
+        parent=styles['Normal'],
+        fontSize=9,                # Reduced from 10
+        spaceAfter=1,              # Reduced from 2
+        spaceBefore=2,             # Reduced from 4
+        alignment=TA_LEFT,
+        textColor=colors.black,
+        fontName='Times-Bold'
+    ))
+
+    # Bullet point style - MINIMAL spacing
+    styles.add(ParagraphStyle(
+        name='BulletPoint',
+        parent=styles['Normal'],
+        fontSize=8,                # Reduced from 9
+        spaceAfter=0,              # Reduced from 1
+        leftIndent=12,             # Reduced from 15
+        bulletIndent=6,            # Reduced from 8
+        alignment=TA_JUSTIFY,
+        fontName='Times-Roman'
+    ))
+
+    # Skills category style - MINIMAL spacing
+    styles.add(ParagraphStyle(
+        name='SkillCategory',
+        parent=styles['Normal'],
+        fontSize=8,                # Reduced from 9
+        spaceAfter=0,              # Reduced from 1
+        alignment=TA_LEFT,
+        fontName='Times-Roman'
+    ))
+
+    # Education/Project title style - MINIMAL spacing
+    styles.add(ParagraphStyle(
+        name='SubsectionTitle',
+        parent=styles['Normal'],
+        fontSize=9,                # Reduced from 10
+        spaceAfter=1,              # Reduced from 2
+        spaceBefore=1,             # Reduced from 3
+        alignment=TA_LEFT,
+        fontName='Times-Bold'
+    ))
+
+    # Normal style override for general text - MINIMAL spacing
+    styles.add(ParagraphStyle(
+        name='CompactNormal',
+        parent=styles['Normal'],
+        fontSize=8,                # Reduced font size
+        spaceAfter=0,              # No space after
+        spaceBefore=0,             # No space before
+        alignment=TA_JUSTIFY,
+        fontName='Times-Roman'
+    ))
+
+
+THEMES = {
+    'standard': _add_standard_styles,
+    'compact': _add_compact_styles,
+}
+
+
+# Attributes multiplied when a stylesheet is scaled to fit more content on a page
+SCALED_ATTRIBUTES = ('fontSize', 'leading', 'spaceBefore', 'spaceAfter', 'bulletFontSize')
+
+
+def build_stylesheet(theme='standard', scale=1.0, font_family=None):
+    """Build a fresh, private stylesheet for a theme (slow path)
+
+    font_family names a TTF family (see resume_fonts) that replaces the theme's
+    Helvetica/Times faces.
+    """
+    if theme not in THEMES:
+        raise ValueError(f"Unknown theme '{theme}'. Available themes: {', '.join(THEMES)}")
+    styles = getSampleStyleSheet()
+    THEMES[theme](styles)
+    faces = register_family(font_family) if font_family else None
+    for style in styles.byName.values():
+        if not isinstance(style, ParagraphStyle):
+            continue
+        if scale != 1.0:
+            for attr in SCALED_ATTRIBUTES:
+                setattr(style, attr, getattr(style, attr) * scale)
+        if faces is not None:
+            style.fontName = map_font(style.fontName, faces)
+            style.bulletFontName = map_font(style.bulletFontName, faces)
+    return styles
+
+
+@lru_cache(maxsize=128)
+def _shared_stylesheet(theme, scale, font_family):
+    return FrozenStyleSheet(build_stylesheet(theme, scale, font_family))
+
+
+def get_stylesheet(theme='standard', scale=1.0, font_family=None):
+    """Return the process-wide read-only stylesheet for a theme (and scale and font family), built on first use"""
+    return _shared_stylesheet(theme, round(scale, 3), font_family)
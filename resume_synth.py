@@ -0,0 +1,212 @@
+"""Seeded generator of synthetic resumes for load and scaling tests.
+
+Resumes follow the save_data_to_json schema and are produced one at a time, so
+any number can be streamed to a JSONL file (readable with resume_corpus or the
+batch command) without holding them in memory. The same seed and settings
+always produce the same corpus.
+
+Run from the repository root:
+    python resume_synth.py -n 1000000 -o corpus.jsonl --seed 42 --experiences 1 8 --unicode 0.2
+"""
+import argparse
+import json
+import random
+import sys
+import time
+
+# Default distributions; (low, high) pairs are inclusive uniform ranges
+DEFAULT_SPEC = {
+    'experiences': (1, 5),       # work experience entries per resume
+    'bullets': (2, 5),           # bullet points per experience / project
+    'bullet_words': (8, 24),     # words per bullet point
+    'skills': (3, 10),           # entries per skill category
+    'education': (1, 2),
+    'projects': (0, 3),
+    'certifications': (0, 4),
+    'unicode': 0.1,              # chance that a word is drawn from the umlaut/unicode vocabulary
+    'long_words': 0.0,           # chance per bullet of one unbreakable word
+    'long_word_length': (40, 160),
+}
+
+WORDS = (
+    "Entwicklung Implementierung Optimierung Analyse Daten Modelle System Pipeline Architektur Integration "
+    "Automatisierung Tests Deployment Monitoring Skalierung Performance Schnittstellen Datenbank Cloud "
+    "Python Java TypeScript Kubernetes Docker PostgreSQL Kafka Spark TensorFlow PyTorch REST gRPC "
+    "Echtzeit Verarbeitung Algorithmen Simulation Visualisierung Dashboard Berichte Kunden Team Projekt "
+    "developed implemented designed migrated reduced improved automated led built maintained "
+    "latency throughput reliability availability accuracy pipeline service platform model workflow "
+    "mit und für von zur der die das in auf um bis zu"
+).split()
+
+UNICODE_WORDS = (
+    "Größe Prüfstand Qualitätssicherung Überwachung Änderungen Lösungen Geschäftsprozesse Straße "
+    "Zuverlässigkeit Flüssigkeit Fähigkeiten Schlüsselkomponenten Ölförderung München Zürich Köln "
+    "naïve café résumé façade Dvořák Łódź São Ångström € µs ±5% ≤ → ✓ Δt"
+).split()
+
+LONG_WORD_STEMS = (
+    "Donaudampfschifffahrtsgesellschaft", "Rindfleischetikettierungsüberwachung", "Aufgabenübertragung",
+    "Kraftfahrzeughaftpflichtversicherung", "Softwareentwicklungsprozess", "https://example.com/very/long/path/",
+)
+
+FIRST_NAMES = "Anna Jürgen Lena Mehmet Sofia Jörg Chloé Łukasz Maria Yusuf Björn Aylin Noah Zoë Tobias".split()
+LAST_NAMES = "Müller Schmidt Schröder Öztürk Weiß Nowak Fischer Bäcker Dubois Kowalski Hoffmann Yılmaz".split()
+CITIES = "Berlin München Hamburg Köln Zürich Wien Ilmenau Düsseldorf Leipzig Graz".split()
+COMPANIES = "Siemens Bosch SAP Zalando Infineon Fraunhofer Rohde&Schwarz Continental Helsing Celonis".split()
+DEGREES = ("Master of Science", "Bachelor of Science", "Diplom", "Bachelor of Engineering")
+FIELDS = ("Informatik", "Elektrotechnik", "Maschinenbau", "Data Science", "Technische Kybernetik")
+SKILLS = (
+    "Python Java C++ Go Rust SQL TypeScript Bash MATLAB R Scala Kotlin "
+    "Docker Kubernetes Terraform AWS GCP Azure Linux Git CI/CD Kafka Spark Airflow "
+    "TensorFlow PyTorch scikit-learn Pandas NumPy FastAPI Django React PostgreSQL Redis"
+).split()
+ISSUERS = ("Coursera", "Udemy", "AWS", "Google", "TÜV", "IHK")
+
+
+class ResumeSynthesizer:
+    """Draws synthetic resumes from a seeded random generator"""
+
+    def __init__(self, seed=0, **spec):
+        unknown = set(spec) - set(DEFAULT_SPEC)
+        if unknown:
+            raise ValueError(f"Unknown distribution settings: {', '.join(sorted(unknown))}")
+        self.spec = dict(DEFAULT_SPEC, **spec)
+        self.rng = random.Random(seed)
+
+    def _count(self, name):
+        low, high = self.spec[name]
+        return self.rng.randint(low, high)
+
+    def _word(self):
+        if self.rng.random() < self.spec['unicode']:
+            return self.rng.choice(UNICODE_WORDS)
+        return self.rng.choice(WORDS)
+
+    def _long_word(self):
+        stem = self.rng.choice(LONG_WORD_STEMS)
+        low, high = self.spec['long_word_length']
+        length = self.rng.randint(low, high)
+        return (stem * (length // len(stem) + 1))[:length]
+
+    def _sentence(self):
+        words = [self._word() for _ in range(self._count('bullet_words'))]
+        if self.rng.random() < self.spec['long_words']:
+            words.insert(self.rng.randrange(len(words) + 1), self._long_word())
+        words[0] = words[0][:1].upper() + words[0][1:]
+        return ' '.join(words)
+
+    def _date_range(self):
+        start = self.rng.randint(2005, 2023)
+        end = self.rng.randint(start, 2025)
+        return f"{self.rng.randint(1, 12):02d}/{start}", f"{self.rng.randint(1, 12):02d}/{end}"
+
+    def _skills(self):
+        return self.rng.sample(SKILLS, min(len(SKILLS), self._count('skills')))
+
+    def resume(self, index=0):
+        """Return one synthetic resume dict"""
+        rng = self.rng
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        handle = f"{name.split()[0].lower()}{index}"
+        data = {
+            'personal_info': {
+                'name': name,
+                'location': f"{rng.choice(CITIES)}, Germany",
+                'email': f"{handle}@example.com",
+                'phone': f"+49 {rng.randint(150, 179)} {rng.randint(1000000, 9999999)}",
+                'linkedin': f"linkedin.com/in/{handle}",
+                'github': f"github.com/{handle}",
+            },
+            'profile_summary': ' '.join(self._sentence() + '.' for _ in range(rng.randint(2, 4))),
+            'experience': [],
+            'education': [],
+            'skills': {
+                'programming': self._skills(),
+                'technical': self._skills(),
+                'software': self._skills(),
+            },
+            'projects': [],
+            'certifications': [],
+        }
+        for _ in range(self._count('experiences')):
+            start, end = self._date_range()
+            data['experience'].append({
+                'job_title': ' '.join(self._word() for _ in range(rng.randint(1, 3))),
+                'company': rng.choice(COMPANIES),
+                'location': rng.choice(CITIES),
+                'start_date': start,
+                'end_date': end,
+                'responsibilities': [self._sentence() for _ in range(self._count('bullets'))],
+                'technologies': ', '.join(self._skills()),
+            })
+        for _ in range(self._count('education')):
+            start, end = self._date_range()
+            data['education'].append({
+                'institution': f"Universität {rng.choice(CITIES)}",
+                'location': 'Germany',
+                'degree': rng.choice(DEGREES),
+                'field': rng.choice(FIELDS),
+                'start_date': start,
+                'end_date': end,
+                'focus_areas': [self._word() for _ in range(rng.randint(0, 4))],
+            })
+        for _ in range(self._count('projects')):
+            start, end = self._date_range()
+            data['projects'].append({
+                'title': ' '.join(self._word() for _ in range(rng.randint(1, 3))),
+                'subtitle': self._word(),
+                'location': rng.choice(CITIES),
+                'date_range': f"{start} - {end}",
+                'description': [self._sentence() for _ in range(self._count('bullets'))],
+            })
+        for _ in range(self._count('certifications')):
+            data['certifications'].append({
+                'name': ' '.join(self._word() for _ in range(rng.randint(2, 5))),
+                'issuer': rng.choice(ISSUERS),
+            })
+        return data
+
+
+def generate_resumes(count, seed=0, **spec):
+    """Yield count synthetic resumes; see DEFAULT_SPEC for the distribution settings"""
+    synthesizer = ResumeSynthesizer(seed, **spec)
+    for index in range(count):
+        yield synthesizer.resume(index)
+
+
+def write_jsonl(fileobj, count, seed=0, **spec):
+    """Stream count synthetic resumes to a text file object, one JSON object per line"""
+    for data in generate_resumes(count, seed, **spec):
+        fileobj.write(json.dumps(data, ensure_ascii=False))
+        fileobj.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus as JSONL")
+    parser.add_argument('-n', '--count', type=int, default=1000, help="Number of resumes")
+    parser.add_argument('-o', '--output', default='-', help="JSONL output path ('-' for stdout)")
+    parser.add_argument('--seed', type=int, default=0)
+    for name in ('experiences', 'bullets', 'bullet_words', 'skills', 'education', 'projects',
+                 'certifications', 'long_word_length'):
+        low, high = DEFAULT_SPEC[name]
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, nargs=2, metavar=('MIN', 'MAX'),
+                            default=[low, high], help=f"Inclusive range (default: {low} {high})")
+    parser.add_argument('--unicode', type=float, default=DEFAULT_SPEC['unicode'],
+                        help="Share of words with umlauts or other non-ASCII characters (0-1)")
+    parser.add_argument('--long-words', type=float, default=DEFAULT_SPEC['long_words'],
+                        help="Chance per bullet of a pathological unbreakable word (0-1)")
+    args = parser.parse_args(argv)
+
+    spec = {name: tuple(value) if isinstance(value, list) else value
+            for name, value in vars(args).items() if name in DEFAULT_SPEC}
+    start = time.perf_counter()
+    if args.output == '-':
+        write_jsonl(sys.stdout, args.count, args.seed, **spec)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            write_jsonl(f, args.count, args.seed, **spec)
+        print(f"Wrote {args.count} resumes to {args.output} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""Tailor a resume to job postings by keyword overlap.
+
+ResumeIndex tokenizes a resume once and keeps an inverted index from every
+keyword to the bullets, skills and projects containing it. Ranking a posting
+tokenizes only the posting and walks the index entries of its keywords, so one
+index serves any number of postings. Keywords are weighted by how rare they are
+within the resume, so a posting's "PostgreSQL" counts for more than a word that
+appears in every bullet.
+
+Tailor turns a ranking into a reduced resume within a page budget. Every job,
+education entry and certification is kept, and so is the best bullet of each
+job. The remaining experience and project bullets are added best first, while
+the resume still fits the budget. Each list keeps its original order. Matched
+skills move to the front of their category. The budget is checked with
+ResumeBuilder.measure_pages(), on one warm builder per Tailor.
+
+Run from the repository root:
+    python resume_tailor.py resume_data.json postings.jsonl -o tailored/ --pages 1 [--pdf]
+
+Postings are a JSONL file of {"id": ..., "text": ...} records or a directory of
+.txt files. One tailored JSON per posting is written (and a PDF with --pdf),
+named after the posting id. Ids that map to the same file name get a numeric
+suffix instead of overwriting each other.
+"""
+import argparse
+import json
+import math
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from resume_builder import ENGINES, ResumeBuilder, CompactResumeBuilder
+from resume_corpus import iter_corpus
+from resume_keywords import tokenize
+from resume_model import Resume, Skills
+
+# The best bullets of each job that are always kept
+MIN_BULLETS = 1
+
+# Runs of characters replaced by '_' in output file names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w.-]+')
+
+
+class ResumeIndex:
+    """Inverted index from keyword to the resume items containing it.
+
+    Items are ('bullet', experience, n), ('project', project), ('project_bullet',
+    project, n) and ('skill', category, n).
+    """
+
+    def __init__(self, resume):
+        self.resume = resume if isinstance(resume, Resume) else Resume.from_dict(resume)
+        self.postings = defaultdict(list)
+        self.items = []
+        for i, exp in enumerate(self.resume.experience):
+            for n, bullet in enumerate(exp.responsibilities):
+                self._add(('bullet', i, n), bullet)
+        for k, project in enumerate(self.resume.projects):
+            self._add(('project', k), f"{project.title} {project.subtitle}")
+            for n, desc in enumerate(project.description):
+                self._add(('project_bullet', k, n), desc)
+        for category in Skills.FIELDS:
+            for n, skill in enumerate(self.resume.skills[category]):
+                self._add(('skill', category, n), skill)
+        count = len(self.items)
+        self.order = {item: position for position, item in enumerate(self.items)}
+        self.weights = {term: 1 + math.log(count / len(items)) for term, items in self.postings.items()}
+        self.postings = dict(self.postings)
+
+    def _add(self, item, text):
+        self.items.append(item)
+        for term in set(tokenize(text)):
+            self.postings[term].append(item)
+
+    def scores(self, text):
+        """{item: score} for the items sharing keywords with text (other items score 0)"""
+        scores = defaultdict(float)
+        postings = self.postings
+        for term in set(tokenize(text)):
+            items = postings.get(term)
+            if items:
+                weight = self.weights[term]
+                for item in items:
+                    scores[item] += weight
+        return scores
+
+    def rank(self, text):
+        """Every item as (score, item), best first; ties keep resume order"""
+        scores = self.scores(text)
+        return sorted(((scores.get(item, 0.0), item) for item in self.items), key=lambda pair: -pair[0])
+
+
+class Tailor:
+    """Produces page-budgeted variants of one resume for any number of job postings"""
+
+    def __init__(self, resume, pages=1, builder=None, min_bullets=MIN_BULLETS):
+        self.index = ResumeIndex(resume)
+        self.base = self.index.resume.to_dict()
+        self.pages = pages
+        self.min_bullets = min_bullets
+        self.builder = builder or ResumeBuilder()
+        self.builder.verbose = False
+
+    def tailor(self, text):
+        """Reduced resume_data (a save_data_to_json dict) for the posting text.
+        
+        If even the required bullets overflow the budget, only they are kept.
+        """
+        index = self.index
+        scores = index.scores(text)
+        order = index.order
+
+        def best_first(items):
+            return sorted(items, key=lambda item: (-scores.get(item, 0.0), order[item]))
+
+        required = set()
+        optional = []
+        for i, exp in enumerate(index.resume.experience):
+            bullets = best_first(('bullet', i, n) for n in range(len(exp.responsibilities)))
+            required.update(bullets[:self.min_bullets])
+            optional.extend(bullets[self.min_bullets:])
+        for k, project in enumerate(index.resume.projects):
+            # A project's bullets carry its title's score, so relevant projects come first
+            title_score = scores.get(('project', k), 0.0)
+            for n in range(len(project.description)):
+                item = ('project_bullet', k, n)
+                if title_score:
+                    scores[item] = scores.get(item, 0.0) + title_score
+                optional.append(item)
+        optional = best_first(optional)
+
+        selected = required.union(optional)
+        if not self._fits(scores, selected):
+            # Bisect how many optional bullets fit; more content never takes fewer pages
+            low, high = 0, len(optional) - 1
+            while low < high:
+                mid = (low + high + 1) // 2
+                if self._fits(scores, required.union(optional[:mid])):
+                    low = mid
+                else:
+                    high = mid - 1
+            selected = required.union(optional[:low])
+        return self._reduced(scores, selected)
+
+    def tailor_many(self, postings):
+        """Yield (posting id, reduced resume_data) for an iterable of (id, text)"""
+        for posting_id, text in postings:
+            yield posting_id, self.tailor(text)
+
+    def _fits(self, scores, selected):
+        self.builder.resume_data = self._reduced(scores, selected)
+        return self.builder.measure_pages() <= self.pages
+
+    def _reduced(self, scores, selected):
+        """Copy of the resume with only the selected bullets, projects with none dropped"""
+        data = dict(self.base)
+        data['experience'] = [
+            dict(exp, responsibilities=[bullet for n, bullet in enumerate(exp['responsibilities'])
+                                        if ('bullet', i, n) in selected])
+            for i, exp in enumerate(self.base['experience'])
+        ]
+        projects = []
+        for k, project in enumerate(self.base['projects']):
+            description = [desc for n, desc in enumerate(project['description'])
+                           if ('project_bullet', k, n) in selected]
+            if description or (not project['description'] and scores.get(('project', k))):
+                projects.append(dict(project, description=description))
+        data['projects'] = projects
+        skills = dict(self.base['skills'])
+        for category in Skills.FIELDS:
+            values = skills.get(category) or []
+            ranked = sorted(range(len(values)), key=lambda n: -scores.get(('skill', category, n), 0.0))
+            skills[category] = [values[n] for n in ranked]
+        data['skills'] = skills
+        return data
+
+
+def iter_postings(path, on_error=None):
+    """Yield (id, text) for a JSONL file of {"id", "text"} records or a directory of .txt files.
+
+    Lines that are not JSON objects are skipped and passed to on_error, as in iter_corpus.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for posting in sorted(path.glob('*.txt')):
+            yield posting.stem, posting.read_text(encoding='utf-8')
+        return
+    for line_no, record in iter_corpus(path, on_error=on_error):
+        yield str(record.get('id', line_no)), record.get('text') or record.get('description') or ''
+
+
+def output_stem(posting_id, used):
+    """File name stem for a posting id, suffixed _2, _3, ... past the stems in used (which it joins)"""
+    base = stem = _UNSAFE_FILENAME_CHARS.sub('_', posting_id)
+    suffix = 1
+    # Compared casefolded, as file names are on case-insensitive file systems
+    while stem.casefold() in used:
+        suffix += 1
+        stem = f"{base}_{suffix}"
+    used.add(stem.casefold())
+    return stem
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tailor a resume to job postings by keyword overlap")
+    parser.add_argument('resume', help="Resume JSON (save_data_to_json format)")
+    parser.add_argument('postings', help="JSONL of {\"id\", \"text\"} records, or a directory of .txt postings")
+    parser.add_argument('-o', '--output-dir', default='tailored', help="Where tailored resumes are written")
+    parser.add_argument('--pages', type=int, default=1, help="Page budget per tailored resume")
+    parser.add_argument('--compact', action='store_true', help="Measure (and render) with the compact layout")
+    parser.add_argument('--pdf', action='store_true', help="Also render each tailored resume to PDF")
+    parser.add_argument('--engine', choices=ENGINES, default=None, help="Render engine for --pdf (platypus or canvas)")
+    args = parser.parse_args(argv)
+
+    with open(args.resume, 'r', encoding='utf-8') as f:
+        resume = json.load(f)
+    builder_class = CompactResumeBuilder if args.compact else ResumeBuilder
+    tailor = Tailor(resume, pages=args.pages, builder=builder_class(engine=args.engine))
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    skipped = []
+
+    def skip(error):
+        print(f"Skipping {error}", file=sys.stderr)
+        skipped.append(error)
+
+    started = time.perf_counter()
+    count = 0
+    used = set()
+    for posting_id, data in tailor.tailor_many(iter_postings(args.postings, on_error=skip)):
+        stem = output_stem(posting_id, used)
+        if stem != _UNSAFE_FILENAME_CHARS.sub('_', posting_id):
+            print(f"Posting {posting_id!r} written as {stem}: its file name is taken", file=sys.stderr)
+        with open(output_dir / f"{stem}.json", 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        if args.pdf:
+            tailor.builder.resume_data = data
+            tailor.builder.generate_pdf(str(output_dir / f"{stem}.pdf"))
+        count += 1
+    wall = time.perf_counter() - started
+    print(f"Tailored {count} resumes in {wall:.2f}s ({count / wall if wall else 0.0:.1f} postings/s): {output_dir}")
+    if skipped:
+        print(f"Skipped {len(skipped)} postings that could not be read", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
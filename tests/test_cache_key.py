@@ -0,0 +1,58 @@
+"""Cache keys must tell apart every builder configuration that renders a different PDF."""
+import json
+import unittest
+from pathlib import Path
+
+from resume_builder import CompactResumeBuilder, ResumeBuilder, builder_for_theme
+
+SAMPLE = Path(__file__).resolve().parent.parent / 'sample_resume_data.json'
+
+
+class CacheKeyTest(unittest.TestCase):
+
+    def setUp(self):
+        with open(SAMPLE, 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+
+    def key(self, builder):
+        builder.resume_data = self.data
+        return builder.cache_key()
+
+    def test_layout_is_part_of_the_key(self):
+        self.assertNotEqual(self.key(ResumeBuilder(theme='compact')), self.key(CompactResumeBuilder()))
+        self.assertNotEqual(self.key(ResumeBuilder()), self.key(CompactResumeBuilder()))
+
+    def test_equal_builders_share_a_key(self):
+        self.assertEqual(self.key(CompactResumeBuilder()), self.key(CompactResumeBuilder('compact')))
+        self.assertEqual(self.key(ResumeBuilder()), self.key(ResumeBuilder('standard')))
+
+    def test_render_options_change_the_key(self):
+        base = self.key(ResumeBuilder())
+        variants = {
+            'theme': ResumeBuilder(theme='compact'),
+            'engine': ResumeBuilder(engine='canvas'),
+            'locale': ResumeBuilder(locale='en'),
+        }
+        keys = {name: self.key(builder) for name, builder in variants.items()}
+        scaled = ResumeBuilder()
+        scaled.set_scale(0.9)
+        keys['scale'] = self.key(scaled)
+        for name, key in keys.items():
+            with self.subTest(option=name):
+                self.assertNotEqual(key, base)
+        self.assertEqual(len(set(keys.values())), len(keys))
+
+    def test_data_changes_the_key(self):
+        before = self.key(ResumeBuilder())
+        self.data['personal_info']['name'] += ' Jr.'
+        self.assertNotEqual(self.key(ResumeBuilder()), before)
+
+    def test_theme_selects_its_layout(self):
+        self.assertIs(type(builder_for_theme('compact')), CompactResumeBuilder)
+        self.assertIs(type(builder_for_theme('standard')), ResumeBuilder)
+        with self.assertRaises(ValueError):
+            builder_for_theme('fancy')
+
+
+if __name__ == '__main__':
+    unittest.main()
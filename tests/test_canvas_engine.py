@@ -0,0 +1,92 @@
+"""The direct-canvas engine must lay out the same pages and links as platypus, and fall back for what it cannot draw."""
+import copy
+import json
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pymupdf
+from reportlab.platypus import Table
+
+from resume_builder import CompactResumeBuilder, ResumeBuilder
+from resume_canvas import CanvasRenderer, Unsupported
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+def linked_resume():
+    """The sample with LinkedIn and GitHub links, which the compact builder draws as link annotations"""
+    data = copy.deepcopy(SAMPLE)
+    data['personal_info'].update(linkedin_display='linkedin.com/in/sample', linkedin_url='https://linkedin.com/in/sample',
+                                 github_display='github.com/sample', github_url='https://github.com/sample')
+    return data
+
+
+def long_resume(copies=8):
+    """The sample with its experience and projects repeated, long enough to span several pages"""
+    data = linked_resume()
+    data['experience'] = [dict(exp, company=f"{exp['company']} #{i}")
+                          for i in range(copies) for exp in SAMPLE['experience']]
+    data['projects'] = [dict(project, title=f"{project['title']} #{i}")
+                        for i in range(copies) for project in SAMPLE['projects']]
+    return data
+
+
+def pages(pdf):
+    """[(text in reading order, [(uri, rounded rect)])] per page of a PDF"""
+    with pymupdf.open(stream=pdf, filetype='pdf') as doc:
+        return [(page.get_text(sort=True), [(link['uri'], tuple(round(x) for x in link['from'])) for link in page.get_links()])
+                for page in doc]
+
+
+def render(cls, data, engine):
+    builder = cls(engine=engine)
+    builder.verbose = False
+    builder.resume_data = data
+    return builder.render_to_bytes()
+
+
+class TableCertificationsBuilder(ResumeBuilder):
+    """Draws the certifications as a Table, which the canvas engine does not support"""
+
+    def _create_certifications_section(self, story):
+        story.append(Table([['Table cell A', 'Table cell B']]))
+
+
+class CanvasEngineTest(unittest.TestCase):
+
+    def test_same_pages_and_links_as_platypus(self):
+        for cls in (ResumeBuilder, CompactResumeBuilder):
+            for name, data in (('sample', linked_resume()), ('long', long_resume())):
+                with self.subTest(builder=cls.__name__, resume=name):
+                    platypus = pages(render(cls, data, 'platypus'))
+                    canvas = pages(render(cls, data, 'canvas'))
+                    self.assertEqual(len(canvas), len(platypus))
+                    if name == 'long':
+                        self.assertGreater(len(canvas), 2)
+                    self.assertEqual([links for _, links in canvas], [links for _, links in platypus])
+                    self.assertEqual([text for text, _ in canvas], [text for text, _ in platypus])
+        compact_links = [link for _, links in pages(render(CompactResumeBuilder, linked_resume(), 'canvas'))
+                         for link, _ in links]
+        self.assertIn('https://github.com/sample', compact_links)
+
+    def test_table_falls_back_to_platypus(self):
+        unsupported = []
+        render_canvas = CanvasRenderer.render
+
+        def spy(renderer, *args, **kwargs):
+            try:
+                return render_canvas(renderer, *args, **kwargs)
+            except Unsupported as e:
+                unsupported.append(str(e))
+                raise
+
+        with mock.patch.object(CanvasRenderer, 'render', spy):
+            canvas = pages(render(TableCertificationsBuilder, SAMPLE, 'canvas'))
+        self.assertEqual(unsupported, ['Table'])
+        self.assertIn('Table cell A', canvas[-1][0])
+        self.assertEqual(canvas, pages(render(TableCertificationsBuilder, SAMPLE, 'platypus')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""The corpus reader must skip broken records whole, report each once, and honour start/limit."""
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from resume_corpus import iter_corpus, iter_corpus_text
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+def resume(name):
+    return dict(SAMPLE, personal_info=dict(SAMPLE['personal_info'], name=name))
+
+
+class CorpusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, text):
+        path = os.path.join(self.tmp.name, 'corpus.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def read(self, path, text=True, **options):
+        """([names], [errors]) from iter_corpus, checking that iter_corpus_text yields the same records"""
+        errors = []
+        names = [data['personal_info']['name'] for _, data in iter_corpus(path, on_error=errors.append, **options)]
+        if text:
+            text_names = [json.loads(text)['personal_info']['name']
+                          for _, text in iter_corpus_text(path, on_error=lambda error: None, **options)]
+            self.assertEqual(text_names, names)
+        return names, errors
+
+    def test_broken_pretty_printed_record_is_skipped_whole(self):
+        broken = json.dumps(resume('broken'), indent=2).replace('"company": ', '"company" ', 1)
+        path = self.write('\n'.join([json.dumps(resume('a'), indent=2), broken,
+                                     json.dumps(resume('b'), indent=2)]) + '\n')
+        names, errors = self.read(path)
+        self.assertEqual(names, ['a', 'b'])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("in the record starting on line", errors[0].message)
+
+    def test_unterminated_string_does_not_swallow_later_records(self):
+        broken = json.dumps(resume('broken'), indent=2).replace('"location": "', '"location": "x\\', 1)
+        path = self.write('\n'.join([broken, json.dumps(resume('a'), indent=2)]) + '\n')
+        names, errors = self.read(path)
+        self.assertEqual(names, ['a'])
+        self.assertEqual(len(errors), 1)
+
+    def test_bad_jsonl_lines_are_reported(self):
+        path = self.write('\n'.join([json.dumps(resume('a')), '{"name": oops}', json.dumps(resume('b')),
+                                     '[1, 2]', json.dumps(resume('c'))]) + '\n')
+        names, errors = self.read(path, text=False)
+        self.assertEqual(names, ['a', 'b', 'c'])
+        self.assertEqual([error.line for error in errors], [2, 4])
+        # One-line objects are passed through undecoded; the batch worker reports the broken one
+        errors = []
+        lines = [line_no for line_no, _ in iter_corpus_text(path, on_error=errors.append)]
+        self.assertEqual(lines, [1, 2, 3, 5])
+        self.assertEqual([error.line for error in errors], [4])
+
+    def test_start_and_limit_count_valid_resumes(self):
+        lines = [json.dumps(resume(str(i))) for i in range(6)]
+        lines.insert(2, 'not json')
+        path = self.write('\n'.join(lines) + '\n')
+        self.assertEqual(self.read(path)[0], [str(i) for i in range(6)])
+        self.assertEqual(self.read(path, start=2, limit=3)[0], ['2', '3', '4'])
+        self.assertEqual(self.read(path, start=5)[0], ['5'])
+        self.assertEqual(self.read(path, limit=0)[0], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
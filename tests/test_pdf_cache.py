@@ -0,0 +1,73 @@
+"""PDFCache must serve hits, count misses and evict the least recently used entries first."""
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from resume_builder import ResumeBuilder
+from resume_cache import PDFCache
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+class PDFCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = Path(self.tmp.name) / 'cache'
+
+    def test_hit_and_miss(self):
+        cache = PDFCache(self.directory)
+        self.assertIsNone(cache.path_for('ab' * 32))
+        cache.store_bytes('ab' * 32, b'%PDF-1 one')
+        self.assertEqual(cache.path_for('ab' * 32).read_bytes(), b'%PDF-1 one')
+        dest = Path(self.tmp.name) / 'out.pdf'
+        self.assertTrue(cache.fetch('ab' * 32, dest))
+        self.assertEqual(dest.read_bytes(), b'%PDF-1 one')
+        self.assertFalse(cache.fetch('cd' * 32, dest))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size_bytes']), (2, 2, 10))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = PDFCache(self.directory, max_bytes=250)
+        keys = [f"{n:02d}" * 32 for n in range(4)]
+        now = time.time()
+        for age, key in zip((30, 20, 10), keys):
+            cache.store_bytes(key, b'x' * 100 if key != keys[2] else b'y' * 50)
+            os.utime(cache._path(key), (now - age, now - age))
+        # Using the oldest entry makes the second one the least recently used
+        self.assertIsNotNone(cache.path_for(keys[0]))
+        cache.store_bytes(keys[3], b'z' * 100)
+        present = [key for key in keys if cache._path(key).exists()]
+        self.assertEqual(present, [keys[0], keys[2], keys[3]])
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(cache.stats()['size_bytes'], 250)
+        # A new instance sees the entries left on disk
+        self.assertEqual(PDFCache(self.directory, max_bytes=250).stats()['size_bytes'], 250)
+
+    def test_builder_reuses_cached_pdf(self):
+        cache = PDFCache(self.directory)
+        builder = ResumeBuilder(cache=cache)
+        builder.verbose = False
+        builder.resume_data = SAMPLE
+        first = builder.render_to_bytes()
+        self.assertFalse(builder.last_cache_hit)
+        self.assertEqual(builder.render_to_bytes(), first)
+        self.assertTrue(builder.last_cache_hit)
+        builder.resume_data = dict(SAMPLE, profile_summary='Changed.')
+        builder.render_to_bytes()
+        self.assertFalse(builder.last_cache_hit)
+        # Another engine is another entry, not a hit on the platypus PDF
+        canvas = ResumeBuilder(cache=cache, engine='canvas')
+        canvas.verbose = False
+        canvas.resume_data = SAMPLE
+        canvas.render_to_bytes()
+        self.assertFalse(canvas.last_cache_hit)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""AutosaveWriter must skip content that is already on disk and never leave a torn file."""
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import resume_autosave
+from resume_autosave import AutosaveWriter, serialize, write_atomic
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+def edited(name):
+    return dict(SAMPLE, personal_info=dict(SAMPLE['personal_info'], name=name))
+
+
+class AutosaveTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = Path(tmp.name)
+        self.path = self.directory / 'resume_data.json'
+
+    def writer(self):
+        writer = AutosaveWriter(self.path)
+        self.addCleanup(writer.close, 5)
+        return writer
+
+    def saved(self):
+        return json.loads(self.path.read_text(encoding='utf-8'))
+
+    def test_identical_content_is_written_once(self):
+        writer = self.writer()
+        writer.submit(SAMPLE)
+        self.assertTrue(writer.flush(5))
+        writer.submit(json.loads(json.dumps(SAMPLE)))
+        self.assertTrue(writer.flush(5))
+        self.assertEqual((writer.writes, writer.skipped), (1, 1))
+        self.assertEqual(self.saved(), SAMPLE)
+        self.assertEqual(writer.events.get_nowait(), ('saved', self.path))
+        self.assertTrue(writer.events.empty())
+
+    def test_changed_content_is_written(self):
+        writer = self.writer()
+        for name in ('First', 'Second'):
+            writer.submit(edited(name))
+            self.assertTrue(writer.flush(5))
+        self.assertEqual(writer.writes, 2)
+        self.assertEqual(self.saved()['personal_info']['name'], 'Second')
+        self.assertEqual(self.path.read_bytes(), serialize(edited('Second')))
+
+    def test_baseline_is_not_written(self):
+        self.path.write_bytes(serialize(SAMPLE))
+        os.utime(self.path, (0, 0))
+        writer = self.writer()
+        writer.baseline(SAMPLE)
+        writer.submit(SAMPLE)
+        self.assertTrue(writer.flush(5))
+        self.assertEqual((writer.writes, writer.skipped), (0, 1))
+        self.assertEqual(self.path.stat().st_mtime, 0)
+
+    def test_burst_of_submits_costs_one_more_write(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_write(path, content):
+            started.set()
+            release.wait(5)
+            write_atomic(path, content)
+
+        with mock.patch.object(resume_autosave, 'write_atomic', side_effect=slow_write):
+            writer = self.writer()
+            writer.submit(edited('First'))
+            self.assertTrue(started.wait(5))
+            for name in ('Second', 'Third', 'Fourth'):
+                writer.submit(edited(name))
+            release.set()
+            self.assertTrue(writer.flush(5))
+        self.assertEqual(writer.writes, 2)
+        self.assertEqual(self.saved()['personal_info']['name'], 'Fourth')
+
+    def test_failed_write_leaves_the_old_file_whole(self):
+        self.path.write_bytes(serialize(SAMPLE))
+        writer = self.writer()
+        writer.baseline(SAMPLE)
+        with mock.patch.object(os, 'replace', side_effect=OSError("disk full")):
+            writer.submit(edited('Lost'))
+            self.assertTrue(writer.flush(5))
+        kind, error = writer.events.get_nowait()
+        self.assertEqual((kind, str(error)), ('error', "disk full"))
+        self.assertEqual(self.saved(), SAMPLE)
+        # Nothing was recorded as saved, so the same content is tried again
+        writer.submit(edited('Lost'))
+        self.assertTrue(writer.flush(5))
+        self.assertEqual(writer.writes, 1)
+        self.assertEqual(self.saved()['personal_info']['name'], 'Lost')
+
+    def test_write_atomic_leaves_no_temporary_file(self):
+        write_atomic(self.path, b'one')
+        write_atomic(self.path, b'two')
+        self.assertEqual(self.path.read_bytes(), b'two')
+        self.assertEqual([path.name for path in self.directory.iterdir()], [self.path.name])
+
+    def test_close_writes_what_is_pending(self):
+        writer = AutosaveWriter(self.path)
+        writer.submit(edited('Last'))
+        self.assertTrue(writer.close(5))
+        self.assertEqual(self.saved()['personal_info']['name'], 'Last')
+        with self.assertRaises(RuntimeError):
+            writer.submit(SAMPLE)
+
+
+if __name__ == '__main__':
+    unittest.main()
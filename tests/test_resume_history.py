@@ -0,0 +1,129 @@
+"""RevisionStore must check out every revision exactly as committed, across snapshot boundaries."""
+import copy
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from resume_history import RevisionStore, apply, diff
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+def edits():
+    """Successive versions of the sample resume, each one small edit from the last"""
+    data = copy.deepcopy(SAMPLE)
+    steps = [
+        lambda d: d['personal_info'].update(phone='+49 000 000'),
+        lambda d: d['experience'][0]['responsibilities'].append('Added a bullet'),
+        lambda d: d['experience'][0]['responsibilities'].__setitem__(0, 'Rewrote the first bullet'),
+        lambda d: d['experience'].insert(1, dict(copy.deepcopy(d['experience'][0]), company='Inserted GmbH')),
+        lambda d: d['skills']['programming'].remove('SQL'),
+        lambda d: d['projects'].pop(),
+        lambda d: d['personal_info'].pop('github', None),
+        lambda d: d['education'][0].update(focus_areas=['Robotik']),
+        lambda d: d['experience'][1]['responsibilities'].clear(),
+        lambda d: d['certifications'].append('New certificate'),
+        lambda d: d['personal_info'].update(name='Renamed'),
+    ]
+    yield copy.deepcopy(data)
+    for step in steps:
+        step(data)
+        yield copy.deepcopy(data)
+
+
+class HistoryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / 'resume.history.jsonl'
+
+    def committed(self, snapshot_every=4):
+        store = RevisionStore(self.path, snapshot_every=snapshot_every)
+        versions = list(edits())
+        for n, data in enumerate(versions, 1):
+            self.assertEqual(store.commit(data, f"edit {n}"), n)
+        return store, versions
+
+
+class CheckoutTest(HistoryTestCase):
+
+    def test_every_revision_checks_out_as_committed(self):
+        store, versions = self.committed()
+        reopened = RevisionStore(self.path, snapshot_every=4)
+        for rev, expected in enumerate(versions, 1):
+            with self.subTest(rev=rev):
+                self.assertEqual(store.checkout(rev), expected)
+                self.assertEqual(reopened.checkout(rev), expected)
+        self.assertEqual(reopened.checkout(), versions[-1])
+
+    def test_snapshots_bound_the_delta_chain(self):
+        store, versions = self.committed()
+        snapshots = [revision['rev'] for revision in store.revisions() if revision['snapshot']]
+        self.assertEqual(snapshots, list(range(1, len(versions) + 1, 4)))
+
+    def test_identical_content_is_not_committed(self):
+        store, versions = self.committed()
+        self.assertIsNone(store.commit(copy.deepcopy(versions[-1])))
+        self.assertIsNone(RevisionStore(self.path).commit(versions[-1]))
+        self.assertEqual(store.head, len(versions))
+
+    def test_unknown_revision_raises_key_error(self):
+        store, versions = self.committed()
+        for rev in (0, -1, len(versions) + 1):
+            with self.subTest(rev=rev), self.assertRaises(KeyError):
+                store.checkout(rev)
+        with self.assertRaises(KeyError):
+            RevisionStore(self.path.with_name('none.history.jsonl')).checkout()
+
+    def test_unfinished_last_line_is_ignored_and_replaced(self):
+        store, versions = self.committed()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('{"rev": 99, "delta": [')
+        store = RevisionStore(self.path, snapshot_every=4)
+        self.assertEqual(store.head, len(versions))
+        changed = dict(versions[-1], summary='After an interrupted commit')
+        self.assertEqual(store.commit(changed), len(versions) + 1)
+        self.assertEqual(RevisionStore(self.path).checkout(), changed)
+
+
+class RestoreTest(HistoryTestCase):
+
+    def test_restore_commits_the_old_revision_as_new(self):
+        store, versions = self.committed()
+        rev, data = store.restore(3)
+        self.assertEqual((rev, data), (len(versions) + 1, versions[2]))
+        reopened = RevisionStore(self.path)
+        self.assertEqual(reopened.checkout(), versions[2])
+        self.assertEqual(reopened.revisions()[-1]['message'], 'Restore revision 3')
+        # Later revisions are still there
+        self.assertEqual(reopened.checkout(len(versions)), versions[-1])
+
+    def test_restoring_the_head_records_nothing(self):
+        store, versions = self.committed()
+        self.assertEqual(store.restore(len(versions)), (None, versions[-1]))
+
+
+class DeltaTest(unittest.TestCase):
+
+    def test_apply_inverts_diff(self):
+        versions = list(edits())
+        for old, new in zip(versions, versions[1:]):
+            self.assertEqual(apply(copy.deepcopy(old), diff(old, new)), new)
+            self.assertEqual(apply(copy.deepcopy(new), diff(new, old)), old)
+        self.assertEqual(apply(copy.deepcopy(versions[0]), diff(versions[0], versions[-1])), versions[-1])
+
+    def test_one_edited_bullet_is_one_small_operation(self):
+        old = copy.deepcopy(SAMPLE)
+        new = copy.deepcopy(SAMPLE)
+        new['experience'][1]['responsibilities'][1] = 'Edited'
+        self.assertEqual(diff(old, new), [['set', ['experience', 1, 'responsibilities', 1], 'Edited']])
+
+    def test_type_changes_and_root_replacement(self):
+        self.assertEqual(apply({'a': [1]}, diff({'a': [1]}, {'a': 'x'})), {'a': 'x'})
+        self.assertEqual(apply({'a': 1}, diff({'a': 1}, [1, 2])), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Resume records must round-trip saved data and read missing fields as empty."""
+import copy
+import json
+import unittest
+from pathlib import Path
+
+from resume_model import Certification, Resume
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+class ResumeRecordTest(unittest.TestCase):
+
+    def test_round_trip_is_lossless(self):
+        for data in (SAMPLE, {}, {'personal_info': {'name': 'x'}}, {'experience': [{'job_title': 'a'}]},
+                     {'personal_info': {'name': 'x', 'linkedin_url': 'u'}, 'extra': 1}):
+            with self.subTest(data=data):
+                self.assertEqual(Resume.from_dict(data).to_dict(), data)
+                self.assertEqual(copy.deepcopy(Resume.from_dict(data)).to_dict(), data)
+
+    def test_missing_fields_read_as_empty(self):
+        resume = Resume.from_dict({'experience': [{'job_title': 'a'}]})
+        self.assertEqual(resume['personal_info']['location'], '')
+        self.assertEqual(resume['experience'][0]['technologies'], '')
+        self.assertEqual(resume['experience'][0]['responsibilities'], [])
+        self.assertEqual(resume.skills.programming, [])
+        self.assertEqual(resume['certifications'], [])
+        self.assertNotIn('certifications', resume)
+        self.assertNotIn('technologies', resume['experience'][0])
+
+    def test_filled_defaults_are_saved(self):
+        resume = Resume.from_dict({})
+        resume.certifications.append(Certification(name='AWS', issuer='Amazon'))
+        resume.skills.programming.append('Python')
+        resume['profile_summary'] = ''
+        self.assertEqual(resume.to_dict(), {
+            'profile_summary': '',
+            'skills': {'programming': ['Python']},
+            'certifications': [{'name': 'AWS', 'issuer': 'Amazon'}],
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
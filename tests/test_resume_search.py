@@ -0,0 +1,178 @@
+"""SearchIndex must answer the query grammar correctly and refresh only what changed on disk."""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from resume_search import QueryError, SearchIndex
+
+
+def resume(name, skills=(), technologies='', focus_areas=(), bullets=()):
+    return {
+        'personal_info': {'name': name},
+        'skills': {'programming': list(skills), 'technical': [], 'software': []},
+        'experience': [{'technologies': technologies, 'responsibilities': list(bullets)}],
+        'education': [{'focus_areas': list(focus_areas)}],
+        'projects': [],
+    }
+
+
+RESUMES = {
+    'ada.json': resume('Ada', skills=['Python', 'OpenCV'], technologies='PostgreSQL', focus_areas=['Robotik']),
+    'ben.json': resume('Ben', skills=['Python'], technologies='MySQL', bullets=['Tuned OpenCV pipelines']),
+    'cy.json': resume('Cy', skills=['Java'], technologies='PostgreSQL, Kafka', focus_areas=['Databases']),
+}
+
+
+class SearchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = Path(self.tmp.name)
+        for name, data in RESUMES.items():
+            self.write(name, data)
+
+    def write(self, name, data, mtime_ns=None):
+        path = self.directory / name
+        path.write_text(data if isinstance(data, str) else json.dumps(data), encoding='utf-8')
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def index(self):
+        index = SearchIndex(self.directory)
+        with contextlib.redirect_stderr(io.StringIO()):
+            stats = index.update()
+        return index, stats
+
+
+class QueryGrammarTest(SearchTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.search = self.index()[0].search
+
+    def test_terms_match_any_field(self):
+        self.assertEqual(self.search('opencv'), ['ada.json', 'ben.json'])
+        self.assertEqual(self.search('OpenCV'), ['ada.json', 'ben.json'])
+        self.assertEqual(self.search('nothing'), [])
+        self.assertEqual(self.search(''), [])
+
+    def test_and_or_not(self):
+        self.assertEqual(self.search('python postgresql'), ['ada.json'])
+        self.assertEqual(self.search('python AND postgresql'), ['ada.json'])
+        self.assertEqual(self.search('java OR mysql'), ['ben.json', 'cy.json'])
+        self.assertEqual(self.search('postgresql NOT python'), ['cy.json'])
+        self.assertEqual(self.search('NOT NOT java'), ['cy.json'])
+        self.assertEqual(self.search('python and not mysql'), ['ada.json'])
+
+    def test_or_binds_looser_than_and(self):
+        self.assertEqual(self.search('java OR python mysql'), ['ben.json', 'cy.json'])
+        self.assertEqual(self.search('(java OR python) mysql'), ['ben.json'])
+        self.assertEqual(self.search('postgresql AND (java OR robotik)'), ['ada.json', 'cy.json'])
+
+    def test_prefix(self):
+        self.assertEqual(self.search('postgres*'), ['ada.json', 'cy.json'])
+        self.assertEqual(self.search('ka*'), ['cy.json'])
+        self.assertEqual(self.search('zz*'), [])
+
+    def test_field_qualifiers(self):
+        self.assertEqual(self.search('skills:opencv'), ['ada.json'])
+        self.assertEqual(self.search('bullet:opencv'), ['ben.json'])
+        self.assertEqual(self.search('tech:postgres*'), ['ada.json', 'cy.json'])
+        self.assertEqual(self.search('focus:robotik'), ['ada.json'])
+        self.assertEqual(self.search('FOCUS_AREAS:databases'), ['cy.json'])
+        self.assertEqual(self.search('skills:python NOT focus:robotik'), ['ben.json'])
+
+    def test_malformed_queries_raise(self):
+        for query in ('python AND', '(python', 'python)', 'OR java', 'NOT', '()'):
+            with self.subTest(query=query), self.assertRaises(QueryError):
+                self.search(query)
+
+
+class RefreshTest(SearchTestCase):
+
+    def test_first_update_indexes_everything_and_is_persisted(self):
+        index, stats = self.index()
+        self.assertEqual(stats['added'], 3)
+        self.assertTrue(index.index_path.exists())
+        reloaded = SearchIndex(self.directory)
+        self.assertEqual(reloaded.search('opencv'), ['ada.json', 'ben.json'])
+
+    def test_unchanged_files_are_not_read(self):
+        self.index()
+        with mock.patch.object(Path, 'read_bytes', side_effect=AssertionError("file was read")):
+            index, stats = self.index()
+        self.assertEqual(stats['unchanged'], 3)
+        self.assertEqual(index.search('java'), ['cy.json'])
+
+    def test_touched_file_with_same_content_is_unchanged(self):
+        index, _ = self.index()
+        mtime_ns = index.docs['ada.json']['mtime_ns'] + 10 ** 9
+        self.write('ada.json', RESUMES['ada.json'], mtime_ns=mtime_ns)
+        index, stats = self.index()
+        self.assertEqual((stats['unchanged'], stats['updated']), (3, 0))
+        self.assertEqual(index.docs['ada.json']['mtime_ns'], mtime_ns)
+
+    def test_changed_file_is_reindexed(self):
+        index, _ = self.index()
+        mtime_ns = index.docs['ada.json']['mtime_ns'] + 10 ** 9
+        self.write('ada.json', resume('Ada', skills=['Rust']), mtime_ns=mtime_ns)
+        index, stats = self.index()
+        self.assertEqual(stats['updated'], 1)
+        self.assertEqual(index.search('rust'), ['ada.json'])
+        self.assertEqual(index.search('opencv'), ['ben.json'])
+        self.assertEqual(index.search('robotik'), [])
+
+    def test_deleted_file_is_removed(self):
+        self.index()
+        (self.directory / 'cy.json').unlink()
+        index, stats = self.index()
+        self.assertEqual(stats['removed'], 1)
+        self.assertEqual(index.search('postgresql'), ['ada.json'])
+        self.assertEqual(index.search('NOT java'), ['ada.json', 'ben.json'])
+
+    def test_invalid_file_is_only_reread_after_it_changes(self):
+        broken = self.write('broken.json', '{"skills": ')
+        index, stats = self.index()
+        self.assertEqual((stats['errors'], stats['added']), (1, 3))
+        self.assertIn('broken.json', index.invalid)
+        self.assertNotIn('broken.json', index.search('NOT java'))
+
+        reads = []
+        original = Path.read_bytes
+        with mock.patch.object(Path, 'read_bytes', autospec=True,
+                               side_effect=lambda path: reads.append(path.name) or original(path)):
+            index, stats = self.index()
+            self.assertEqual((reads, stats['errors'], stats['invalid']), ([], 0, 1))
+
+            mtime_ns = index.invalid['broken.json']['mtime_ns'] + 10 ** 9
+            self.write('broken.json', resume('Dee', skills=['Go']), mtime_ns=mtime_ns)
+            index, stats = self.index()
+        self.assertEqual(reads, ['broken.json'])
+        self.assertEqual(stats['added'], 1)
+        self.assertNotIn('broken.json', index.invalid)
+        self.assertEqual(index.search('go'), ['broken.json'])
+
+        broken.unlink()
+        index, _ = self.index()
+        self.assertEqual(index.invalid, {})
+
+    def test_valid_file_that_breaks_leaves_the_results(self):
+        index, _ = self.index()
+        mtime_ns = index.docs['cy.json']['mtime_ns'] + 10 ** 9
+        self.write('cy.json', '[]', mtime_ns=mtime_ns)
+        index, stats = self.index()
+        self.assertEqual(stats['errors'], 1)
+        self.assertNotIn('cy.json', index.docs)
+        self.assertIn('cy.json', index.invalid)
+        self.assertEqual(index.search('java'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Resume stores must round-trip resumes, reject ids they cannot hold and import around malformed resumes."""
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from resume_store import JSONDirectoryStore, ResumeStore, SQLiteStore
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+def resume(name):
+    return dict(SAMPLE, personal_info=dict(SAMPLE['personal_info'], name=name))
+
+
+class StoreTestMixin:
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = self.open_store()
+        self.addCleanup(self.store.close)
+
+    def test_round_trip(self):
+        data = resume('Jane Doe')
+        data['personal_info']['linkedin_url'] = 'https://example.com/jane'
+        resume_id = self.store.save(data)
+        self.assertEqual(self.store.load(resume_id), data)
+        self.assertEqual(self.store.list(), [(resume_id, 'Jane Doe')])
+        self.store.delete(resume_id)
+        self.assertNotIn(resume_id, self.store)
+        with self.assertRaises(KeyError):
+            self.store.load(resume_id)
+
+    def test_import_skips_malformed_resumes(self):
+        corpus = os.path.join(self.tmp.name, 'corpus.jsonl')
+        lines = [json.dumps(resume('a')), json.dumps(dict(SAMPLE, experience=5)), '{"broken": ',
+                 json.dumps(resume('b')), json.dumps(dict(SAMPLE, experience=['x'])), '[1]', json.dumps(resume('c'))]
+        with open(corpus, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        errors = []
+        self.assertEqual(self.store.import_path(corpus, batch_size=2, on_error=errors.append), 3)
+        self.assertEqual(sorted(name for _, name in self.store.list()), ['a', 'b', 'c'])
+        self.assertEqual(len(errors), 4)
+        self.assertIn('experience must be a list', errors[0].message)
+        self.assertIn('starting on line 3', errors[1].message)
+        self.assertIn('experience[0] must be an object', errors[2].message)
+        self.assertEqual(errors[3].line, 6)
+
+    def test_import_directory_skips_malformed_files(self):
+        source = Path(self.tmp.name) / 'source'
+        source.mkdir()
+        (source / 'a.json').write_text(json.dumps(resume('a')), encoding='utf-8')
+        (source / 'b.json').write_text('{"personal_info": ', encoding='utf-8')
+        (source / 'c.json').write_text('[]', encoding='utf-8')
+        (source / 'd.json').write_text(json.dumps(dict(SAMPLE, skills={'programming': 'Python'})), encoding='utf-8')
+        errors = []
+        self.assertEqual(self.store.import_path(source, on_error=errors.append), 1)
+        self.assertEqual([Path(error.path).name for error in errors], ['b.json', 'c.json', 'd.json'])
+
+
+class JSONDirectoryStoreTest(StoreTestMixin, unittest.TestCase):
+
+    def open_store(self):
+        return JSONDirectoryStore(os.path.join(self.tmp.name, 'store'))
+
+    def test_path_like_ids_are_rejected(self):
+        for resume_id in ('a/b', '.hidden', ''):
+            with self.subTest(resume_id=resume_id):
+                with self.assertRaisesRegex(ValueError, 'Invalid resume id'):
+                    self.store.save(SAMPLE, resume_id)
+                self.assertNotIn(resume_id, self.store)
+
+
+class SQLiteStoreTest(StoreTestMixin, unittest.TestCase):
+
+    def open_store(self):
+        return SQLiteStore(os.path.join(self.tmp.name, 'resumes.db'))
+
+    def test_text_ids_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, 'SQLite store ids are integers'):
+            self.store.save(SAMPLE, 'jane')
+        with self.assertRaisesRegex(ValueError, 'SQLite store ids are integers'):
+            self.store.load('jane')
+        self.assertNotIn('jane', self.store)
+        self.assertEqual(self.store.save(SAMPLE, '7'), '7')
+
+    def test_find_by_skill(self):
+        self.store.save(resume('a'))
+        found = self.store.find(skill=SAMPLE['skills']['programming'][0])
+        self.assertEqual([name for _, name in found], ['a'])
+
+
+class ResumeStoreTest(unittest.TestCase):
+
+    def test_interface_is_abstract(self):
+        with self.assertRaises(TypeError):
+            ResumeStore()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tailor must rank resume items by posting keywords and keep every variant within its page budget."""
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import resume_tailor
+from resume_builder import ResumeBuilder
+from resume_tailor import ResumeIndex, Tailor, output_stem
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+def measure_pages(data):
+    builder = ResumeBuilder()
+    builder.verbose = False
+    builder.resume_data = data
+    return builder.measure_pages()
+
+
+class RankingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ResumeIndex(SAMPLE)
+
+    def test_matching_items_rank_first(self):
+        ranking = self.index.rank('OpenCV')
+        # Both bullets mentioning OpenCV score the same, so they stay in resume order
+        self.assertEqual([item for _, item in ranking[:2]], [('bullet', 0, 0), ('bullet', 1, 0)])
+        self.assertEqual(ranking[0][0], ranking[1][0])
+        self.assertGreater(ranking[1][0], 0)
+        self.assertEqual(ranking[2][0], 0)
+
+    def test_unmatched_items_keep_resume_order(self):
+        self.assertEqual([item for _, item in self.index.rank('nothing in common')], self.index.items)
+
+    def test_rare_keywords_weigh_more(self):
+        index = ResumeIndex(dict(SAMPLE, experience=[dict(SAMPLE['experience'][0], responsibilities=[
+            'Python tooling', 'Python services', 'Python and Kafka pipelines'])], projects=[]))
+        self.assertGreater(index.weights['kafka'], index.weights['python'])
+        self.assertEqual(index.rank('python kafka')[0][1], ('bullet', 0, 2))
+
+    def test_matched_skills_move_to_the_front(self):
+        data = Tailor(SAMPLE, pages=5).tailor('PostgreSQL and SQLite')
+        programming = data['skills']['programming']
+        self.assertEqual(programming[:2], ['SQLite', 'PostgreSQL - Database Design'])
+        self.assertEqual(sorted(programming), sorted(SAMPLE['skills']['programming']))
+
+
+class PageBudgetTest(unittest.TestCase):
+
+    def test_sample_does_not_fit_one_page(self):
+        # Otherwise the budget tests below would not exercise any cutting
+        self.assertGreater(measure_pages(SAMPLE), 1)
+
+    def test_variants_fit_the_budget(self):
+        tailor = Tailor(SAMPLE, pages=1)
+        for text in ('OpenCV object detection', 'PostgreSQL SQLite database design', 'machine learning'):
+            with self.subTest(posting=text):
+                data = tailor.tailor(text)
+                self.assertLessEqual(measure_pages(data), 1)
+                # Every job is kept with at least its best bullet
+                self.assertEqual([exp['company'] for exp in data['experience']],
+                                 [exp['company'] for exp in SAMPLE['experience']])
+                self.assertTrue(all(exp['responsibilities'] for exp in data['experience']))
+
+    def test_best_bullet_of_each_job_is_kept(self):
+        data = Tailor(SAMPLE, pages=1).tailor('Prozessunterstützung')
+        self.assertIn(SAMPLE['experience'][1]['responsibilities'][2], data['experience'][1]['responsibilities'])
+
+    def test_kept_bullets_keep_their_order(self):
+        data = Tailor(SAMPLE, pages=1).tailor('Echtzeit-Objekterkennung OpenCV')
+        for kept, original in zip(data['experience'], SAMPLE['experience']):
+            positions = [original['responsibilities'].index(bullet) for bullet in kept['responsibilities']]
+            self.assertEqual(positions, sorted(positions))
+
+    def test_roomy_budget_keeps_everything(self):
+        data = Tailor(SAMPLE, pages=5).tailor('OpenCV')
+        self.assertEqual(data['experience'], SAMPLE['experience'])
+        self.assertEqual(data['projects'], SAMPLE['projects'])
+
+
+class OutputNamesTest(unittest.TestCase):
+
+    def test_colliding_ids_get_a_suffix(self):
+        used = set()
+        self.assertEqual([output_stem(posting_id, used) for posting_id in ('a/b', 'a_b', 'a b', 'A_B', 'c')],
+                         ['a_b', 'a_b_2', 'a_b_3', 'A_B_4', 'c'])
+
+    def test_main_writes_one_file_per_posting(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            resume = tmp / 'resume.json'
+            resume.write_text(json.dumps(SAMPLE), encoding='utf-8')
+            postings = tmp / 'postings.jsonl'
+            postings.write_text(''.join(json.dumps({'id': posting_id, 'text': 'OpenCV'}) + '\n'
+                                        for posting_id in ('a/b', 'a_b')), encoding='utf-8')
+            output = tmp / 'out'
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as err:
+                self.assertEqual(resume_tailor.main([str(resume), str(postings), '-o', str(output), '--pages', '5']), 0)
+            self.assertEqual(sorted(path.name for path in output.iterdir()), ['a_b.json', 'a_b_2.json'])
+            self.assertIn("'a_b' written as a_b_2", err.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
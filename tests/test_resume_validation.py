@@ -0,0 +1,61 @@
+"""validate() must reject resume data the service should not render and accept complete resumes."""
+import copy
+import json
+import re
+import unittest
+from pathlib import Path
+
+from resume_model import ResumeValidationError, validate
+
+SAMPLE = json.loads((Path(__file__).resolve().parent.parent / 'sample_resume_data.json').read_text(encoding='utf-8'))
+
+
+def changed(**sections):
+    """The sample with whole top-level sections replaced"""
+    data = copy.deepcopy(SAMPLE)
+    data.update(sections)
+    return data
+
+
+class ValidateTest(unittest.TestCase):
+
+    def test_sample_is_valid(self):
+        validate(SAMPLE)
+
+    def test_optional_fields_may_be_missing_or_null(self):
+        data = copy.deepcopy(SAMPLE)
+        del data['personal_info']['linkedin']
+        data['personal_info']['github'] = None
+        del data['experience'][0]['technologies']
+        del data['education'][0]['focus_areas']
+        data['skills'] = {}
+        validate(data)
+
+    def test_incomplete_or_mistyped_data_is_rejected(self):
+        no_title = copy.deepcopy(SAMPLE['projects'][0])
+        del no_title['title']
+        cases = (
+            ('resume must be an object', []),
+            ('personal_info is required', {}),
+            ('personal_info.location is required', changed(personal_info={'name': 'x'})),
+            ('experience[0].company is required', changed(experience=[{'job_title': 'a'}])),
+            ('projects[0].title is required', changed(projects=[no_title])),
+            ('projects[0].title must be a string, got NoneType', changed(projects=[dict(no_title, title=None)])),
+            ('experience must be a list', changed(experience=5)),
+            ('experience[0] must be an object', changed(experience=[5])),
+            ('skills must be an object', changed(skills='x')),
+            ('personal_info must be an object', changed(personal_info=None)),
+            ('profile_summary must be a string', changed(profile_summary=None)),
+            ('experience[0].responsibilities must be a list of strings',
+             changed(experience=[dict(SAMPLE['experience'][0], responsibilities=None)])),
+            ('experience[0].responsibilities must be a list of strings',
+             changed(experience=[dict(SAMPLE['experience'][0], responsibilities=[1])])),
+        )
+        for message, data in cases:
+            with self.subTest(message):
+                with self.assertRaisesRegex(ResumeValidationError, re.escape(message)):
+                    validate(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""The render service must reject invalid resumes and declare every /metrics family once."""
+import json
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from collections import Counter
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+from resume_service import RenderRequestHandler, RenderService
+
+SAMPLE = Path(__file__).resolve().parent.parent / 'sample_resume_data.json'
+
+
+class MetricsTextTest(unittest.TestCase):
+
+    def setUp(self):
+        self.service = RenderService(workers=1, queue_depth=1)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RenderRequestHandler)
+        self.server.service = self.service
+        self.server.verbose = False
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.service.shutdown()
+
+    def test_type_declarations_are_unique(self):
+        request = urllib.request.Request(f'{self.url}/render', data=SAMPLE.read_bytes(),
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=60) as response:
+            self.assertEqual(response.headers['Content-Type'], 'application/pdf')
+        with urllib.request.urlopen(f'{self.url}/metrics', timeout=10) as response:
+            text = response.read().decode('utf-8')
+
+        types = Counter(line.split()[2] for line in text.splitlines() if line.startswith('# TYPE '))
+        helps = Counter(line.split()[2] for line in text.splitlines() if line.startswith('# HELP '))
+        self.assertIn('resume_render_seconds', types)
+        self.assertIn('resume_request_seconds', types)
+        self.assertEqual([name for name, count in types.items() if count > 1], [])
+        self.assertEqual([name for name, count in helps.items() if count > 1], [])
+        # Every sample belongs to a declared family
+        for line in text.splitlines():
+            if line and not line.startswith('#'):
+                name = line.split('{')[0].split()[0]
+                family = next((f for f in types if name == f or name.startswith(f + '_')), None)
+                self.assertIsNotNone(family, line)
+
+    def post(self, data):
+        """(status, body text) of POST /render with data as JSON"""
+        request = urllib.request.Request(f'{self.url}/render', data=json.dumps(data).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                return response.status, ''
+        except urllib.error.HTTPError as e:
+            return e.code, e.read().decode('utf-8')
+
+    def test_invalid_resume_is_rejected(self):
+        sample = json.loads(SAMPLE.read_text(encoding='utf-8'))
+        untitled = dict(sample, projects=[dict(sample['projects'][0], title=None)])
+        cases = (
+            ({}, 'personal_info is required'),
+            ({'personal_info': {'name': 'x'}}, 'personal_info.location is required'),
+            (dict(sample, experience=[{'job_title': 'a'}]), 'experience[0].company is required'),
+            (untitled, 'projects[0].title must be a string'),
+            ({'experience': 5}, 'personal_info is required'),
+            (dict(sample, experience=5), 'experience must be a list'),
+        )
+        for data, message in cases:
+            with self.subTest(message):
+                status, body = self.post(data)
+                self.assertEqual(status, 400)
+                self.assertIn(message, body)
+        self.assertNotIn(500, self.service.requests)
+
+if __name__ == '__main__':
+    unittest.main()